@@ -1,7 +1,11 @@
 #!/usr/bin/env python
 from argparse import ArgumentParser, FileType
+import json
+import os
 from pathlib import Path
 import re
+import sys
+import tempfile
 
 import h5py
 import mpi4py.rc
@@ -10,12 +14,15 @@ mpi4py.rc.initialize = False
 
 from pyfr._version import __version__
 from pyfr.backends import BaseBackend, get_backend
+from pyfr.bench import bench, compare, element_cost
+from pyfr.cache import TuningDB
 from pyfr.inifile import Inifile
 from pyfr.mpiutil import get_comm_rank_root, init_mpi
 from pyfr.partitioners import (BasePartitioner, get_partitioner,
                                reconstruct_partitioning, write_partitioning)
 from pyfr.plugins import BaseCLIPlugin
-from pyfr.progress import ProgressBar, ProgressSequenceAction
+from pyfr.progress import (NullProgressSequence, ProgressBar,
+                           ProgressSequenceAction)
 from pyfr.readers import BaseReader, get_reader_by_name, get_reader_by_extn
 from pyfr.readers.native import NativeReader
 from pyfr.readers.stl import read_stl
@@ -49,6 +56,9 @@ def main():
                            help='linearisation tolerance')
     ap_import.set_defaults(process=process_import)
 
+    # Available backends
+    backends = sorted(cls.name for cls in subclasses(BaseBackend))
+
     # Partition subcommand
     ap_partition = sp.add_parser('partition', help='partition --help')
     ap_partition = ap_partition.add_subparsers()
@@ -92,8 +102,31 @@ def main():
         '--popt', dest='popts', action='append', default=[],
         metavar='key:value', help='partitioner-specific option'
     )
+    ap_partition_add.add_argument(
+        '-r', '--reorder', action='store_true',
+        help='order elements within each partition for locality'
+    )
     ap_partition_add.set_defaults(process=process_partition_add)
 
+    # Calibrate partitioning element weights
+    ap_partition_calibrate = ap_partition.add_parser(
+        'calibrate', help='partition calibrate --help'
+    )
+    ap_partition_calibrate.add_argument('mesh', help='input mesh file')
+    ap_partition_calibrate.add_argument('cfg', type=FileType('r'),
+                                        help='config file')
+    ap_partition_calibrate.add_argument('-b', '--backend', choices=backends,
+                                        required=True, help='backend to use')
+    ap_partition_calibrate.add_argument(
+        '-n', '--neles', type=int, default=4096,
+        help='approximate number of elements to time for each type'
+    )
+    ap_partition_calibrate.add_argument(
+        '--nrhs', type=int, default=20,
+        help='number of right hand side evaluations'
+    )
+    ap_partition_calibrate.set_defaults(process=process_partition_calibrate)
+
     # Reconstruct partitioning
     ap_partition_reconstruct = ap_partition.add_parser(
         'reconstruct', help='partition reconstruct --help'
@@ -104,6 +137,10 @@ def main():
     ap_partition_reconstruct.add_argument(
         '-f', '--force', action='count', help='overwrite existing partitioning'
     )
+    ap_partition_reconstruct.add_argument(
+        '-r', '--reorder', action='store_true',
+        help='order elements within each partition for locality'
+    )
     ap_partition_reconstruct.set_defaults(
         process=process_partition_reconstruct
     )
@@ -182,6 +219,26 @@ def main():
     ap_region_remove.add_argument('name', help='region name')
     ap_region_remove.set_defaults(process=process_region_remove)
 
+    # Tuning subcommand
+    ap_tuning = sp.add_parser('tuning', help='tuning --help')
+    ap_tuning = ap_tuning.add_subparsers()
+
+    # List tuning results
+    ap_tuning_list = ap_tuning.add_parser('list', help='tuning list --help')
+    ap_tuning_list.add_argument('-s', '--sep', default='\t', help='separator')
+    ap_tuning_list.set_defaults(process=process_tuning_list)
+
+    # Export tuning results
+    ap_tuning_export = ap_tuning.add_parser('export',
+                                            help='tuning export --help')
+    ap_tuning_export.add_argument('-o', '--output', type=FileType('w'),
+                                  default='-', help='output file')
+    ap_tuning_export.set_defaults(process=process_tuning_export)
+
+    # Clear tuning results
+    ap_tuning_clear = ap_tuning.add_parser('clear', help='tuning clear --help')
+    ap_tuning_clear.set_defaults(process=process_tuning_clear)
+
     # Run command
     ap_run = sp.add_parser('run', help='run --help')
     ap_run.add_argument('mesh', help='mesh file')
@@ -196,13 +253,52 @@ def main():
                             help='new config file')
     ap_restart.set_defaults(process=process_restart)
 
-    # Options common to run and restart
-    backends = sorted(cls.name for cls in subclasses(BaseBackend))
-    for p in [ap_run, ap_restart]:
+    # Warmup command
+    ap_warmup = sp.add_parser('warmup', help='warmup --help')
+    ap_warmup.add_argument('mesh', help='mesh file')
+    ap_warmup.add_argument('cfg', type=FileType('r'), help='config file')
+    ap_warmup.add_argument('-j', '--jobs', type=int,
+                           help='number of concurrent compilations')
+    ap_warmup.set_defaults(process=process_warmup)
+
+    # Options common to run, restart, and warmup
+    for p in [ap_run, ap_restart, ap_warmup]:
         p.add_argument('-b', '--backend', choices=backends, required=True,
                        help='backend to use')
         p.add_argument('-p', '--pname', help='partitioning to use')
 
+    # Bench command
+    ap_bench = sp.add_parser('bench', help='bench --help')
+    ap_bench.add_argument('-b', '--backend', choices=backends,
+                          default='openmp', help='backend to use')
+    ap_bench.add_argument('-s', '--system', nargs='+', default=['euler'],
+                          choices=['euler', 'navier-stokes'],
+                          help='systems to benchmark')
+    ap_bench.add_argument('-e', '--etype', nargs='+', default=['hex'],
+                          choices=['hex', 'pri', 'tet'],
+                          help='element types to benchmark')
+    ap_bench.add_argument('-k', '--order', nargs='+', type=int, default=[3],
+                          help='polynomial orders to benchmark')
+    ap_bench.add_argument('-n', type=int, default=8,
+                          help='number of cubes along each edge of the mesh')
+    ap_bench.add_argument('--precision', choices=['single', 'double'],
+                          default='double', help='precision to use')
+    ap_bench.add_argument('--nrhs', type=int, default=20,
+                          help='number of right hand side evaluations')
+    ap_bench.add_argument('--nsteps', type=int, default=5,
+                          help='number of time steps')
+    ap_bench.add_argument('--cold', action='store_true',
+                          help='start with an empty kernel cache')
+    ap_bench.add_argument('--profile', action='store_true',
+                          help='record the run time of each kernel')
+    ap_bench.add_argument('--reorder', action='store_true',
+                          help='order elements for locality')
+    ap_bench.add_argument('--compare', type=FileType('r'),
+                          help='results from a previous run to compare with')
+    ap_bench.add_argument('-o', '--output', type=FileType('w'), default='-',
+                          help='output file')
+    ap_bench.set_defaults(process=process_bench)
+
     # Plugin commands
     for scls in subclasses(BaseCLIPlugin, just_leaf=True):
         scls.add_cli(sp.add_parser(scls.name, help=f'{scls.name} --help'))
@@ -252,7 +348,15 @@ def process_partition_info(args):
 
 
 def process_partition_add(args):
-    with h5py.File(args.mesh, 'r+') as mesh:
+    # Manually initialise MPI
+    init_mpi()
+
+    comm, rank, root = get_comm_rank_root()
+
+    # Only display progress information on the root rank
+    progress = args.progress if rank == root else NullProgressSequence()
+
+    with h5py.File(args.mesh, 'r' if comm.size > 1 else 'r+') as mesh:
         # Determine the element types
         etypes = list(mesh['eles'])
 
@@ -262,11 +366,17 @@ def process_partition_add(args):
         else:
             pwts = [1]*int(args.np)
 
+        # Calibrated element weights
+        calwts = mesh['partitionings'].attrs.get('elewts', [])
+        calwts = {e.decode(): int(w) for e, w in calwts}
+
         # Element weights
         if args.elewts == ['balanced']:
             ewts = None
         elif len(etypes) == 1:
             ewts = {etypes[0]: 1}
+        elif not args.elewts and calwts:
+            ewts = calwts
         else:
             ewts = (ew.split(':') for ew in args.elewts)
             ewts = {e: int(w) for e, w in ewts}
@@ -290,24 +400,77 @@ def process_partition_add(args):
 
         # Create the partitioner
         if args.partitioner:
-            part = get_partitioner(args.partitioner, pwts, ewts, opts=opts)
+            part = get_partitioner(args.partitioner, pwts, ewts,
+                                   reorder=args.reorder, opts=opts)
         else:
-            parts = sorted(cls.name for cls in subclasses(BasePartitioner))
-            for name in parts:
+            # Prefer graph partitioners over space-filling curves
+            parts = [cls for cls in subclasses(BasePartitioner)
+                     if cls.has_mpi or comm.size == 1]
+            parts.sort(key=lambda cls: (cls.name == 'hilbert', cls.name))
+
+            for cls in parts:
                 try:
-                    part = get_partitioner(name, pwts, ewts)
+                    part = get_partitioner(cls.name, pwts, ewts,
+                                           reorder=args.reorder)
                     break
                 except OSError:
                     pass
             else:
                 raise RuntimeError('No partitioners available')
 
+        if comm.size > 1 and not part.has_mpi:
+            raise RuntimeError(f'Partitioner {part.name} does not support '
+                               'running under MPI')
+
         # Partition the mesh
-        pinfo = part.partition(mesh, args.progress)
+        pinfo = part.partition(mesh, progress)
 
         # Write out the new partitioning
-        with args.progress.start('Write partitioning'):
-            write_partitioning(mesh, pname, pinfo)
+        if comm.size == 1:
+            with progress.start('Write partitioning'):
+                write_partitioning(mesh, pname, pinfo)
+
+    # When running in parallel have the root rank write the partitioning
+    if comm.size > 1:
+        comm.barrier()
+
+        if rank == root:
+            with (h5py.File(args.mesh, 'r+') as mesh,
+                  progress.start('Write partitioning')):
+                write_partitioning(mesh, pname, pinfo)
+
+
+def process_partition_calibrate(args):
+    # Manually initialise MPI
+    init_mpi()
+
+    comm, rank, root = get_comm_rank_root()
+    if comm.size != 1:
+        raise RuntimeError('Calibration must be run on a single rank')
+
+    cfg = Inifile.load(args.cfg)
+
+    with h5py.File(args.mesh, 'r+') as mesh:
+        etypes = sorted(mesh['eles'])
+
+        # Time the right hand side for each element type
+        costs = {}
+        for etype in etypes:
+            with args.progress.start(f'Calibrate {etype}'):
+                costs[etype] = element_cost(args.backend, cfg, etype,
+                                            args.neles, nrhs=args.nrhs)
+
+        # Convert these into integer weights
+        cmin = min(costs.values())
+        ewts = [(e, round(10*c / cmin)) for e, c in costs.items()]
+
+        # Save them in the mesh
+        mesh['partitionings'].attrs['elewts'] = np.array(
+            ewts, dtype=[('etype', 'S4'), ('weight', np.int64)]
+        )
+
+    for e, w in ewts:
+        print(f'{e}:{w}')
 
 
 def process_partition_reconstruct(args):
@@ -322,7 +485,8 @@ def process_partition_reconstruct(args):
             raise ValueError('Partitioning already exists; use -f to replace')
 
         # Reconstruct the partitioning used in the solution
-        pinfo = reconstruct_partitioning(mesh, soln, args.progress)
+        pinfo = reconstruct_partitioning(mesh, soln, args.progress,
+                                         args.reorder)
 
         # Write out the new partitioning
         with args.progress.start('Write partitioning'):
@@ -381,6 +545,29 @@ def process_region_remove(args):
         del rparts[args.name]
 
 
+def process_tuning_list(args):
+    print('device', 'kind', 'dtype', 'shape', 'result', sep=args.sep)
+
+    for rec in TuningDB().records():
+        desc, res = rec['desc'], rec['result']
+        shape = 'x'.join(str(desc[k]) for k in 'mkn')
+
+        if isinstance(res, dict):
+            res = ' '.join(f'{k}={v}' for k, v in res.items())
+
+        print(rec['device'], rec['kind'], desc['dtype'], shape, res,
+              sep=args.sep)
+
+
+def process_tuning_export(args):
+    json.dump(list(TuningDB().records()), args.output, indent=2)
+    args.output.write('\n')
+
+
+def process_tuning_clear(args):
+    print(f'Removed {TuningDB().clear()} entries')
+
+
 def process_export(args):
     # Manually initialise MPI
     init_mpi()
@@ -454,5 +641,59 @@ def process_restart(args):
     _process_common(args, args.soln, cfg)
 
 
+def process_warmup(args):
+    # Manually initialise MPI
+    init_mpi()
+
+    # Read the mesh and config
+    mesh = NativeReader(args.mesh, pname=args.pname).mesh
+    cfg = Inifile.load(args.cfg)
+
+    # Solution plugins may produce output so remove them
+    for s in cfg.sections():
+        if s.startswith('soln-plugin-'):
+            cfg.remove_section(s)
+
+    # Create a backend
+    backend = get_backend(args.backend, cfg)
+
+    # Construct the solver and build its kernels; with deferred
+    # compilation the kernels are placeholders which do nothing
+    with backend.deferred_compilation(args.jobs):
+        solver = get_solver(backend, mesh, None, cfg)
+        solver.warmup()
+
+
+def process_bench(args):
+    # Manually initialise MPI
+    init_mpi()
+
+    comm, rank, root = get_comm_rank_root()
+    if comm.size != 1:
+        raise RuntimeError('Benchmarks must be run on a single rank')
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # Point the kernel caches at an empty directory
+        if args.cold:
+            for c in ['cuda', 'hip', 'ocl', 'omp', 'tuning']:
+                os.environ[f'PYFR_{c.upper()}_CACHE_DIR'] = f'{tmpdir}/{c}'
+
+        results = bench(args.backend, args.system, args.etype, args.order,
+                        args.n, precision=args.precision, nrhs=args.nrhs,
+                        nsteps=args.nsteps, profile=args.profile,
+                        reorder=args.reorder)
+
+    json.dump(results, args.output, indent=2)
+    args.output.write('\n')
+
+    # Compare against a previous set of results
+    if args.compare:
+        for case, ratios in compare(json.load(args.compare), results):
+            print(*case, file=sys.stderr)
+
+            for k, v in ratios.items():
+                print(f'    {k}: {v:.3f}', file=sys.stderr)
+
+
 if __name__ == '__main__':
     main()
@@ -1,13 +1,17 @@
 from collections import defaultdict
-from functools import cached_property, wraps
+from contextlib import contextmanager
+from functools import cached_property, partial, wraps
 from itertools import count
 import math
-from weakref import WeakKeyDictionary, WeakValueDictionary
+from weakref import WeakKeyDictionary, WeakSet, WeakValueDictionary
 
 import numpy as np
 
 from pyfr.backends.base.kernels import NotSuitableError
+from pyfr.backends.base.types import MatrixSlice
+from pyfr.cache import TuningDB
 from pyfr.template import DottedTemplateLookup
+from pyfr.util import digest
 
 
 def recordmat(fn):
@@ -25,6 +29,7 @@ def recordmat(fn):
 
 class BaseBackend:
     name = None
+    device_name = None
 
     def __init__(self, cfg):
         self.cfg = cfg
@@ -54,6 +59,10 @@ class BaseBackend:
         self.mats = WeakValueDictionary()
         self._mat_counter = count()
 
+        # Constant matrices indexed by their contents
+        self._const_mats = WeakValueDictionary()
+        self._const_nbytes_saved = 0
+
         # Aliases and extents
         self._pend_aliases = {}
         self._pend_extents = defaultdict(list)
@@ -62,6 +71,9 @@ class BaseBackend:
         # Mapping from backend objects to memory extents
         self._obj_extents = WeakKeyDictionary()
 
+        # Objects which alias the memory of other objects
+        self._alias_objs = WeakSet()
+
     @cached_property
     def lookup(self):
         pkg = f'pyfr.backends.{self.name}.kernels'
@@ -73,6 +85,10 @@ class BaseBackend:
 
         return DottedTemplateLookup(pkg, dfltargs)
 
+    @cached_property
+    def tuning(self):
+        return TuningDB(f'{self.name}: {self.device_name}')
+
     def malloc(self, obj, extent):
         # If no extent has been specified then autocommit
         if extent is None:
@@ -101,8 +117,11 @@ class BaseBackend:
         if obj.nbytes > aobj.nbytes:
             raise ValueError('Object too large to alias')
 
+        self._alias_objs.add(obj)
+
         try:
             obj.onalloc(self._obj_extents[aobj], aobj.offset)
+            self._obj_extents[obj] = self._obj_extents[aobj]
         except KeyError:
             self._pend_aliases[aobj].append(obj)
 
@@ -144,15 +163,17 @@ class BaseBackend:
     @recordmat
     def const_matrix(self, initval, dtype=None, tags=set()):
         dtype = dtype or self.fpdtype
+        initval = np.ascontiguousarray(initval, dtype=dtype)
 
         # See if we have previously allocated an identical matrix
-        for m in self.mats.values():
-            if (isinstance(m, self.const_matrix_cls) and
-                m.dtype == dtype and m.ioshape == initval.shape and
-                tags.issubset(m.tags) and (m.get() == initval).all()):
-                return m
+        ckey = (initval.dtype, initval.shape, frozenset(tags), digest(initval))
+        if (m := self._const_mats.get(ckey)) is not None:
+            self._const_nbytes_saved += m.nbytes
+            return m
 
-        return self.const_matrix_cls(self, dtype, initval, tags)
+        m = self._const_mats[ckey] = self.const_matrix_cls(self, dtype,
+                                                           initval, tags)
+        return m
 
     @recordmat
     def matrix(self, ioshape, initval=None, extent=None, aliases=None,
@@ -184,12 +205,24 @@ class BaseBackend:
                                   vshape, tags)
 
     def kernel(self, name, *args, **kwargs):
-        best_kern = None
+        best_kern = best_prov = None
+
+        # See if a previous run has determined the fastest provider
+        if (tdesc := self._tuning_desc(name, *args, **kwargs)):
+            tprov = self.tuning.get(name, tdesc)
+
+            for prov in self._providers:
+                if type(prov).__name__ == tprov:
+                    try:
+                        kern_meth = self._kernel_meth(prov, name, tdesc)
+                        return kern_meth(*args, **kwargs)
+                    except NotSuitableError:
+                        break
 
         # Loop through each kernel provider instance
         for prov in self._providers:
             # See if it can potentially provide the requested kernel
-            kern_meth = getattr(prov, name, None)
+            kern_meth = self._kernel_meth(prov, name, tdesc)
             if kern_meth:
                 try:
                     # Ask the provider for the kernel
@@ -199,7 +232,7 @@ class BaseBackend:
 
                 # Evaluate this kernel compared to the best seen so far
                 if best_kern is None or kern.dt < best_kern.dt:
-                    best_kern = kern
+                    best_kern, best_prov = kern, prov
 
                     # If there is no benchmark data then short circut
                     if np.isnan(best_kern.dt):
@@ -208,13 +241,73 @@ class BaseBackend:
         if best_kern is None:
             raise KeyError(f'Kernel "{name}" has no providers')
 
+        # Record the fastest provider for subsequent runs
+        if tdesc:
+            self.tuning.set(name, tdesc, type(best_prov).__name__)
+
         return best_kern
 
+    def _kernel_meth(self, prov, name, tdesc):
+        kern_meth = getattr(prov, name, None)
+
+        # Pass our tuning descriptor on to any providers which want it
+        if kern_meth and name in prov.tuned_kernels:
+            kern_meth = partial(kern_meth, tdesc=tdesc)
+
+        return kern_meth
+
+    def _tuning_desc(self, name, *args, **kwargs):
+        if name == 'mul' and self.tuning.cache.enabled:
+            return self.mul_tuning_desc(*args, **kwargs)
+
+    def mul_tuning_desc(self, a, b, out, alpha=1.0, beta=0.0):
+        return {
+            'dtype': np.dtype(self.fpdtype).name,
+            'a': digest(a.get()) if 'const' in a.tags else None,
+            'm': a.nrow, 'k': a.ncol, 'n': b.ncol, 'ldb': b.leaddim,
+            'ldc': out.leaddim, 'nblocks': b.nblocks,
+            'aligned': 'align' in b.tags and 'align' in out.tags,
+            'alpha': float(alpha), 'beta': float(beta)
+        }
+
     def ordered_meta_kernel(self, kerns):
         return self.ordered_meta_kernel_cls(kerns)
 
     def unordered_meta_kernel(self, kerns, splits=None):
         return self.unordered_meta_kernel_cls(kerns, splits)
 
+    @contextmanager
+    def deferred_compilation(self, njobs=None):
+        yield
+
+    def _owned_mats(self, mats):
+        # Skip slices and aliases, as their memory belongs to another matrix
+        for m in mats:
+            if (m is not None and not isinstance(m, MatrixSlice) and
+                m not in self._alias_objs):
+                yield m
+
+    def memory_usage(self):
+        usage = defaultdict(int, {'const-dedup-saved':
+                                  self._const_nbytes_saved})
+
+        # Tally up the size of the live matrices which own their memory;
+        # since a matrix can have several tags the tag totals overlap
+        for m in self._owned_mats(self.mats.values()):
+            usage['total'] += m.nbytes
+
+            for t in m.tags or ['untagged']:
+                usage[f'tag-{t}'] += m.nbytes
+
+        return dict(usage)
+
+    def owned_nbytes(self, mids):
+        mats = self._owned_mats(self.mats.get(mid) for mid in mids)
+
+        return sum(m.nbytes for m in mats)
+
+    def kernel_times(self):
+        return {}
+
     def graph(self):
         return self.graph_cls(self)
@@ -56,6 +56,9 @@ class BaseUnorderedMetaKernel(Kernel):
 
 
 class BaseKernelProvider:
+    # Kernels which accept a tuning descriptor
+    tuned_kernels = set()
+
     def __init__(self, backend):
         self.backend = backend
 
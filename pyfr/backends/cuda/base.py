@@ -46,6 +46,10 @@ class CUDABackend(BaseBackend):
         else:
             self.cuda.set_device(int(devid))
 
+        # Identify the device
+        major, minor = self.cuda.compute_capability()
+        self.device_name = f'{self.cuda.device_name()} (sm_{major}{minor})'
+
         # CUDA Compiler
         self.compiler = CUDACompiler(self.cuda)
 
@@ -91,6 +91,8 @@ class CUDABlasExtKernels(CUDAKernelProvider):
             argt = [ixdtype]*3 + [np.uintp]*4 + [fpdtype]*2
         elif method == 'resid' and dt_mat:
             argt = [ixdtype]*3 + [np.uintp]*4 + [fpdtype]
+        elif method == 'nonfinite':
+            argt = [ixdtype]*3 + [np.uintp]*2
         else:
             argt = [ixdtype]*3 + [np.uintp]*3 + [fpdtype]
 
@@ -102,7 +104,7 @@ class CUDABlasExtKernels(CUDAKernelProvider):
         params.set_args(nrow, ncolb, ldim, reduced_dev, *regs)
 
         # Runtime argument offset
-        facoff = argt.index(fpdtype)
+        facoff = argt.index(fpdtype) if fpdtype in argt else None
 
         # Norm type
         reducer = np.max if norm == 'uniform' else np.sum
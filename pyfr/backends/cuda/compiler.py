@@ -117,9 +117,13 @@ class CUDACompiler:
 
         code = self.cache.get_bytes(ckey)
         if code is None:
-            code = self.nvrtc.compile(name, src, flags)
+            # Ensure only one process compiles any given kernel
+            with self.cache.lock(ckey):
+                code = self.cache.get_bytes(ckey)
+                if code is None:
+                    code = self.nvrtc.compile(name, src, flags)
 
-            self.cache.set_with_bytes(ckey, code)
+                    self.cache.set_with_bytes(ckey, code)
 
         return code
 
@@ -4,7 +4,11 @@
 __global__ void
 reduction(ixdtype_t nrow, ixdtype_t ncolb, ixdtype_t ldim,
           fpdtype_t *__restrict__ reduced,
+% if method == 'nonfinite':
+          fpdtype_t *__restrict__ rcurr)
+% else:
           fpdtype_t *__restrict__ rcurr, fpdtype_t *__restrict__ rold,
+% endif
 % if method == 'errest':
           fpdtype_t *__restrict__ rerr, fpdtype_t atol, fpdtype_t rtol)
 % elif method == 'resid' and dt_type == 'matrix':
@@ -28,6 +32,8 @@ reduction(ixdtype_t nrow, ixdtype_t ncolb, ixdtype_t ldim,
             r = rerr[idx]/(atol + rtol*max(fabs(rcurr[idx]), fabs(rold[idx])));
         % elif method == 'resid':
             r = (rcurr[idx] - rold[idx])/(dt_fac${'*dt_mat[idx]' if dt_type == 'matrix' else ''});
+        % elif method == 'nonfinite':
+            r = !isfinite(rcurr[idx]);
         % endif
 
         % if norm == 'uniform':
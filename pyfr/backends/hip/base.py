@@ -45,6 +45,10 @@ class HIPBackend(BaseBackend):
         # Get its properties
         self.props = self.hip.device_properties(devid)
 
+        # Identify the device
+        name, arch = self.props['name'], self.props['gcn_arch_name']
+        self.device_name = f'{name} ({arch})'
+
         # Take the required alignment to be 128 bytes
         self.alignb = 128
 
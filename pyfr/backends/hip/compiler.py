@@ -107,9 +107,13 @@ class HIPCompiler:
 
         code = self.cache.get_bytes(ckey)
         if code is None:
-            code = self.hiprtc.compile(name, src, flags)
+            # Ensure only one process compiles any given kernel
+            with self.cache.lock(ckey):
+                code = self.cache.get_bytes(ckey)
+                if code is None:
+                    code = self.hiprtc.compile(name, src, flags)
 
-            self.cache.set_with_bytes(ckey, code)
+                    self.cache.set_with_bytes(ckey, code)
 
         return code
 
@@ -15,6 +15,7 @@ class MetalBackend(BaseBackend):
 
         # Get the default device
         self.dev = MTLCreateSystemDefaultDevice()
+        self.device_name = str(self.dev.name())
 
         # Metal does not support double precision arithmetic
         if self.fpdtype == np.float64:
@@ -89,6 +89,8 @@ class MetalBlasExtKernels(MetalKernelProvider):
             argt = [ixdtype]*3 + [np.uintp]*4 + [fpdtype]*2
         elif method == 'resid' and dt_mat:
             argt = [ixdtype]*3 + [np.uintp]*4 + [fpdtype]
+        elif method == 'nonfinite':
+            argt = [ixdtype]*3 + [np.uintp]*2
         else:
             argt = [ixdtype]*3 + [np.uintp]*3 + [fpdtype]
 
@@ -96,8 +98,8 @@ class MetalBlasExtKernels(MetalKernelProvider):
         rkern = self._build_kernel('reduction', src, argt)
 
         # Runtime argument offset
-        facoff = argt.index(fpdtype)
-        nfacs = 2 if method == 'errest' else 1
+        facoff = argt.index(fpdtype) if fpdtype in argt else None
+        nfacs = {'errest': 2, 'nonfinite': 0}.get(method, 1)
 
         # Kernel arguments
         kargs = [nrow, ncolb, ldim, (reduced_dev, 0)]
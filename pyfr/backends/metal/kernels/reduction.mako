@@ -4,7 +4,11 @@
 kernel void
 reduction(constant ixdtype_t& nrow, constant ixdtype_t& ncolb,
           device const ixdtype_t& ldim, device fpdtype_t* reduced,
+% if method == 'nonfinite':
+          device const fpdtype_t* rcurr,
+% else:
           device const fpdtype_t* rcurr, device const fpdtype_t* rold,
+% endif
 % if method == 'errest':
           device const fpdtype_t* rerr,
           constant fpdtype_t& atol, constant fpdtype_t& rtol,
@@ -35,6 +39,9 @@ reduction(constant ixdtype_t& nrow, constant ixdtype_t& ncolb,
             r = rerr[idx]/(atol + rtol*max(fabs(rcurr[idx]), fabs(rold[idx])));
         % elif method == 'resid':
             r = (rcurr[idx] - rold[idx])/(dt_fac${'*dt_mat[idx]' if dt_type == 'matrix' else ''});
+        % elif method == 'nonfinite':
+            // Test the exponent bits directly as fast maths breaks isfinite
+            r = (as_type<uint>(rcurr[idx]) & 0x7f800000U) == 0x7f800000U;
         % endif
 
         % if norm == 'uniform':
@@ -47,6 +47,7 @@ class OpenCLBackend(BaseBackend):
 
         # Set the device
         self.cl.set_device(device)
+        self.device_name = f'{device.name} ({device.driver_version})'
 
         # OpenCL compiler
         self.compiler = OpenCLCompiler(self.cl)
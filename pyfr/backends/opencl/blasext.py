@@ -80,6 +80,8 @@ class OpenCLBlasExtKernels(OpenCLKernelProvider):
             argt = [ixdtype]*3 + [np.uintp]*4 + [fpdtype]*2
         elif method == 'resid' and dt_mat:
             argt = [ixdtype]*3 + [np.uintp]*4 + [fpdtype]
+        elif method == 'nonfinite':
+            argt = [ixdtype]*3 + [np.uintp]*2
         else:
             argt = [ixdtype]*3 + [np.uintp]*3 + [fpdtype]
 
@@ -92,7 +94,7 @@ class OpenCLBlasExtKernels(OpenCLKernelProvider):
         reducer = np.max if norm == 'uniform' else np.sum
 
         # Runtime argument offset
-        facoff = argt.index(fpdtype)
+        facoff = argt.index(fpdtype) if fpdtype in argt else None
 
         class ReductionKernel(OpenCLKernel):
             @property
@@ -12,10 +12,15 @@ class OpenCLCompiler:
         ckey = digest(*self.dev_key, src, flags)
 
         if bin := self.cache.get_bytes(ckey):
-            program = self.cl.program(bin)
-        else:
-            program = self.cl.program(src, flags)
+            return self.cl.program(bin)
 
-            self.cache.set_with_bytes(ckey, program.get_binary())
+        # Ensure only one process compiles any given kernel
+        with self.cache.lock(ckey):
+            if bin := self.cache.get_bytes(ckey):
+                program = self.cl.program(bin)
+            else:
+                program = self.cl.program(src, flags)
+
+                self.cache.set_with_bytes(ckey, program.get_binary())
 
         return program
@@ -4,8 +4,12 @@
 __kernel void
 reduction(ixdtype_t nrow, ixdtype_t ncolb, ixdtype_t ldim,
           __global fpdtype_t* restrict reduced,
+% if method == 'nonfinite':
+          __global const fpdtype_t* restrict rcurr)
+% else:
           __global const fpdtype_t* restrict rcurr,
           __global const fpdtype_t* restrict rold,
+% endif
 % if method == 'errest':
           __global const fpdtype_t* restrict rerr, fpdtype_t atol, fpdtype_t rtol)
 % elif method == 'resid' and dt_type == 'matrix':
@@ -29,6 +33,11 @@ reduction(ixdtype_t nrow, ixdtype_t ncolb, ixdtype_t ldim,
             r = rerr[idx]/(atol + rtol*max(fabs(rcurr[idx]), fabs(rold[idx])));
         % elif method == 'resid':
             r = (rcurr[idx] - rold[idx])/(dt_fac${'*dt_mat[idx]' if dt_type == 'matrix' else ''});
+        % elif method == 'nonfinite' and pyfr.npdtype_to_ctype(fpdtype) == 'double':
+            // Test the exponent bits directly as relaxed maths breaks isfinite
+            r = (as_ulong(rcurr[idx]) & 0x7ff0000000000000UL) == 0x7ff0000000000000UL;
+        % elif method == 'nonfinite':
+            r = (as_uint(rcurr[idx]) & 0x7f800000U) == 0x7f800000U;
         % endif
 
         % if norm == 'uniform':
@@ -1,6 +1,11 @@
+from collections import defaultdict
+from contextlib import contextmanager
 from ctypes import c_int, c_void_p
 from functools import cached_property
+import os
+import platform
 import re
+from weakref import WeakSet
 
 import numpy as np
 
@@ -31,11 +36,18 @@ class OpenMPBackend(BaseBackend):
 
         self.schedule = f'schedule({sched})'
 
+        # Kernel profiling
+        self.profile_kernels = cfg.getbool('backend', 'profile-kernels', False)
+        self._kprof_graphs = WeakSet()
+
+        # Kernel times from profiled graphs which have since been freed
+        self._kprof_times = defaultdict(float)
+
         # C source compiler
         self.compiler = OpenMPCompiler(cfg)
 
-        from pyfr.backends.openmp import (blasext, packing, provider, types,
-                                          xsmm)
+        from pyfr.backends.openmp import (blasext, gimmik, packing, provider,
+                                          types, xsmm)
 
         # Register our data types and meta kernels
         self.const_matrix_cls = types.OpenMPConstMatrix
@@ -52,9 +64,15 @@ class OpenMPBackend(BaseBackend):
         kprovcls = [provider.OpenMPPointwiseKernelProvider,
                     blasext.OpenMPBlasExtKernels,
                     packing.OpenMPPackingKernels,
-                    xsmm.OpenMPXSMMKernels]
+                    gimmik.OpenMPGiMMiKKernels]
         self._providers = [k(self) for k in kprovcls]
 
+        # Load libxsmm if available
+        try:
+            self._providers.append(xsmm.OpenMPXSMMKernels(self))
+        except OSError:
+            pass
+
         # Pointwise kernels
         self.pointwise = self._providers[0]
 
@@ -75,12 +93,56 @@ class OpenMPBackend(BaseBackend):
 
         return lookup
 
+    @cached_property
+    def device_name(self):
+        # Processor model
+        try:
+            with open('/proc/cpuinfo') as f:
+                cpu = re.search(r'^model name\s*:\s*(.+)$', f.read(), re.M)[1]
+        except (OSError, TypeError):
+            cpu = platform.processor() or platform.machine()
+
+        # Number of OpenMP threads
+        if not (nthreads := os.environ.get('OMP_NUM_THREADS')):
+            try:
+                nthreads = len(os.sched_getaffinity(0))
+            except AttributeError:
+                nthreads = os.cpu_count()
+
+        return f'{cpu} ({nthreads} threads)'
+
     @cached_property
     def krunner(self):
-        ksrc = self.lookup.get_template('run-kernels').render()
+        ksrc = self.lookup.get_template('run-kernels').render(profile=False)
         klib = self.compiler.build(ksrc)
         return klib.function('run_kernels', None, [c_int, c_void_p])
 
+    @cached_property
+    def krunner_prof(self):
+        ksrc = self.lookup.get_template('run-kernels').render(profile=True)
+        klib = self.compiler.build(ksrc)
+        return klib.function('run_kernels', None, [c_int, c_void_p, c_void_p])
+
+    @contextmanager
+    def deferred_compilation(self, njobs=None):
+        # Placeholder kernels can not be meaningfully benchmarked
+        self.tuning.readonly = True
+
+        try:
+            with self.compiler.deferred(njobs):
+                yield
+        finally:
+            self.tuning.readonly = False
+
+    def kernel_times(self):
+        ktimes = defaultdict(float, self._kprof_times)
+
+        for g in self._kprof_graphs:
+            for k, t in g.get_kernel_times().items():
+                ktimes[k] += t
+
+        return dict(ktimes)
+
     def _malloc_impl(self, nbytes):
         data = np.zeros(nbytes + self.alignb, dtype=np.uint8)
         offset = -data.ctypes.data % self.alignb
@@ -78,6 +78,8 @@ class OpenMPBlasExtKernels(OpenMPKernelProvider):
             argt = [ixdtype]*2 + [np.uintp]*4 + [fpdtype]*2
         elif method == 'resid' and dt_mat:
             argt = [ixdtype]*2 + [np.uintp]*4 + [fpdtype]
+        elif method == 'nonfinite':
+            argt = [ixdtype]*2 + [np.uintp]*2
         else:
             argt = [ixdtype]*2 + [np.uintp]*3 + [fpdtype]
 
@@ -86,7 +88,7 @@ class OpenMPBlasExtKernels(OpenMPKernelProvider):
         rkern.set_args(nrow, nblocks, reduced.ctypes.data, *regs)
 
         # Runtime argument offset
-        facoff = argt.index(fpdtype)
+        facoff = argt.index(fpdtype) if fpdtype in argt else None
 
         class ReductionKernel(OpenMPKernel):
             @property
@@ -1,3 +1,4 @@
+from contextlib import ExitStack, contextmanager
 from ctypes import CDLL
 import itertools as it
 import os
@@ -6,7 +7,7 @@ import platform
 import shlex
 import tempfile
 
-from pytools.prefork import call_capture_output
+from pytools.prefork import ExecError, call_async, call_capture_output, wait
 
 from pyfr.cache import ObjectCache
 from pyfr.ctypesutil import platform_libname
@@ -35,6 +36,9 @@ class OpenMPCompiler:
         # Get the cache
         self.cache = ObjectCache('omp')
 
+        # Sources whose compilation has been deferred
+        self._deferred = None
+
     def build(self, src):
         # Compute a digest of the current processor, compiler, and source
         ckey = digest(self.proc, self.version, self.cmd, src)
@@ -42,30 +46,112 @@ class OpenMPCompiler:
         # Attempt to load the library from the cache
         mod = self._cache_loadlib(ckey)
 
+        # If compilation is being deferred then return a placeholder
+        if mod is None and self._deferred is not None:
+            self._deferred[ckey] = src
+            return OpenMPNullCompilerModule(self._nulllib)
         # Otherwise, we need to compile the kernel
-        if mod is None:
-            # Create a scratch directory
-            tmpidx = next(self._dir_seq)
-            tmpdir = Path(tempfile.mkdtemp(prefix=f'pyfr-{tmpidx}-'))
+        elif mod is None:
+            # Ensure only one process compiles any given kernel
+            with self.cache.lock(platform_libname(ckey)):
+                # See if another process compiled it while we were waiting
+                mod = self._cache_loadlib(ckey) or self._compile(ckey, src)
+
+        return OpenMPCompilerModule(mod)
+
+    @contextmanager
+    def deferred(self, njobs=None):
+        # Without a cache there is nowhere to put the compiled kernels
+        if not self.cache.enabled:
+            yield
+            return
+
+        # Library whose no-op function stands in for all kernels
+        self._nulllib = self.build('void pyfr_noop(void) {}').mod
+        self._deferred = {}
+
+        try:
+            yield
+        finally:
+            deferred, self._deferred = self._deferred, None
+
+            # Compile the sources in parallel, even if an exception was
+            # raised; sorting them ensures that cache locks are always
+            # acquired in a consistent order
+            deferred = sorted(deferred.items())
+            njobs = njobs or os.cpu_count()
 
+            for i in range(0, len(deferred), njobs):
+                self._compile_batch(deferred[i:i + njobs])
+
+    def _compile_batch(self, items):
+        jobs = []
+
+        with ExitStack() as stack:
             try:
-                # Temporary source and library names
-                cname, lname = 'tmp.c', platform_libname('tmp')
+                # Launch the compiler for each kernel not already cached
+                for ckey, src in items:
+                    lkey = platform_libname(ckey)
+                    stack.enter_context(self.cache.lock(lkey))
 
-                # Write the source code out
-                (tmpdir / cname).write_bytes(src.encode())
+                    if not self.cache.get_path(lkey).exists():
+                        tmpdir = self._write_scratch(src)
+                        stack.callback(self._rm_scratch, tmpdir)
 
-                # Invoke the compiler
-                call_capture_output(self.cc_cmd(cname, lname), cwd=tmpdir)
+                        # Capture the output of the compiler in a log file
+                        cmd = self.cc_cmd('tmp.c', platform_libname('tmp'))
+                        scmd = ['sh', '-c', '"$@" > tmp.log 2>&1', 'sh', *cmd]
 
-                # Add it to the cache and load it
-                mod = self._cache_set_and_loadlib(ckey, tmpdir / lname)
+                        jobs.append((lkey, tmpdir, cmd,
+                                     call_async(scmd, tmpdir)))
             finally:
-                # Unless we're debugging delete the scratch directory
-                if 'PYFR_DEBUG_OMP_KEEP_LIBS' not in os.environ:
-                    rm(tmpdir)
-
-        return OpenMPCompilerModule(mod)
+                # Wait for every compiler to finish before our scratch
+                # directories are removed, even if one failed to launch
+                status = [wait(aid) for *_, aid in jobs]
+
+            # Add the libraries to the cache, noting any failures
+            errors = []
+            for (lkey, tmpdir, cmd, aid), rc in zip(jobs, status):
+                if rc:
+                    log = (tmpdir / 'tmp.log').read_text('utf-8', 'replace')
+                    errors.append(f"status {rc} invoking '{' '.join(cmd)}': "
+                                  f'{log}')
+                else:
+                    lpath = tmpdir / platform_libname('tmp')
+                    self.cache.set_with_path(lkey, lpath)
+
+            if errors:
+                raise ExecError(errors[0])
+
+    def _write_scratch(self, src):
+        # Create a scratch directory
+        tmpidx = next(self._dir_seq)
+        tmpdir = Path(tempfile.mkdtemp(prefix=f'pyfr-{tmpidx}-'))
+
+        # Write the source code out
+        (tmpdir / 'tmp.c').write_bytes(src.encode())
+
+        return tmpdir
+
+    def _rm_scratch(self, tmpdir):
+        # Unless we're debugging delete the scratch directory
+        if 'PYFR_DEBUG_OMP_KEEP_LIBS' not in os.environ:
+            rm(tmpdir)
+
+    def _compile(self, ckey, src):
+        tmpdir = self._write_scratch(src)
+
+        try:
+            # Temporary library name
+            lname = platform_libname('tmp')
+
+            # Invoke the compiler
+            call_capture_output(self.cc_cmd('tmp.c', lname), cwd=tmpdir)
+
+            # Add it to the cache and load it
+            return self._cache_set_and_loadlib(ckey, tmpdir / lname)
+        finally:
+            self._rm_scratch(tmpdir)
 
     def cc_cmd(self, srcname, libname):
         cmd = [
@@ -112,3 +198,8 @@ class OpenMPCompilerModule:
             fn.argtypes = argtypes
 
         return fn
+
+
+class OpenMPNullCompilerModule(OpenMPCompilerModule):
+    def function(self, name, restype=None, argtypes=None):
+        return self.mod['pyfr_noop']
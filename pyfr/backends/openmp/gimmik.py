@@ -0,0 +1,128 @@
+from weakref import finalize
+
+from gimmik import CMatMul
+import numpy as np
+
+from pyfr.backends.base import NotSuitableError
+from pyfr.backends.openmp.provider import OpenMPKernel, OpenMPKernelProvider
+
+
+class OpenMPGiMMiKKernels(OpenMPKernelProvider):
+    tuned_kernels = {'mul'}
+
+    def __init__(self, backend):
+        super().__init__(backend)
+
+        # Maximum number of non-zeros for fully unrolled kernels
+        self.max_nnz = backend.cfg.getint('backend-openmp', 'gimmik-max-nnz',
+                                          2048)
+
+        # Maximum number of kernels to consider
+        self.nkerns = backend.cfg.getint('backend-openmp', 'gimmik-nkerns', 8)
+
+        # Number of benchmarking runs
+        self.nbench = backend.cfg.getint('backend-openmp', 'gimmik-nbench', 5)
+
+        # Kernel cache
+        self._mul_kerns = {}
+
+    def _chunk_sizes(self, n):
+        soasz, csubsz = self.backend.soasz, self.backend.csubsz
+
+        return sorted({n, csubsz, soasz}, reverse=True)
+
+    def mul(self, a, b, out, alpha=1.0, beta=0.0, tdesc=None):
+        # Ensure the matrices are compatible
+        if a.nrow != out.nrow or a.ncol != b.nrow or b.ncol != out.ncol:
+            raise ValueError('Incompatible matrices for out = a*b')
+
+        # Check that A is constant
+        if 'const' not in a.tags:
+            raise NotSuitableError('GiMMiK requires a constant a matrix')
+
+        # Check the blocking of B and C is compatible
+        if b.leaddim != out.leaddim or b.nblocks != out.nblocks:
+            raise NotSuitableError('GiMMiK requires compatible blockings')
+
+        # Dimensions
+        ldb, ldc = b.leaddim, out.leaddim
+
+        # Alignment
+        if 'align' in b.tags and 'align' in out.tags:
+            aligne = self.backend.alignb // b.itemsize
+        else:
+            aligne = None
+
+        # Cache key
+        ckey = (a.mid, alpha, beta, aligne, ldb, ldc)
+
+        # Check the kernel cache
+        try:
+            src, kname, dt = self._mul_kerns[ckey]
+        except KeyError:
+            arr = alpha*a.get()
+            m, k = arr.shape
+
+            # Generate fully unrolled kernels for reasonably sparse
+            # matrices, leaving room for the dense kernel
+            sparse = []
+            if np.count_nonzero(arr) <= self.max_nnz:
+                for nchunk in self._chunk_sizes(ldb)[:self.nkerns - 1]:
+                    mm = CMatMul(arr, beta=beta, aligne=aligne, n=nchunk,
+                                 ldb=ldb, ldc=ldc)
+                    ksrc, meta = next(mm.kernels(
+                        a.dtype, kname=f'gimmik_mm_{nchunk}'
+                    ))
+                    sparse.append((nchunk, ksrc))
+
+            # Render the kernels
+            src = self.backend.lookup.get_template('gimmik-mm').render(
+                kname='gimmik_mm', sparse=sparse, A=arr, beta=beta, m=m, k=k,
+                n=ldb, ldb=ldb, ldc=ldc
+            )
+
+            # Candidate kernel names
+            knames = [f'gimmik_mm_sparse_{n}' for n, _ in sparse]
+            knames.append('gimmik_mm_dense')
+
+            # See if a previous run has determined the fastest kernel
+            tkind = type(self).__name__
+            tres = tdesc and self.backend.tuning.get(tkind, tdesc)
+
+            if tres and tres['kname'] in knames:
+                best_kern = src, tres['kname'], tres['dt']
+            else:
+                # Benchmark the kernels
+                best_kern = None
+                with self._mul_bench_operands(b, out):
+                    for kname in knames:
+                        kern = self._build_mul_kernel(kname, src, b, out)
+                        dt = self._benchmark(kern, nbench=self.nbench)
+
+                        if best_kern is None or dt < best_kern[-1]:
+                            best_kern = src, kname, dt
+
+                # Record the fastest kernel for subsequent runs
+                if tdesc:
+                    self.backend.tuning.set(tkind, tdesc,
+                                            {'kname': best_kern[1],
+                                             'dt': best_kern[2]})
+
+            # Update the cache
+            self._mul_kerns[ckey] = src, kname, dt = best_kern
+            finalize(a, lambda: self._mul_kerns.pop(ckey))
+
+        # Build
+        kern = self._build_mul_kernel(kname, src, b, out)
+
+        return OpenMPKernel(mats=[a, b, out], kernel=kern, dt=dt)
+
+    def _build_mul_kernel(self, kname, src, b, out):
+        ixdtype = self.backend.ixdtype
+
+        kern = self._build_kernel(kname, src, [np.uintp, ixdtype]*2,
+                                  ['b', 'bsz', 'out', 'outsz'])
+        kern.set_args(b, b.blocksz, out, out.blocksz)
+        kern.set_nblocks(b.nblocks)
+
+        return kern
@@ -0,0 +1,62 @@
+<%inherit file='base'/>
+
+struct kargs
+{
+    const fpdtype_t *b;
+    ixdtype_t bblocksz;
+    fpdtype_t *c;
+    ixdtype_t cblocksz;
+};
+
+% for nchunk, ksrc in sparse:
+static inline ${ksrc}
+
+void ${kname}_sparse_${nchunk}(int ib, const struct kargs *args, int _disp_mask)
+{
+    const fpdtype_t *b = args->b + ((_disp_mask & 1) ? 0 : ib*args->bblocksz);
+    fpdtype_t *c = args->c + ((_disp_mask & 4) ? 0 : ib*args->cblocksz);
+
+    for (int j = 0; j < ${n}; j += ${nchunk})
+        ${kname}_${nchunk}(b + j, c + j);
+}
+% endfor
+
+static const fpdtype_t ${kname}_a[${m}][${k}] =
+{
+% for row in A:
+    { ${', '.join(repr(float(v)) for v in row)} },
+% endfor
+};
+
+void ${kname}_dense(int ib, const struct kargs *args, int _disp_mask)
+{
+    const fpdtype_t *b = args->b + ((_disp_mask & 1) ? 0 : ib*args->bblocksz);
+    fpdtype_t *c = args->c + ((_disp_mask & 4) ? 0 : ib*args->cblocksz);
+
+    for (int j = 0; j < ${n}; j += SOA_SZ)
+    {
+        for (int i = 0; i < ${m}; i++)
+        {
+            fpdtype_t acc[SOA_SZ] = { 0 };
+
+            for (int l = 0; l < ${k}; l++)
+            {
+                const fpdtype_t a = ${kname}_a[i][l];
+
+                #pragma omp simd
+                for (int jj = 0; jj < SOA_SZ; jj++)
+                    acc[jj] += a*b[l*${ldb} + j + jj];
+            }
+
+            #pragma omp simd
+            for (int jj = 0; jj < SOA_SZ; jj++)
+            % if beta == 0:
+                c[i*${ldc} + j + jj] = acc[jj];
+            % elif beta == 1:
+                c[i*${ldc} + j + jj] += acc[jj];
+            % else:
+                c[i*${ldc} + j + jj] = acc[jj] + ${beta}*c[i*${ldc} + j + jj];
+            % endif
+        }
+    }
+}
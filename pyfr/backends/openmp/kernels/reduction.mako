@@ -1,10 +1,23 @@
 <%inherit file='base'/>
 <%namespace module='pyfr.backends.base.makoutil' name='pyfr'/>
 
+% if method == 'nonfinite':
+<% utype, emask = (('uint64_t', '0x7ff0000000000000')
+                   if pyfr.npdtype_to_ctype(fpdtype) == 'double' else
+                   ('uint32_t', '0x7f800000')) %>
+static inline int nonfinite(fpdtype_t x)
+{
+    // Test the exponent bits directly since -ffast-math breaks isfinite
+    union { fpdtype_t f; ${utype} u; } b = { .f = x };
+
+    return (b.u & ${emask}) == ${emask};
+}
+
+% endif
 struct kargs
 {
     ixdtype_t nrow, nblocks;
-    fpdtype_t *reduced, *rcurr, *rold;
+    fpdtype_t *reduced, *rcurr${'' if method == 'nonfinite' else ', *rold'};
 % if method == 'errest':
     fpdtype_t *rerr, atol, rtol;
 % elif method == 'resid' and dt_type == 'matrix':
@@ -17,7 +30,10 @@ struct kargs
 void reduction(const struct kargs *restrict args)
 {
     ixdtype_t nrow = args->nrow, nblocks = args->nblocks;
-    fpdtype_t *reduced = args->reduced, *rcurr = args->rcurr, *rold = args->rold;
+    fpdtype_t *reduced = args->reduced, *rcurr = args->rcurr;
+% if method != 'nonfinite':
+    fpdtype_t *rold = args->rold;
+% endif
 % if method == 'errest':
     fpdtype_t *rerr = args->rerr, atol = args->atol, rtol = args->rtol;
 % elif method == 'resid' and dt_type == 'matrix':
@@ -55,6 +71,8 @@ void reduction(const struct kargs *restrict args)
                     temp = rerr[idx]/(atol + rtol*max(fabs(rcurr[idx]), fabs(rold[idx])));
                 % elif method == 'resid':
                     temp = (rcurr[idx] - rold[idx])/(1.0e-8 + dt_fac${'*dt_mat[idx]' if dt_type == 'matrix' else ''});
+                % elif method == 'nonfinite':
+                    temp = nonfinite(rcurr[idx]);
                 % endif
 
                 % if norm == 'uniform':
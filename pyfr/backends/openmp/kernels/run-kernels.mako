@@ -27,11 +27,19 @@ typedef struct
     union { regular_t regular; block_group_t block_group; };
 } kfunargs_t;
 
+% if profile:
+void run_kernels(int n, const kfunargs_t *kfa, double **ktimes)
+% else:
 void run_kernels(int n, const kfunargs_t *kfa)
+% endif
 {
     // Loop over each kernel or block-group thereof
     for (int i = 0; i < n; i++)
     {
+    % if profile:
+        double tstart = omp_get_wtime();
+
+    % endif
         if (kfa[i].ktype == KTYPE_REGULAR)
             kfa[i].regular.fun(kfa[i].regular.args);
         else
@@ -40,6 +48,13 @@ void run_kernels(int n, const kfunargs_t *kfa)
 
             #pragma omp parallel
             {
+            % if profile:
+                // Per-thread kernel timings
+                double *kt = alloca(sizeof(double)*bg.nkerns);
+                for (int j = 0; j < bg.nkerns; j++)
+                    kt[j] = 0;
+
+            % endif
                 // Make local copies of the argument structures
                 char ***kargs = alloca(sizeof(char **)*bg.nkerns);
                 for (int j = 0; j < bg.nkerns; j++)
@@ -59,12 +74,33 @@ void run_kernels(int n, const kfunargs_t *kfa)
                 #pragma omp for ${schedule}
                 for (int blk = 0; blk < bg.nblocks; blk++)
                     for (int j = 0; j < bg.nkerns; j++)
+                    {
+                    % if profile:
+                        double kstart = omp_get_wtime();
+                    % endif
                         bg.kernels[j].fun(bg.kernels[j].offset + blk, kargs[j],
                                           bg.kernels[j].argmask);
+                    % if profile:
+                        kt[j] += omp_get_wtime() - kstart;
+                    % endif
+                    }
+
+            % if profile:
+                // Accumulate the average time per thread for each kernel
+                for (int j = 0; j < bg.nkerns; j++)
+                {
+                    #pragma omp atomic
+                    ktimes[i][j + 1] += kt[j] / omp_get_num_threads();
+                }
 
+            % endif
                 if (lmem)
                     free(lmem);
             }
         }
+    % if profile:
+
+        ktimes[i][0] += omp_get_wtime() - tstart;
+    % endif
     }
 }
@@ -1,6 +1,10 @@
+from contextlib import contextmanager
 from ctypes import (POINTER, Structure, Union, addressof, byref, c_int,
                     c_void_p, cast, pointer, sizeof)
 from functools import cached_property
+import time
+
+import numpy as np
 
 from pyfr.backends.base import (BaseKernelProvider, BaseOrderedMetaKernel,
                                 BasePointwiseKernelProvider,
@@ -11,8 +15,9 @@ from pyfr.nputil import npdtype_to_ctypestype
 
 
 class OpenMPKernel(Kernel):
-    def __init__(self, mats=[], views=[], misc=[], kernel=None):
-        super().__init__(mats, views, misc)
+    def __init__(self, mats=[], views=[], misc=[], kernel=None,
+                 dt=float('nan')):
+        super().__init__(mats, views, misc, dt)
 
         if kernel:
             self.kernel = kernel
@@ -163,6 +168,32 @@ class OpenMPKernelProvider(BaseKernelProvider):
                                     self._get_arg_cls(tuple(argtypes)),
                                     argnames)
 
+    def _benchmark(self, kfunc, nbench=4, nwarmup=1):
+        for i in range(nbench + nwarmup):
+            if i == nwarmup:
+                tstart = time.perf_counter()
+
+            kfunc()
+
+        return (time.perf_counter() - tstart) / nbench
+
+    @contextmanager
+    def _mul_bench_operands(self, b, out):
+        b, out = getattr(b, 'parent', b), getattr(out, 'parent', out)
+
+        # Save a copy of the contents of the operand matrices
+        b_np, out_np = b.get(), out.get()
+
+        # Time with well-defined data rather than whatever is in B
+        rng = np.random.default_rng(0)
+        b.set(rng.uniform(-1, 1, b.ioshape))
+
+        try:
+            yield
+        finally:
+            b.set(b_np)
+            out.set(out_np)
+
 
 class OpenMPPointwiseKernelProvider(OpenMPKernelProvider,
                                     BasePointwiseKernelProvider):
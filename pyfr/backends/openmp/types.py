@@ -1,6 +1,9 @@
-from collections import defaultdict
-from ctypes import c_int
+from collections import Counter, defaultdict
+from ctypes import c_int, c_void_p
 from functools import cached_property
+from weakref import finalize
+
+import numpy as np
 
 import pyfr.backends.base as base
 from pyfr.backends.openmp.provider import OpenMPBlockKernelArgs, OpenMPKRunArgs
@@ -28,7 +31,10 @@ class OpenMPMatrixBase(base.MatrixBase):
         del self._initval
 
     def _get(self):
-        return self._unpack(self.data)
+        ary = self._unpack(self.data)
+
+        # As with other backends, return a copy rather than a view
+        return ary.copy() if np.may_share_memory(ary, self.data) else ary
 
     def _set(self, ary):
         self.data[:] = self._pack(ary)
@@ -56,6 +62,17 @@ class OpenMPXchgView(base.XchgView): pass
 class OpenMPView(base.View): pass
 
 
+def _accum_kprof(ktimes, kprof):
+    for gname, names, times in kprof:
+        if gname:
+            ktimes[gname] += times[0]
+
+            for n, t in zip(names, times[1:]):
+                ktimes[n] += t
+        else:
+            ktimes[names[0]] += times[0]
+
+
 class OpenMPGraph(base.Graph):
     needs_pdeps = False
 
@@ -66,8 +83,6 @@ class OpenMPGraph(base.Graph):
         self.kskip = set()
         self.kins = {}
 
-        self.mpi_idxs = defaultdict(list)
-
     def _get_kranges(self):
         kranges, i = {}, 0
 
@@ -80,25 +95,55 @@ class OpenMPGraph(base.Graph):
     def _get_nblocks(self, idxs):
         return max(self.klist[i].runargs.b.nblocks for i in idxs)
 
-    def _make_runlist(self, start, stop):
-        rlist = []
+    def _make_runlist(self):
+        ikerns = {j: k for k, r in self._get_kranges().items() for j in r}
 
-        for i in range(start, stop):
+        # Assemble the kernels and groups in the order they were added
+        units = []
+        for i, kfun in enumerate(self.klist):
             if i in self.kins:
-                rlist.extend(self.kins[i])
+                gkerns, groups = self.kins[i]
+                gdeps = {d for k in gkerns for d in self.kdeps[k]} - gkerns
+
+                for rargs, gidxs in groups:
+                    units.append((rargs, (True, gidxs), gkerns, gdeps))
 
             if i not in self.kskip:
-                rlist.append(self.klist[i].runargs)
+                k = ikerns[i]
+                units.append((kfun.runargs, (False, [i]), {k}, self.kdeps[k]))
+
+        # Number of outstanding run list entries for each kernel
+        nleft = Counter(k for *_, kerns, deps in units for k in kerns)
+
+        # MPI requests which must wait on kernels
+        mreqs = [(r, d) for r, d in zip(self.mpi_reqs, self.mpi_req_deps)
+                 if d]
+
+        def ready(deps):
+            return not any(nleft[d] for d in deps)
 
-        return make_array(rlist)
+        runlist, rlist, ridxs, pending = [], [], [], []
+        for u in units:
+            pending.append(u)
 
-    def add_mpi_req(self, req, deps=[]):
-        super().add_mpi_req(req, deps)
+            # Emit, in order, any entries whose dependencies are satisfied;
+            # this defers kernels which depend on a group until it has run
+            while (e := next((e for e in pending if ready(e[3])), None)):
+                pending.remove(e)
+                rlist.append(e[0])
+                ridxs.append(e[1])
+                nleft.subtract(e[2])
 
-        if deps:
-            ix = max(self.knodes[d] for d in deps)
+                # Start any MPI requests which are now ready
+                if (reqs := [r for r, d in mreqs if ready(d)]):
+                    runlist.append((make_array(rlist), ridxs, reqs))
+                    rlist, ridxs = [], []
+                    mreqs = [(r, d) for r, d in mreqs if r not in reqs]
 
-            self.mpi_idxs[ix].append(req)
+        if rlist or mreqs:
+            runlist.append((make_array(rlist), ridxs, [r for r, d in mreqs]))
+
+        return runlist
 
     def _group_splits(self, kerns, kranges):
         nblocks = self._get_nblocks([ix for k in kerns for ix in kranges[k]])
@@ -160,7 +205,7 @@ class OpenMPGraph(base.Graph):
         # Construct the groupings
         groups = []
         for off, n in splits:
-            bkernels, bsubs = [], []
+            bkernels, bsubs, bidxs = [], [], []
             for j, (start, end, bka) in gkerns.items():
                 if start <= off and end >= off + n:
                     for aoff, nbytes in argsubs[j]:
@@ -170,6 +215,7 @@ class OpenMPGraph(base.Graph):
                         fun=bka.fun, args=bka.args, argsz=bka.argsz,
                         argmask=argmasks[j], offset=off - start
                     ))
+                    bidxs.append(j)
 
             rargs = OpenMPKRunArgs(ktype=OpenMPKRunArgs.KTYPE_BLOCK_GROUP)
             rargs.b.nblocks = n
@@ -179,10 +225,11 @@ class OpenMPGraph(base.Graph):
             rargs.b.kernels = make_array(bkernels)
             rargs.b.subs = make_array(bsubs, type=c_int)
 
-            groups.append(rargs)
+            groups.append((rargs, bidxs))
 
         # Arrange for the groupings to be inserted into the final run list
-        self.kins[max(self.knodes[k] for k in kerns) - 1] = groups
+        gix = max(self.knodes[k] for k in kerns) - 1
+        self.kins[gix] = set(kerns), groups
 
         # Finally, prevent grouped being added to the final run list
         for k in kerns:
@@ -192,24 +239,61 @@ class OpenMPGraph(base.Graph):
         super().commit()
 
         # Group kernels in runs separated by MPI requests
-        self._runlist, i = [], 0
+        runlist = self._make_runlist()
+
+        if self.backend.profile_kernels:
+            self._krunner = self.backend.krunner_prof
+            self._runlist = self._make_prof_runlist(runlist)
+        else:
+            self._krunner = self.backend.krunner
+            self._runlist = [((len(ra), ra) if ra else None, reqs)
+                             for ra, ridxs, reqs in runlist]
+
+    def _make_prof_runlist(self, runlist):
+        # Map each entry in the kernel list to the name of its kernel
+        knames = {j: getattr(k, 'name', None) or 'other'
+                  for k, r in self._get_kranges().items() for j in r}
+
+        prunlist, self._kprof = [], []
+        for krunargs, ridxs, reqs in runlist:
+            ktimes = []
+            for group, idxs in ridxs:
+                names = [knames[j] for j in idxs]
+                times = np.zeros(len(idxs) + 1 if group else 1)
+
+                # Name groups after their distinct constituent kernels
+                gname = '+'.join(dict.fromkeys(names)) if group else None
+
+                self._kprof.append((gname, names, times))
+                ktimes.append(times.ctypes.data)
 
-        for j in sorted(self.mpi_idxs):
-            krunargs = self._make_runlist(i, j)
-            self._runlist.append((krunargs, self.mpi_idxs[j]))
-            i = j
+            if krunargs:
+                kargs = (len(krunargs), krunargs, make_array(ktimes, c_void_p))
+            else:
+                kargs = None
+
+            prunlist.append((kargs, reqs))
 
-        if i != len(self.klist) - 1:
-            krunargs = self._make_runlist(i, len(self.klist))
-            self._runlist.append((krunargs, []))
+        # Register ourself with the backend; when we are freed our times
+        # are folded into its totals so that we are not kept alive
+        self.backend._kprof_graphs.add(self)
+        finalize(self, _accum_kprof, self.backend._kprof_times, self._kprof)
+
+        return prunlist
+
+    def get_kernel_times(self):
+        ktimes = defaultdict(float)
+        _accum_kprof(ktimes, self._kprof)
+
+        return ktimes
 
     def run(self):
         # Start all dependency-free MPI requests
         self._startall(self.mpi_root_reqs)
 
-        for krunargs, reqs in self._runlist:
-            if krunargs:
-                self.backend.krunner(len(krunargs), krunargs)
+        for kargs, reqs in self._runlist:
+            if kargs:
+                self._krunner(*kargs)
 
             self._startall(reqs)
 
@@ -24,9 +24,14 @@ class XSMMWrappers(LibWrapper):
 
 
 class OpenMPXSMMKernels(OpenMPKernelProvider):
+    tuned_kernels = {'mul'}
+
     def __init__(self, backend):
         super().__init__(backend)
 
+        # Number of benchmarking runs
+        self.nbench = backend.cfg.getint('backend-openmp', 'xsmm-nbench', 5)
+
         # Kernel cache
         self._kerns = {}
 
@@ -40,7 +45,7 @@ class OpenMPXSMMKernels(OpenMPKernelProvider):
         w.libxsmm_init()
 
     def _destroy_kern(self, k):
-        blkptr, blkptr_nt = self._kerns.pop(k)
+        blkptr, blkptr_nt, dt = self._kerns.pop(k)
 
         self._wrappers.libxsmm_fsspmdm_destroy(blkptr)
 
@@ -51,7 +56,7 @@ class OpenMPXSMMKernels(OpenMPKernelProvider):
         if hasattr(self, '_wrappers'):
             self._wrappers.libxsmm_finalize()
 
-    def mul(self, a, b, out, alpha=1.0, beta=0.0):
+    def mul(self, a, b, out, alpha=1.0, beta=0.0, tdesc=None):
         # Ensure the matrices are compatible
         if a.nrow != out.nrow or a.ncol != b.nrow or b.ncol != out.ncol:
             raise ValueError('Incompatible matrices for out = a*b')
@@ -68,9 +73,6 @@ class OpenMPXSMMKernels(OpenMPKernelProvider):
         if beta != 0.0 and beta != 1.0:
             raise NotSuitableError('libxsmm requires β = 0 or β = 1')
 
-        # Index type
-        ixdtype = self.backend.ixdtype
-
         # Dimensions
         ldb, ldc = b.leaddim, out.leaddim
 
@@ -79,8 +81,12 @@ class OpenMPXSMMKernels(OpenMPKernelProvider):
 
         # Check the JIT kernel cache
         try:
-            blkptr, blkptr_nt = self._kerns[ckey]
+            blkptr, blkptr_nt, dt = self._kerns[ckey]
         except KeyError:
+            # Look up any timings from previous runs
+            tkind = type(self).__name__
+            tres = tdesc and self.backend.tuning.get(tkind, tdesc)
+
             c_is_nt = (beta == 0 and
                        out.nbytes >= 32*1024**2 and
                        self.backend.alignb >= 64)
@@ -116,10 +122,33 @@ class OpenMPXSMMKernels(OpenMPKernelProvider):
             else:
                 blkptr_nt = blkptr
 
+            # Reuse the previous timing where available
+            if tres:
+                dt = tres['dt']
+            else:
+                # Benchmark the kernel
+                with self._mul_bench_operands(b, out):
+                    batch_gemm = self._build_batch_gemm(blkptr, blkptr_nt, b,
+                                                        out)
+                    dt = self._benchmark(batch_gemm, nbench=self.nbench)
+
+                # Record the timing for subsequent runs
+                if tdesc:
+                    self.backend.tuning.set(tkind, tdesc, {'dt': dt})
+
             # Update the cache
-            self._kerns[ckey] = blkptr, blkptr_nt
+            self._kerns[ckey] = blkptr, blkptr_nt, dt
             finalize(a, self._destroy_kern, ckey)
 
+        # Build
+        batch_gemm = self._build_batch_gemm(blkptr, blkptr_nt, b, out)
+
+        return OpenMPKernel(mats=[a, b, out], misc=[self], kernel=batch_gemm,
+                            dt=dt)
+
+    def _build_batch_gemm(self, blkptr, blkptr_nt, b, out):
+        ixdtype = self.backend.ixdtype
+
         # Render our parallel wrapper kernel
         src = self.backend.lookup.get_template('batch-gemm').render()
 
@@ -132,4 +161,4 @@ class OpenMPXSMMKernels(OpenMPKernelProvider):
                             out, out.blocksz)
         batch_gemm.set_nblocks(b.nblocks)
 
-        return OpenMPKernel(mats=[a, b, out], misc=[self], kernel=batch_gemm)
+        return batch_gemm
@@ -0,0 +1,298 @@
+from contextlib import contextmanager
+from io import BytesIO, StringIO
+import itertools as it
+import platform
+import time
+
+import h5py
+import numpy as np
+
+from pyfr._version import __version__
+from pyfr.backends import get_backend
+from pyfr.inifile import Inifile
+from pyfr.partitioners import BasePartitioner, write_partitioning
+from pyfr.progress import NullProgressSequence
+from pyfr.readers.gmsh import GmshReader
+from pyfr.readers.native import NativeReader
+from pyfr.solvers import get_solver
+from pyfr.solvers.base import BaseSystem
+from pyfr.util import subclass_where
+
+
+_bench_cfg = '''
+[backend]
+precision = {precision}
+profile-kernels = {profile}
+
+[constants]
+gamma = 1.4
+mu = 0.001
+Pr = 0.72
+
+[solver]
+system = {system}
+order = {order}
+
+[solver-time-integrator]
+formulation = std
+scheme = rk4
+controller = none
+tstart = 0.0
+tend = 1.0
+dt = 0.00001
+
+[solver-interfaces]
+riemann-solver = rusanov
+ldg-beta = 0.5
+ldg-tau = 0.1
+
+[solver-interfaces-quad]
+flux-pts = gauss-legendre
+
+[solver-interfaces-tri]
+flux-pts = williams-shunn
+
+[solver-elements-hex]
+soln-pts = gauss-legendre
+
+[solver-elements-pri]
+soln-pts = williams-shunn~gauss-legendre
+
+[solver-elements-tet]
+soln-pts = shunn-ham
+
+[soln-ics]
+rho = 1.0 + 0.1*sin(2*pi*x)*sin(2*pi*y)*sin(2*pi*z)
+u = 0.1*sin(2*pi*y)
+v = 0.1*sin(2*pi*z)
+w = 0.1*sin(2*pi*x)
+p = 1.0
+'''
+
+# Gmsh element type numbers
+_msh_etypes = {'hex': 5, 'pri': 6, 'tet': 4, 'quad': 3, 'tri': 2}
+
+# Decomposition of a unit cube, with vertex i at (i & 1, i & 2, i & 4),
+# into elements of each type; all elements are positively oriented
+_cube_eles = {
+    'hex': [[0, 1, 3, 2, 4, 5, 7, 6]],
+    'pri': [[0, 1, 2, 4, 5, 6], [1, 3, 2, 5, 7, 6]],
+    'tet': [[0, 1, 3, 7], [0, 3, 2, 7], [0, 2, 6, 7], [0, 6, 4, 7],
+            [0, 4, 5, 7], [0, 5, 1, 7]]
+}
+
+
+def box_mesh(etype, n):
+    # Nodes of a lattice on the unit cube with x varying fastest
+    x = np.linspace(0, 1, n + 1)
+    nodes = np.stack(np.meshgrid(x, x, x, indexing='ij'), axis=-1)
+    nodes = nodes[..., ::-1].reshape(-1, 3)
+
+    # Node numbers of the vertices of each cube
+    k, j, i = np.unravel_index(np.arange(n**3), (n,)*3)
+    cverts = np.column_stack([(i + (v & 1 > 0)) +
+                              (n + 1)*((j + (v & 2 > 0)) +
+                                       (n + 1)*(k + (v & 4 > 0)))
+                              for v in range(8)])
+
+    # Decompose the cubes into elements
+    eles = cverts[:, _cube_eles[etype]].reshape(-1, len(_cube_eles[etype][0]))
+
+    # Elements along with their physical group
+    msheles = [(_msh_etypes[etype], 1, eles)]
+
+    # Identify faces on each side of the cube
+    for ftype, fnodes in GmshReader._petype_fnmap[etype].items():
+        faces = eles[:, fnodes].reshape(-1, len(fnodes[0]))
+        fpts = nodes[faces]
+
+        for d, s in it.product(range(3), range(2)):
+            onside = (fpts[..., d] == s).all(axis=-1)
+            msheles.append((_msh_etypes[ftype], 2 + 2*d + s, faces[onside]))
+
+    # Write out the mesh in the Gmsh format
+    msh = StringIO()
+    msh.write('$MeshFormat\n2.2 0 8\n$EndMeshFormat\n')
+
+    msh.write('$PhysicalNames\n7\n3 1 "fluid"\n')
+    for d, s in it.product(range(3), range(2)):
+        msh.write(f'2 {2 + 2*d + s} "periodic_{d}_{"lr"[s]}"\n')
+    msh.write('$EndPhysicalNames\n')
+
+    msh.write(f'$Nodes\n{len(nodes)}\n')
+    np.savetxt(msh, np.column_stack([np.arange(1, len(nodes) + 1), nodes]),
+               fmt=['%d'] + ['%.17g']*3)
+    msh.write('$EndNodes\n')
+
+    msh.write(f'$Elements\n{sum(len(e) for *_, e in msheles)}\n')
+    eidx = 1
+    for mtype, phys, e in msheles:
+        info = [np.arange(eidx, eidx + len(e)), [mtype]*len(e), [2]*len(e),
+                [phys]*len(e), [phys]*len(e)]
+        np.savetxt(msh, np.column_stack([*info, e + 1]), fmt='%d')
+        eidx += len(e)
+    msh.write('$EndElements\n')
+
+    # Convert it into a PyFR mesh
+    msh.seek(0)
+    reader = GmshReader(msh, NullProgressSequence())
+
+    pyfrm = BytesIO()
+    reader.write(pyfrm, 1e-5)
+
+    return pyfrm
+
+
+@contextmanager
+def _timed(times, name):
+    tstart = time.perf_counter()
+    yield
+    times[name] = time.perf_counter() - tstart
+
+
+def _reorder_mesh(pyfrm):
+    with h5py.File(pyfrm, 'r+') as f:
+        con, ecurved, edisps, _ = BasePartitioner.construct_global_con(f)
+        vparts = np.zeros(len(ecurved), dtype=np.int32)
+
+        pinfo = BasePartitioner.construct_partitioning(
+            f, ecurved, edisps, con, vparts, reorder=True
+        )
+        write_partitioning(f, '1', pinfo)
+
+
+def bench_case(backend, system, etype, order, n, *, precision='double',
+               nrhs=20, nsteps=5, profile=False, reorder=False):
+    cfg = Inifile(_bench_cfg.format(system=system, order=order,
+                                    precision=precision, profile=profile))
+    pyfrm = box_mesh(etype, n)
+    phases = {}
+
+    # Order the elements for locality
+    if reorder:
+        _reorder_mesh(pyfrm)
+
+    # Read the mesh
+    with _timed(phases, 'mesh-read'):
+        reader = NativeReader(pyfrm, construct_con=False)
+        mesh = reader.mesh
+
+    with _timed(phases, 'construct-con'):
+        reader._construct_con()
+
+    # Construct the system, timing each stage of the process
+    backend = get_backend(backend, cfg)
+    systemcls = subclass_where(BaseSystem, name=system)
+
+    with _timed(phases, 'element-setup'):
+        system = systemcls(backend, mesh, None, nregs=2, cfg=cfg)
+
+    with _timed(phases, 'kernel-compile'):
+        system.commit()
+
+    with _timed(phases, 'graph-commit'):
+        system._rhs_graphs(0, 1)
+
+    # Measure the throughput of the right hand side
+    ndofs = sum(system.ele_ndofs)
+
+    system.rhs(0.0, 0, 1)
+    backend.wait()
+
+    tstart = time.perf_counter()
+    for i in range(nrhs):
+        system.rhs(0.0, 0, 1)
+    backend.wait()
+    trhs = (time.perf_counter() - tstart) / nrhs
+
+    del system
+
+    # Measure the throughput of the time integrator
+    solver = get_solver(backend, mesh, None, cfg)
+    dt = cfg.getfloat('solver-time-integrator', 'dt')
+
+    # Take some steps to ensure all of the stepper kernels are built
+    solver.advance_to(nsteps*dt)
+    nacptsteps = solver.nacptsteps
+
+    tstart = time.perf_counter()
+    solver.advance_to(2*nsteps*dt)
+    backend.wait()
+    tstep = time.perf_counter() - tstart
+    tstep /= solver.nacptsteps - nacptsteps
+
+    case = {
+        'system': cfg.get('solver', 'system'), 'etype': etype,
+        'order': order, 'n': n, 'precision': precision,
+        'neles': sum(len(e) for e in mesh.eidxs.values()), 'ndofs': ndofs,
+        'phases': phases,
+        'rhs': {'time': trhs, 'dofs-per-sec': ndofs / trhs},
+        'step': {'time': tstep, 'dofs-per-sec': ndofs / tstep}
+    }
+
+    # Accumulated run time of each kernel
+    if profile:
+        case['kernels'] = backend.kernel_times()
+
+    return case
+
+
+def element_cost(backend, cfg, etype, neles, *, nrhs=20):
+    if etype not in _cube_eles:
+        raise ValueError(f'Unable to calibrate element type {etype}')
+
+    # Size the mesh so it contains approximately neles elements
+    n = max(2, round((neles / len(_cube_eles[etype]))**(1 / 3)))
+    mesh = NativeReader(box_mesh(etype, n)).mesh
+
+    # Construct the system
+    backend = get_backend(backend, cfg)
+    systemcls = subclass_where(BaseSystem, name=cfg.get('solver', 'system'))
+    system = systemcls(backend, mesh, None, nregs=2, cfg=cfg)
+    system.commit()
+
+    system.rhs(0.0, 0, 1)
+    backend.wait()
+
+    # Time the right hand side
+    tstart = time.perf_counter()
+    for i in range(nrhs):
+        system.rhs(0.0, 0, 1)
+    backend.wait()
+    trhs = (time.perf_counter() - tstart) / nrhs
+
+    # Return the cost per element
+    return trhs / len(mesh.eidxs[etype])
+
+
+def bench(backend, systems, etypes, orders, n, **kwargs):
+    cases = []
+
+    for system, etype, order in it.product(systems, etypes, orders):
+        cases.append(bench_case(backend, system, etype, order, n, **kwargs))
+
+    return {
+        'version': __version__, 'backend': backend,
+        'machine': platform.machine(), 'processor': platform.processor(),
+        'node': platform.node(), 'cases': cases
+    }
+
+
+def compare(old, new):
+    key = lambda c: (c['system'], c['etype'], c['order'], c['n'],
+                     c['precision'])
+    oldcases = {key(c): c for c in old['cases']}
+
+    for c in new['cases']:
+        if (o := oldcases.get(key(c))) is None:
+            continue
+
+        yield key(c), {
+            **{f'phase-{p}': t / o['phases'][p]
+               for p, t in c['phases'].items() if p in o['phases']},
+            **{f'kernel-{k}': t / o['kernels'][k]
+               for k, t in c.get('kernels', {}).items()
+               if k in o.get('kernels', {})},
+            'rhs': c['rhs']['dofs-per-sec'] / o['rhs']['dofs-per-sec'],
+            'step': c['step']['dofs-per-sec'] / o['step']['dofs-per-sec']
+        }
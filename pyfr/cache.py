@@ -1,5 +1,7 @@
+from contextlib import contextmanager
 import functools as ft
 import itertools as it
+import json
 import os
 from pathlib import Path
 import pickle
@@ -8,6 +10,13 @@ import uuid
 
 from platformdirs import user_cache_dir
 
+from pyfr.util import digest
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 
 def memoize(origfn=None, maxsize=None):
     def memoizefn(meth):
@@ -63,10 +72,18 @@ class ObjectCache:
 
         self.cachedir = Path(cdir).absolute()
 
+        # Determine if cooperative locking is enabled
+        self.locking = (fcntl is not None and
+                        f'PYFR_{suffix.upper()}_DISABLE_CACHE_LOCK'
+                        not in os.environ)
+
         if self.enabled:
             self.cachedir.mkdir(parents=True, exist_ok=True)
             self._prune_cache(maxsize)
 
+            if self.locking:
+                (self.cachedir / 'locks').mkdir(exist_ok=True)
+
     def get_path(self, k):
         return self.cachedir / k if self.enabled else None
 
@@ -98,6 +115,27 @@ class ObjectCache:
 
         return None
 
+    @contextmanager
+    def lock(self, k):
+        if not self.enabled or not self.locking:
+            yield
+            return
+
+        try:
+            f = open(self.cachedir / 'locks' / k, 'a')
+        except OSError:
+            yield
+            return
+
+        with f:
+            # Wait for any other process which is producing this item
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            except OSError:
+                pass
+
+            yield
+
     def _prune_cache(self, maxsize):
         files = {f: f.stat() for f in self.cachedir.iterdir() if f.is_file()}
         csize = sum(fs.st_size for fs in files.values())
@@ -105,7 +143,59 @@ class ObjectCache:
         if csize > maxsize:
             for f, fs in sorted(files.items(), key=lambda f: f[1].st_atime):
                 f.unlink(missing_ok=True)
+                (self.cachedir / 'locks' / f.name).unlink(missing_ok=True)
                 csize -= fs.st_size
 
                 if csize <= maxsize:
                     break
+
+
+class TuningDB:
+    def __init__(self, device=None):
+        self.device = device
+        self.cache = ObjectCache('tuning')
+
+        # Whether new results should be discarded
+        self.readonly = False
+
+    def _key(self, kind, desc):
+        return f'{kind}-{digest(self.device, kind, sorted(desc.items()))}'
+
+    def get(self, kind, desc):
+        try:
+            rec = json.loads(self.cache.get_bytes(self._key(kind, desc)))
+            return rec['result']
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def set(self, kind, desc, result):
+        if self.readonly:
+            return
+
+        rec = {'device': self.device, 'kind': kind, 'desc': desc,
+               'result': result}
+
+        self.cache.set_with_bytes(self._key(kind, desc),
+                                  json.dumps(rec).encode())
+
+    def records(self):
+        if not self.cache.enabled:
+            return
+
+        for f in sorted(self.cache.cachedir.iterdir()):
+            try:
+                if f.is_file():
+                    yield json.loads(f.read_bytes())
+            except (OSError, ValueError):
+                pass
+
+    def clear(self):
+        n = 0
+
+        if self.cache.enabled:
+            for f in self.cache.cachedir.iterdir():
+                if f.is_file():
+                    f.unlink(missing_ok=True)
+                    n += 1
+
+        return n
@@ -123,6 +123,9 @@ class Inifile:
     def remove_option(self, section, option):
         self._cp.remove_option(section, option)
 
+    def remove_section(self, section):
+        self._cp.remove_section(section)
+
     def sections(self):
         return self._cp.sections()
 
@@ -1,6 +1,8 @@
 from collections import defaultdict, deque
+from functools import cached_property
 import itertools as it
 import re
+import statistics
 import sys
 import time
 
@@ -76,6 +78,11 @@ class BaseIntegrator:
         self._abort = True
         self._abort_reason = self._abort_reason or reason
 
+    def plugin_changed_rhs(self):
+        # Discard any right hand sides evaluated with the old inputs
+        self._rhs_curr = None
+        self._curr_dt_soln = None
+
     def _get_plugins(self, initsoln):
         plugins = []
 
@@ -107,7 +114,13 @@ class BaseIntegrator:
     def _run_plugins(self):
         wtimes = self._plugin_wtimes
 
-        self.backend.wait()
+        # Only synchronise if a plugin is due to access the solution; plain
+        # callables, such as the progress bar, are assumed to always be
+        def needs_sync(p):
+            return getattr(p, 'needs_sync', lambda intg: True)(self)
+
+        if any(needs_sync(plugin) for plugin in self.plugins):
+            self.backend.wait()
 
         # Fire off the plugins and tally up the runtime
         for plugin in self.plugins:
@@ -164,6 +177,11 @@ class BaseIntegrator:
     def advance_to(self, t):
         pass
 
+    def warmup(self):
+        # Build all of the stepper kernels and graphs by taking a single
+        # step; the controller is bypassed and the step never accepted
+        return self.step(self.tcurr, self._dt)
+
     def run(self):
         for t in self.tlist:
             self.advance_to(t)
@@ -194,6 +212,18 @@ class BaseIntegrator:
         stats.set('solver-time-integrator', 'nacptsteps', self.nacptsteps)
         stats.set('solver-time-integrator', 'nrjctsteps', self.nrjctsteps)
 
+        # Geometry cache statistics
+        if (gc := self.system.geocache):
+            comm, rank, root = get_comm_rank_root()
+
+            nhits = comm.allreduce(gc.nhits)
+            nmisses = comm.allreduce(gc.nmisses)
+            tsaved = comm.allreduce(gc.tsaved, op=mpi.MAX)
+
+            stats.set('geometry-cache', 'hits', nhits)
+            stats.set('geometry-cache', 'misses', nmisses)
+            stats.set('geometry-cache', 'time-saved', f'{tsaved:.3g}')
+
         # MPI wait times
         if self.cfg.getbool('backend', 'collect-wait-times', False):
             comm, rank, root = get_comm_rank_root()
@@ -204,6 +234,30 @@ class BaseIntegrator:
                     stats.set('backend-wait-times', f'rhs-graph-{i}-{k}',
                               ','.join(f'{v[j]:.3g}' for v in ms))
 
+            # Global reductions performed by the controllers
+            rwait_times = comm.allgather(self.reduction_wait_times())
+            for j, k in enumerate(['mean', 'stdev', 'median']):
+                stats.set('backend-wait-times', f'reduction-{k}',
+                          ','.join(f'{v[j]:.3g}' for v in rwait_times))
+
+        # Memory usage
+        if self.cfg.getbool('backend', 'collect-memory-usage', False):
+            comm, rank, root = get_comm_rank_root()
+
+            usage = comm.allgather(self.backend.memory_usage())
+            for k in sorted(set().union(*usage)):
+                stats.set('backend-memory-usage', k,
+                          ','.join(str(u.get(k, 0)) for u in usage))
+
+        # Kernel run times
+        if self.cfg.getbool('backend', 'profile-kernels', False):
+            comm, rank, root = get_comm_rank_root()
+
+            ktimes = comm.allgather(self.backend.kernel_times())
+            for k in sorted(set().union(*ktimes)):
+                stats.set('backend-kernel-times', k,
+                          ','.join(f'{kt.get(k, 0):.3g}' for kt in ktimes))
+
     @property
     def cfgmeta(self):
         cfg = self.cfg.tostr()
@@ -238,6 +292,29 @@ class BaseCommon:
         # Sum to get the global number over all partitions
         return comm.allreduce(ndofs, op=mpi.SUM)
 
+    @cached_property
+    def _reduction_wait_times(self):
+        if self.cfg.getbool('backend', 'collect-wait-times', False):
+            n = self.cfg.getint('backend', 'collect-wait-times-len', 10000)
+            return deque(maxlen=n)
+
+    def _wait_reduction(self, req):
+        if (wtimes := self._reduction_wait_times) is not None:
+            t = time.perf_counter_ns()
+            req.Wait()
+            wtimes.append((time.perf_counter_ns() - t) / 1e9)
+        else:
+            req.Wait()
+
+    def reduction_wait_times(self):
+        t = self._reduction_wait_times or []
+
+        mean = statistics.mean(t) if t else 0
+        stdev = statistics.stdev(t, mean) if len(t) >= 2 else 0
+        median = statistics.median(t) if t else 0
+
+        return mean, stdev, median
+
     @memoize
     def _get_axnpby_kerns(self, *rs, subdims=None):
         kerns = [self.backend.kernel('axnpby', *[em[r] for r in rs],
@@ -16,6 +16,9 @@ class BaseDualIntegrator(BaseIntegrator):
             self.stage_nregs, self._dt
         )
 
+        # Register holding the RHS of the current solution, if any
+        self._rhs_curr = None
+
         # Event handlers for advance_to
         self.plugins = self._get_plugins(initsoln)
 
@@ -30,6 +33,10 @@ class BaseDualIntegrator(BaseIntegrator):
     def pseudostepinfo(self):
         return self.pseudointegrator.pseudostepinfo
 
+    @property
+    def soln_bank(self):
+        return self.pseudointegrator._idxcurr
+
     @_common_plugin_prop('_curr_soln')
     def soln(self):
         return self.system.ele_scal_upts(self.pseudointegrator._idxcurr)
@@ -41,6 +48,10 @@ class BaseDualIntegrator(BaseIntegrator):
 
     @_common_plugin_prop('_curr_dt_soln')
     def dt_soln(self):
+        # See if the stepper has already evaluated the RHS
+        if self._rhs_curr is not None:
+            return self.system.ele_scal_upts(self._rhs_curr)
+
         soln = self.soln
 
         idx = self.pseudointegrator._idxcurr
@@ -54,6 +65,9 @@ class BaseDualIntegrator(BaseIntegrator):
 
         return dt_soln
 
+    def reduction_wait_times(self):
+        return self.pseudointegrator.reduction_wait_times()
+
     def call_plugin_dt(self, dt):
         rem = math.fmod(dt, self._dt)
         tol = 5.0*self.dtmin
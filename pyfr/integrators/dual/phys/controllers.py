@@ -20,6 +20,7 @@ class BaseDualController(BaseDualIntegrator):
         # Filter
         if self._fnsteps and self.nacptsteps % self._fnsteps == 0:
             self.pseudointegrator.system.filt(idxcurr)
+            self._rhs_curr = None
 
         self._invalidate_caches()
 
@@ -32,6 +32,12 @@ class BaseDIRKStepper(BaseDualStepper):
             bcoeffs = [bt*self._dt for bt in self.b]
             self.pseudointegrator.obtain_solution(bcoeffs)
 
+        # With FSAL the final stage RHS is that of the new solution
+        if self.fsal and self.stage_nregs > 1:
+            self._rhs_curr = self.pseudointegrator._stage_regidx[-1]
+        else:
+            self._rhs_curr = None
+
         self.pseudointegrator.store_current_soln()
 
 
@@ -9,6 +9,9 @@ class BaseDualPseudoIntegrator(BaseCommon):
     formulation = 'dual'
     aux_nregs = 0
 
+    # System, if any, whose scratch space we can share
+    scratch_donor = None
+
     def __init__(self, backend, systemcls, mesh, initsoln, cfg, stepper_nregs,
                  stage_nregs, dt):
         self.backend = backend
@@ -47,7 +50,7 @@ class BaseDualPseudoIntegrator(BaseCommon):
 
         # Construct the relevant system
         self.system = systemcls(backend, mesh, initsoln, nregs=self.nregs,
-                                cfg=cfg)
+                                cfg=cfg, scratch_donor=self.scratch_donor)
 
         # Register index list and current index
         self._regidx = list(range(self.nregs))
@@ -10,6 +10,7 @@ from pyfr.integrators.dual.pseudo.base import BaseDualPseudoIntegrator
 from pyfr.integrators.dual.pseudo.pseudocontrollers import (
     BaseDualPseudoController
 )
+from pyfr.mpiutil import get_comm_rank_root
 from pyfr.util import subclass_where
 
 
@@ -17,6 +18,7 @@ class DualMultiPIntegrator(BaseDualPseudoIntegrator):
     def __init__(self, backend, systemcls, mesh, initsoln, cfg, stepper_nregs,
                  stage_nregs, dt):
         self.backend = backend
+        self.cfg = cfg
 
         sect = 'solver-time-integrator'
         mgsect = 'solver-dual-time-integrator-multip'
@@ -65,6 +67,7 @@ class DualMultiPIntegrator(BaseDualPseudoIntegrator):
         from pyfr.integrators.dual.pseudo import get_pseudo_stepper_cls
 
         self.pintgs = {}
+        self._level_mids = {}
         for l in self.levels:
             pc = get_pseudo_stepper_cls(pn, l)
 
@@ -87,6 +90,10 @@ class DualMultiPIntegrator(BaseDualPseudoIntegrator):
                 name = f'MultiPPseudoIntegrator{l}'
                 aux_nregs = 2 if l != self._order else 0
 
+                # Lower levels can share the scratch space of the top level
+                if l != self._order:
+                    scratch_donor = self.pintgs[self._order].system
+
                 @property
                 def _aux_regidx(self):
                     if self.aux_nregs != 0:
@@ -99,6 +106,9 @@ class DualMultiPIntegrator(BaseDualPseudoIntegrator):
                 def convmon(self, *args, **kwargs):
                     pass
 
+                def convmon_flush(self):
+                    pass
+
                 def _rhs_with_dts(self, t, uin, fout, mg_add=True):
                     super()._rhs_with_dts(t, uin, fout)
 
@@ -109,24 +119,32 @@ class DualMultiPIntegrator(BaseDualPseudoIntegrator):
             stp_nregs = stepper_nregs if l == self._order else 0
             stg_nregs = stage_nregs if l == self._order else 0
 
+            mids = set(backend.mats)
             self.pintgs[l] = lpsint(
                 backend, systemcls, mesh, initsoln, mcfg, stp_nregs, stg_nregs,
                 dt
             )
 
+            # Note the matrices allocated by this level
+            self._level_mids[l] = set(backend.mats) - mids
+
         # Get the highest p system from plugins
         self.system = self.pintgs[self._order].system
 
-        # Get the convergence monitoring method
+        # Get the convergence monitoring methods
         self.mg_convmon = cc.convmon
+        self.mg_convmon_flush = cc.convmon_flush
 
         # Initialise the restriction and prolongation matrices
         self._init_proj_mats()
 
     def commit(self):
-        for s in self.pintgs.values():
+        for l, s in self.pintgs.items():
+            mids = set(self.backend.mats)
             s.system.commit()
 
+            self._level_mids[l] |= set(self.backend.mats) - mids
+
     @property
     def _idxcurr(self):
         return self.pintg._idxcurr
@@ -135,6 +153,10 @@ class DualMultiPIntegrator(BaseDualPseudoIntegrator):
     def _idxcurr(self, y):
         self.pintg._idxcurr = y
 
+    @property
+    def _reduction_wait_times(self):
+        return self.pintgs[self._order]._reduction_wait_times
+
     @property
     def pseudostepinfo(self):
         return self.pintg.pseudostepinfo
@@ -316,6 +338,9 @@ class DualMultiPIntegrator(BaseDualPseudoIntegrator):
             if self.mg_convmon(self.pintg, i, self._minniters):
                 break
 
+        # Wait for any outstanding residuals
+        self.mg_convmon_flush(self.pintg)
+
     def collect_stats(self, stats):
         # Collect the stats for each level
         for l in self.levels:
@@ -329,3 +354,12 @@ class DualMultiPIntegrator(BaseDualPseudoIntegrator):
 
         # Total number of p-multigrid cycles
         stats.set('solver-time-integrator', 'npmgcycles', self.npmgcycles)
+
+        # Memory allocated by each level
+        if self.cfg.getbool('backend', 'collect-memory-usage', False):
+            comm, rank, root = get_comm_rank_root()
+
+            for l in self.levels:
+                nbytes = self.backend.owned_nbytes(self._level_mids[l])
+                stats.set('backend-memory-usage', f'level-p{l}',
+                          ','.join(str(n) for n in comm.allgather(nbytes)))
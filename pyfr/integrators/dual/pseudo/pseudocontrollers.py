@@ -1,3 +1,5 @@
+from collections import deque
+
 import numpy as np
 
 from pyfr.integrators.dual.pseudo.base import BaseDualPseudoIntegrator
@@ -14,17 +16,52 @@ class BaseDualPseudoController(BaseDualPseudoIntegrator):
         # Stats on the most recent step
         self.pseudostepinfo = []
 
+        # Number of iterations by which convergence checks can lag
+        sect = 'solver-time-integrator'
+        self._resid_lag = self.cfg.getint(sect, 'pseudo-resid-lag', 0)
+        if self._resid_lag < 0:
+            raise ValueError('Invalid pseudo-resid-lag')
+
+        # Residuals whose global reduction is in progress
+        self._resid_reqs = deque()
+
     def convmon(self, i, minniters, dt_fac=1):
         if i >= minniters - 1:
-            # Compute the normalised residual
+            # Start computing the normalised residual
             resid = self._resid(self._idxcurr, self._idxprev, dt_fac)
+            self._resid_reqs.append((self.ntotiters, i + 1, *resid))
 
-            self._update_pseudostepinfo(i + 1, resid)
-            return all(r <= t for r, t in zip(resid, self._pseudo_residtol))
+            # Check for convergence as of lag iterations ago
+            return self._convmon_wait(self._resid_lag)
         else:
             self._update_pseudostepinfo(i + 1, None)
             return False
 
+    def convmon_flush(self):
+        self._convmon_wait(0)
+
+    def _convmon_wait(self, lag):
+        reqs, conv = self._resid_reqs, False
+
+        while len(reqs) > lag:
+            ntotiters, niters, res, req = reqs.popleft()
+            self._wait_reduction(req)
+
+            # Normalise the residual
+            if self._pseudo_norm == 'l2':
+                resid = tuple(np.sqrt(res / self._gndofs))
+            else:
+                resid = tuple(np.sqrt(res))
+
+            self.pseudostepinfo.append((ntotiters, niters, resid))
+
+            # Once converged there is no need to wait for later residuals
+            tols = self._pseudo_residtol
+            if all(r <= t for r, t in zip(resid, tols)):
+                conv, lag = True, 0
+
+        return conv
+
     def commit(self):
         self.system.commit()
 
@@ -42,22 +79,16 @@ class BaseDualPseudoController(BaseDualPseudoIntegrator):
         # Run the kernels
         self.backend.run_kernels(rkerns, wait=True)
 
-        # Pseudo L2 norm
+        # Reduce locally (element types)
         if self._pseudo_norm == 'l2':
-            # Reduce locally (element types) and globally (MPI ranks)
             res = np.array([sum(e) for e in zip(*[r.retval for r in rkerns])])
-            comm.Allreduce(mpi.IN_PLACE, res, op=mpi.SUM)
-
-            # Normalise and return
-            return tuple(np.sqrt(res / self._gndofs))
-        # Uniform norm
+            op = mpi.SUM
         else:
-            # Reduce locally (element types) and globally (MPI ranks)
             res = np.array([max(e) for e in zip(*[r.retval for r in rkerns])])
-            comm.Allreduce(mpi.IN_PLACE, res, op=mpi.MAX)
+            op = mpi.MAX
 
-            # Normalise and return
-            return tuple(np.sqrt(res))
+        # Start reducing globally (MPI ranks)
+        return res, comm.Iallreduce(mpi.IN_PLACE, res, op=op)
 
     def _update_pseudostepinfo(self, niters, resid):
         self.pseudostepinfo.append((self.ntotiters, niters, resid))
@@ -78,6 +109,9 @@ class DualNonePseudoController(BaseDualPseudoController):
             if self.convmon(i, self.minniters, self._dtau):
                 break
 
+        # Wait for any outstanding residuals
+        self.convmon_flush()
+
 
 class DualPIPseudoController(BaseDualPseudoController):
     pseudo_controller_name = 'local-pi'
@@ -156,3 +190,6 @@ class DualPIPseudoController(BaseDualPseudoController):
 
             if self.convmon(i, self.minniters):
                 break
+
+        # Wait for any outstanding residuals
+        self.convmon_flush()
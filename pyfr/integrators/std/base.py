@@ -29,12 +29,20 @@ class BaseStdIntegrator(BaseCommon, BaseIntegrator):
         self._regidx = list(range(self.nregs))
         self._idxcurr = 0
 
+        # Time and registers of any RHS evaluated outside of a step
+        self._rhs_curr = None
+
         # Pre-process solution
         self.system.preproc(self.tcurr, self._idxcurr)
 
         # Global degree of freedom count
         self._gndofs = self._get_gndofs()
 
+    @property
+    def soln_bank(self):
+        self.system.postproc(self._idxcurr)
+        return self._idxcurr
+
     @_common_plugin_prop('_curr_soln')
     def soln(self):
         self.system.postproc(self._idxcurr)
@@ -48,16 +56,23 @@ class BaseStdIntegrator(BaseCommon, BaseIntegrator):
 
     @_common_plugin_prop('_curr_dt_soln')
     def dt_soln(self):
-        soln = self.soln
+        # Steppers evaluate their first stage into the first free register
+        uidx = self._idxcurr
+        fidx = next(i for i in self._regidx if i != uidx)
+
+        # Compute the RHS, if needed, such that the next step can reuse it
+        if self._rhs_curr != (self.tcurr, uidx, fidx):
+            self.system.rhs(self.tcurr, uidx, fidx)
+            self._rhs_curr = (self.tcurr, uidx, fidx)
 
-        self.system.rhs(self.tcurr, self._idxcurr, self._idxcurr)
-        dt_soln = self.system.ele_scal_upts(self._idxcurr)
+        return self.system.ele_scal_upts(fidx)
 
-        # Reset current register with original contents
-        for e, s in zip(self.system.ele_banks, soln):
-            e[self._idxcurr].set(s)
+    def _first_stage_rhs(self, t, uinbank, foutbank):
+        # Reuse any RHS which has already been evaluated for this state
+        if self._rhs_curr != (t, uinbank, foutbank):
+            self.system.rhs(t, uinbank, foutbank)
 
-        return dt_soln
+        self._rhs_curr = None
 
     @property
     def controller_needs_errest(self):
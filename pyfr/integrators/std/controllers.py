@@ -34,6 +34,7 @@ class BaseStdController(BaseStdIntegrator):
         # Filter
         if self._fnsteps and self.nacptsteps % self._fnsteps == 0:
             self.system.filt(idxcurr)
+            self._rhs_curr = None
 
         self._invalidate_caches()
 
@@ -119,11 +120,15 @@ class StdPIController(BaseStdController):
         if not self._minfac < 1 <= self._maxfac:
             raise ValueError('Invalid max-fact, min-fact')
 
+        # Overlap the error reduction with the next right hand side
+        self._errest_overlap = self.cfg.getbool(sect, 'errest-overlap',
+                                                False)
+
     @property
     def controller_needs_errest(self):
         return True
 
-    def _errest(self, rcurr, rprev, rerr):
+    def _errest(self, rcurr, rprev, rerr, tnext):
         comm, rank, root = get_comm_rank_root()
 
         # Get a set of kernels to estimate the integration error
@@ -137,29 +142,44 @@ class StdPIController(BaseStdController):
         # Run the kernels
         self.backend.run_kernels(ekerns, wait=True)
 
-        # Pseudo L2 norm
+        # Reduce locally (element types + field variables)
         if self._norm == 'l2':
-            # Reduce locally (element types + field variables)
             err = np.array([sum(v for k in ekerns for v in k.retval)])
-
-            # Reduce globally (MPI ranks)
-            comm.Allreduce(mpi.IN_PLACE, err, op=mpi.SUM)
-
-            # Normalise
-            err = math.sqrt(float(err) / self._gndofs)
-        # Uniform norm
+            op = mpi.SUM
         else:
-            # Reduce locally (element types + field variables)
             err = np.array([max(v for k in ekerns for v in k.retval)])
+            op = mpi.MAX
+
+        # Start reducing globally (MPI ranks)
+        req = comm.Iallreduce(mpi.IN_PLACE, err, op=op)
+
+        # Meanwhile, speculatively evaluate the first stage of the next
+        # step; this is wasted if the current step is rejected or if a
+        # plugin subsequently changes an input to the right hand side
+        if self._errest_overlap:
+            fidx = next(i for i in self._regidx if i != rcurr)
 
-            # Reduce globally (MPI ranks)
-            comm.Allreduce(mpi.IN_PLACE, err, op=mpi.MAX)
+            if fidx not in (rprev, rerr):
+                self.system.rhs(tnext, rcurr, fidx)
+                self._rhs_curr = (tnext, rcurr, fidx)
 
-            # Normalise
-            err = math.sqrt(float(err))
+        self._wait_reduction(req)
+
+        # Normalise
+        if self._norm == 'l2':
+            err = math.sqrt(err[0] / self._gndofs)
+        else:
+            err = math.sqrt(err[0])
 
         return err if not math.isnan(err) else 100
 
+    def warmup(self):
+        idxcurr, idxprev, idxerr = super().warmup()
+
+        # Build, but do not run, the error estimation kernels
+        self._get_reduction_kerns(idxcurr, idxprev, idxerr, method='errest',
+                                  norm=self._norm)
+
     def advance_to(self, t):
         if t < self.tcurr:
             raise ValueError('Advance time is in the past')
@@ -181,7 +201,7 @@ class StdPIController(BaseStdController):
             idxcurr, idxprev, idxerr = self.step(self.tcurr, dt)
 
             # Estimate the error
-            err = self._errest(idxcurr, idxprev, idxerr)
+            err = self._errest(idxcurr, idxprev, idxerr, self.tcurr + dt)
 
             # Determine time step adjustment factor
             fac = err**-expa * self._errprev**expb
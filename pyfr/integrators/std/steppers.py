@@ -21,10 +21,10 @@ class StdEulerStepper(BaseStdStepper):
         return self.nsteps
 
     def step(self, t, dt):
-        add, rhs_with_postproc = self._add, self.system.rhs
+        add = self._add
         ut, f = self._regidx
 
-        rhs_with_postproc(t, ut, f)
+        self._first_stage_rhs(t, ut, f)
         add(1.0, ut, dt, f)
 
         return ut
@@ -50,9 +50,9 @@ class StdTVDRK3Stepper(BaseStdStepper):
         if r0 != self._idxcurr:
             r0, r1 = r1, r0
 
-        # First stage; r2 = -∇·f(r0); r1 = r0 + dt*r2
-        rhs_with_postproc(t, r0, r2)
-        add(0.0, r1, 1.0, r0, dt, r2)
+        # First stage; r1 = -∇·f(r0); r1 = r0 + dt*r1
+        self._first_stage_rhs(t, r0, r1)
+        add(dt, r1, 1.0, r0)
 
         # Second stage; r2 = -∇·f(r1); r1 = 0.75*r0 + 0.25*r1 + 0.25*dt*r2
         rhs_with_postproc(t + dt, r1, r2)
@@ -88,7 +88,7 @@ class StdRK4Stepper(BaseStdStepper):
             r0, r1 = r1, r0
 
         # First stage; r1 = -∇·f(r0)
-        rhs_with_postproc(t, r0, r1)
+        self._first_stage_rhs(t, r0, r1)
 
         # Second stage; r2 = r0 + dt/2*r1; r2 = -∇·f(r2)
         add(0.0, r2, 1.0, r0, dt/2.0, r1)
@@ -182,12 +182,15 @@ class StdRKVdH2RStepper(BaseStdStepper):
         rhs_with_postproc = self.system.rhs
 
         r1 = self._idxcurr
-        r2, *rs = set(self._regidx) - {r1}
+        r2, *rs = [r for r in self._regidx if r != r1]
 
         # Evaluate the stages in the scheme
         for i, ci in enumerate(self.c):
             # Compute -∇·f
-            rhs_with_postproc(t + ci*dt, r2 if i > 0 else r1, r2)
+            if i == 0:
+                self._first_stage_rhs(t, r1, r2)
+            else:
+                rhs_with_postproc(t + ci*dt, r2, r2)
 
             # Fetch the appropriate RK accumulation kernels
             kerns = self._get_rkvdh2_kerns(i, r1, r2, *rs)
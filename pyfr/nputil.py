@@ -104,6 +104,81 @@ def fuzzysort(arr, idx, dim=0, tol=1e-6):
     return srtdidx
 
 
+def batched_fuzzysort(arr, idx, tol=1e-6):
+    # Points have shape (nbatch, ndims, npts); extract those of interest
+    arr = np.asarray(arr)[..., idx]
+    idx = np.asarray(idx)
+    nb, ndims, n = arr.shape
+
+    # Cluster the points along each dimension such that successive
+    # clusters are separated by at least tol
+    cids = np.empty((ndims, nb, n), dtype=np.int64)
+    amb = np.zeros(nb, dtype=bool)
+    for d, arrd in enumerate(np.moveaxis(arr, 1, 0)):
+        srtd = np.argsort(arrd, axis=1, kind='stable')
+        arrd = np.take_along_axis(arrd, srtd, axis=1)
+
+        brk = np.ones((nb, n), dtype=bool)
+        brk[:, 1:] = np.diff(arrd, axis=1) >= tol
+
+        # Identify the first point of each cluster
+        first = np.maximum.accumulate(np.where(brk, np.arange(n), 0), axis=1)
+
+        # Clusters which span more than tol are ambiguous
+        span = arrd - np.take_along_axis(arrd, first, axis=1)
+        amb |= (span >= tol).any(axis=1)
+
+        np.put_along_axis(cids[d], srtd, np.cumsum(brk, axis=1), axis=1)
+
+    # Sort lexicographically by cluster number
+    srtdidx = np.lexsort(cids[::-1], axis=-1)
+
+    # Points which do not fall into distinct clusters are also ambiguous
+    scids = np.take_along_axis(cids, srtdidx[None], axis=-1)
+    amb |= (np.diff(scids, axis=-1) == 0).all(axis=0).any(axis=-1)
+
+    srtdidx = idx[srtdidx]
+
+    # Fall back to the exact algorithm for any ambiguous batches
+    for i in amb.nonzero()[0]:
+        srtdidx[i] = idx[fuzzysort(arr[i].tolist(), range(n), tol=tol)]
+
+    return srtdidx
+
+
+def hilbert_keys(ipts, nbits):
+    x = [xi.astype(np.int64) for xi in ipts.T]
+    ndims = len(x)
+
+    # Undo the excess work of Skilling's transposed Hilbert algorithm
+    for b in range(nbits - 1, 0, -1):
+        q, p = 1 << b, (1 << b) - 1
+
+        for i in range(ndims):
+            qmask = (x[i] & q) != 0
+            t = np.where(qmask, 0, (x[0] ^ x[i]) & p)
+
+            x[0] ^= np.where(qmask, p, t)
+            if i:
+                x[i] ^= t
+
+    # Gray encode
+    for i in range(1, ndims):
+        x[i] ^= x[i - 1]
+
+    t = np.zeros_like(x[0])
+    for b in range(nbits - 1, 0, -1):
+        t ^= np.where((x[-1] & (1 << b)) != 0, (1 << b) - 1, 0)
+
+    # Interleave the bits of the transposed index to give the key
+    keys = np.zeros_like(x[0])
+    for b in range(nbits - 1, -1, -1):
+        for i in range(ndims):
+            keys = (keys << 1) | (((x[i] ^ t) >> b) & 1)
+
+    return keys
+
+
 def iter_struct(arr, n=1000, axis=0):
     for c in np.array_split(arr, -(arr.shape[axis] // -n) or 1, axis=axis):
         yield from c.tolist()
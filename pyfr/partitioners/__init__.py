@@ -1,4 +1,5 @@
 from pyfr.partitioners.base import BasePartitioner, write_partitioning
+from pyfr.partitioners.hilbert import HilbertPartitioner
 from pyfr.partitioners.kahip import KaHIPPartitioner
 from pyfr.partitioners.metis import METISPartitioner
 from pyfr.partitioners.reconstruct import reconstruct_partitioning
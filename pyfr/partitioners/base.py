@@ -2,7 +2,7 @@ from collections import namedtuple
 
 import numpy as np
 
-from pyfr.nputil import iter_struct
+from pyfr.nputil import hilbert_keys, iter_struct
 from pyfr.progress import NullProgressSequence
 
 
@@ -15,7 +15,7 @@ def write_partitioning(mesh, pname, pinfo):
 
     if ppath in mesh:
         mesh[f'{ppath}/eles'][:] = partitioning
-        del mesh[f'{ppath}/neighbours']
+        mesh[ppath].pop('neighbours', None)
     else:
         mesh[f'{ppath}/eles'] = partitioning
 
@@ -25,11 +25,16 @@ def write_partitioning(mesh, pname, pinfo):
 
 
 class BasePartitioner:
-    def __init__(self, partwts, elewts=None, nsubeles=64, opts={}):
+    # Whether the partitioner can run in parallel
+    has_mpi = False
+
+    def __init__(self, partwts, elewts=None, nsubeles=64, reorder=False,
+                 opts={}):
         self.partwts = partwts
         self.elewts = elewts
         self.nparts = len(partwts)
         self.nsubeles = nsubeles
+        self.reorder = reorder
 
         if not self.has_part_weights and len(set(partwts)) != 1:
             raise ValueError(f'Partitioner {self.name} does not support '
@@ -123,7 +128,7 @@ class BasePartitioner:
         return wts
 
     @staticmethod
-    def _construct_graph(con, elewts_fn, exwts={}):
+    def _construct_graph(con, elewts_fn, exwts=None):
         # Construct the dual graph
         con = np.vstack([con, con[:, ::-1]])
 
@@ -142,8 +147,8 @@ class BasePartitioner:
 
         # Prepare vertex weights
         vwts = elewts_fn(vemap)
-        for i, j in exwts.items():
-            vwts[np.searchsorted(vemap, i)] = j
+        if exwts is not None:
+            vwts[np.searchsorted(vemap, exwts[0])] = exwts[1]
 
         # Ensure vwts is always two dimensional
         vwts = vwts.reshape(len(vwts), -1)
@@ -157,36 +162,35 @@ class BasePartitioner:
     def _partition_graph(self, graph, partwts):
         pass
 
-    @classmethod
-    def _merge_con(cls, pmerge, l, r):
-        if l == r:
-            return
-
-        if l in pmerge and r in pmerge:
-            cls._merge_con(pmerge, pmerge[l], pmerge[r])
-        elif l in pmerge:
-            cls._merge_con(pmerge, pmerge[l], r)
-        elif r in pmerge:
-            cls._merge_con(pmerge, l, pmerge[r])
-        else:
-            pmerge[l] = r
-
     @staticmethod
-    def _resolve_merge(pmerge):
-        nmerge = {}
+    def _merge_eles(l, r):
+        # Compactly number the elements which are to be merged
+        eles, inv = np.unique(np.concatenate([l, r]), return_inverse=True)
+        l, r = inv[:len(l)], inv[len(l):]
 
-        for l, r in pmerge.items():
-            while (rr := pmerge.get(r)) is not None:
-                r = rr
+        # Perform a union-find with each element pointing to its parent
+        parent = np.arange(len(eles))
+        while True:
+            pl, pr = parent[l], parent[r]
+            if np.array_equal(pl, pr):
+                break
 
-            nmerge[l] = r
+            # Hook the larger of each pair of roots onto the smaller
+            np.minimum.at(parent, np.maximum(pl, pr), np.minimum(pl, pr))
 
-        return nmerge
+            # Jump pointers until every element points to its root
+            while not np.array_equal(pp := parent[parent], parent):
+                parent = pp
+
+        # Map each non-root element onto its root
+        mix = (parent != np.arange(len(eles))).nonzero()[0]
+
+        return eles[mix], eles[parent[mix]]
 
     @classmethod
     def _group_periodic_eles(cls, mesh, con, cdisps, elewts_fn):
         cdtype = [('l', np.int64), ('r', np.int64)]
-        pmerge, pidx = {}, []
+        pcons, pidx = [np.empty((0, 2), dtype=np.int64)], []
 
         # Sort the global connectivity array
         con = con[np.argsort(con[:, 0])]
@@ -211,47 +215,37 @@ class BasePartitioner:
 
             # Locate these entries in the connectivity array
             pidx.append(np.searchsorted(conv, pcon.view(cdtype).squeeze()))
+            pcons.append(pcon)
 
-            # Determine which elements require mering
-            for l, r in iter_struct(pcon.reshape(-1, 2)):
-                cls._merge_con(pmerge, l, r)
-
-        if pmerge:
-            pmerge = cls._resolve_merge(pmerge)
+        # Determine which elements require merging
+        pcon = np.vstack(pcons)
+        mfrom, mto = cls._merge_eles(pcon[:, 0], pcon[:, 1])
 
+        if len(mfrom):
             # Eliminate connectivity entries associated with periodic faces
             con = np.delete(con, np.hstack(pidx), axis=0)
 
-            mfrom = np.array(list(pmerge))
-            mto = np.array(list(pmerge.values()))
-
-            # Merge the associated elements on the left
-            ls = np.searchsorted(con[:, 0], mfrom, side='left')
-            le = np.searchsorted(con[:, 0], mfrom, side='right')
-            for s, e, t in zip(ls, le, mto):
-                con[s:e, 0] = t
-
-            # Merge the associated elements on the right
-            rix = np.argsort(con[:, 1])
-            rs = np.searchsorted(con[:, 1], mfrom, side='left', sorter=rix)
-            re = np.searchsorted(con[:, 1], mfrom, side='right', sorter=rix)
-            for s, e, t in zip(rs, re, mto):
-                con[rix[s:e], 1] = t
+            # Relabel the merged elements
+            midx = np.searchsorted(mfrom, con).clip(max=len(mfrom) - 1)
+            mmask = mfrom[midx] == con
+            con[mmask] = mto[midx[mmask]]
 
         # Tally up the weights for the merged elements
-        exwts = {j: elewts_fn(j) for j in set(pmerge.values())}
-        for i, j in pmerge.items():
-            exwts[j] = exwts[j] + elewts_fn(i)
+        mreps, minv = np.unique(mto, return_inverse=True)
+        mwts = elewts_fn(mreps)
+        np.add.at(mwts, minv, elewts_fn(mfrom))
 
-        return con, exwts, pmerge
+        return con, (mreps, mwts), (mfrom, mto)
 
     @staticmethod
     def _ungroup_periodic_eles(pmerge, vemap, vparts):
+        mfrom, mto = pmerge
+
         # For each merged element identify its partition number
-        pparts = vparts[np.searchsorted(vemap, list(pmerge.values()))]
+        pparts = vparts[np.searchsorted(vemap, mto)]
 
         # With this we can unmerge the elements and update the arrays
-        vemap = np.concatenate((vemap, list(pmerge)))
+        vemap = np.concatenate((vemap, mfrom))
         vparts = np.concatenate((vparts, pparts))
 
         # Sort by vemap to give the global element number partition array
@@ -289,9 +283,29 @@ class BasePartitioner:
 
         return neighbours, internal
 
+    @staticmethod
+    def _locality_keys(mesh, edisps):
+        nodes = mesh['nodes'].fields('location')[()]
+
+        # Compute the centroid of each element
+        cents = [nodes[mesh[f'eles/{etype}'].fields('nodes')[()]].mean(axis=1)
+                 for etype in edisps]
+        cents = np.vstack(cents)
+
+        # Map them onto an integer grid
+        nbits = 63 // cents.shape[1]
+        cmin, cmax = cents.min(axis=0), cents.max(axis=0)
+        scale = ((1 << nbits) - 1) / np.maximum(cmax - cmin, 1e-300)
+        ipts = ((cents - cmin)*scale).astype(np.int64)
+
+        # Order the elements along a Hilbert curve
+        return hilbert_keys(ipts, nbits)
+
     @classmethod
-    def construct_partitioning(cls, mesh, ecurved, edisps, con, vparts):
+    def construct_partitioning(cls, mesh, ecurved, edisps, con, vparts,
+                               reorder=False):
         nparts = vparts.max() + 1
+        lkeys = [cls._locality_keys(mesh, edisps)] if reorder else []
         etypes = np.arange(len(edisps))
         edisps = list(edisps.values())[1:]
 
@@ -313,8 +327,9 @@ class BasePartitioner:
         for i, p in enumerate(np.array_split(petype, edisps)):
             p[:] = i
 
-        # Sort by partition number, type, internal, and if curved or not
-        pidx = np.lexsort((ecurved, internal, petype, vparts))
+        # Sort by partition number, type, internal, if curved or not, and
+        # then, optionally, by position along a space-filling curve
+        pidx = np.lexsort((*lkeys, ecurved, internal, petype, vparts))
 
         # Apply this permutation to the various arrays
         peidx, petype, vparts = peidx[pidx], petype[pidx], vparts[pidx]
@@ -331,7 +346,7 @@ class BasePartitioner:
 
         return (peidx, pregions), (neighbours, nregions)
 
-    def partition(self, mesh, progress=NullProgressSequence):
+    def partition(self, mesh, progress=NullProgressSequence()):
         # Construct the global connectivity array
         with progress.start('Construct global connectivity array'):
             con, ecurved, edisps, cdisps = self.construct_global_con(mesh)
@@ -366,6 +381,6 @@ class BasePartitioner:
         # Construct the partitioning data
         with progress.start('Construct partitioning'):
             pinfo = self.construct_partitioning(mesh, ecurved, edisps, con,
-                                                vparts)
+                                                vparts, self.reorder)
 
         return pinfo
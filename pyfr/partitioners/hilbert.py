@@ -0,0 +1,229 @@
+import re
+
+import numpy as np
+
+from pyfr.mpiutil import get_comm_rank_root, get_start_end_csize, mpi
+from pyfr.nputil import hilbert_keys
+from pyfr.partitioners.base import BasePartitioner
+from pyfr.progress import NullProgressSequence
+
+
+class HilbertPartitioner(BasePartitioner):
+    name = 'hilbert'
+    has_part_weights = True
+    has_multiple_constraints = True
+    has_mpi = True
+
+    # Integer options
+    int_opts = set()
+
+    # Enumeration options
+    enum_opts = {}
+
+    # Default options
+    dflt_opts = {}
+
+    def _ele_centroids(self, mesh, edisps, start, end):
+        ndims = mesh['nodes'].dtype['location'].shape[0]
+        cents = [np.empty((0, ndims))]
+
+        for etype, disp in edisps.items():
+            einfo = mesh[f'eles/{etype}']
+
+            # Determine which of these elements are in our slice
+            a, b = max(start - disp, 0), min(end - disp, len(einfo))
+            if a >= b:
+                continue
+
+            # Read the nodes of these elements
+            enodes = einfo.fields('nodes')[a:b]
+            nmin, nmax = enodes.min(), enodes.max()
+            nodes = mesh['nodes'].fields('location')[nmin:nmax + 1]
+
+            cents.append(nodes[enodes - nmin].mean(axis=1))
+
+        return np.vstack(cents)
+
+    def _curve_keys(self, cents):
+        comm, rank, root = get_comm_rank_root()
+        ndims = cents.shape[1]
+        nbits = 63 // ndims
+
+        # Obtain the global bounding box
+        cmin = cents.min(axis=0, initial=np.inf)
+        cmax = cents.max(axis=0, initial=-np.inf)
+        comm.Allreduce(mpi.IN_PLACE, cmin, op=mpi.MIN)
+        comm.Allreduce(mpi.IN_PLACE, cmax, op=mpi.MAX)
+
+        # Map the centroids onto an integer grid
+        scale = ((1 << nbits) - 1) / np.maximum(cmax - cmin, 1e-300)
+        ipts = ((cents - cmin)*scale).astype(np.int64)
+
+        return hilbert_keys(ipts, nbits), ndims*nbits
+
+    def _cut_curve(self, keys, kbits, wts, fwts):
+        comm, rank, root = get_comm_rank_root()
+
+        # Sort our keys along with their weights
+        order = np.argsort(keys)
+        skeys, cwts = keys[order], np.concatenate(([0], np.cumsum(wts[order])))
+
+        # Total weight of all elements with keys less than a threshold
+        def wts_below(th):
+            w = cwts[np.searchsorted(skeys, th)]
+            comm.Allreduce(mpi.IN_PLACE, w, op=mpi.SUM)
+
+            return w
+
+        # Desired cumulative weights at each cut
+        pfrac = np.cumsum(self.partwts[:-1]) / sum(self.partwts)
+        wtot = comm.allreduce(cwts[-1], op=mpi.SUM) + fwts.sum()
+
+        # Account for elements which have already been placed
+        targets = np.maximum.accumulate(pfrac*wtot - np.cumsum(fwts[:-1]))
+
+        # Find, via bisection, where to cut the curve
+        lo = np.zeros(len(targets), dtype=np.int64)
+        hi = np.full(len(targets), (1 << kbits) - 1, dtype=np.int64)
+
+        for i in range(kbits):
+            mid = lo + (hi - lo) // 2
+            below = wts_below(mid) >= targets
+
+            hi, lo = np.where(below, mid, hi), np.where(below, lo, mid)
+
+        return np.searchsorted(hi, keys, side='right')
+
+    def _periodic_groups(self, mesh, edisps, econs_fn):
+        codec = [c.decode() for c in mesh['codec']]
+        pcons = [np.empty((0, 2), dtype=np.int64)]
+
+        # Map from cidx element types to their displacements
+        cdisps = np.zeros(len(codec), dtype=int)
+        for i, c in enumerate(codec):
+            if (m := re.match(r'eles/(\w+)/\d+$', c)):
+                cdisps[i] = edisps[m[1]]
+
+        # Obtain the periodic connectivity info
+        pfaces = mesh['periodic'] if 'periodic' in mesh else {}
+
+        for pcon in pfaces.values():
+            pcon = pcon[()].reshape(-1)
+            pcons.append((cdisps[pcon['cidx']] + pcon['off']).reshape(-1, 2))
+
+        # Determine which elements require merging
+        pcon = np.vstack(pcons)
+        mfrom, mto = self._merge_eles(pcon[:, 0], pcon[:, 1])
+
+        # List each element in a group along with its representative
+        mreps = np.unique(mto)
+        geles = np.concatenate([mfrom, mreps])
+        greps = np.concatenate([mto, mreps])
+        gcons = econs_fn(geles)
+
+        # Lead each group by its element with the lowest constraint index
+        order = np.lexsort((geles, gcons, greps))
+        geles, greps, gcons = geles[order], greps[order], gcons[order]
+        lead = np.diff(greps, prepend=-1) != 0
+        gidxs = np.cumsum(lead) - 1
+
+        # Return the followers, their groups, and the group leaders
+        return geles[~lead], gidxs[~lead], geles[lead], gcons[lead]
+
+    def _share_groups(self, vals, leaders, start, end, dflt):
+        comm, rank, root = get_comm_rank_root()
+
+        # Obtain the values associated with the group leaders
+        lvals = np.full(len(leaders), dflt, dtype=vals.dtype)
+        lloc = (leaders >= start) & (leaders < end)
+        lvals[lloc] = vals[leaders[lloc] - start]
+
+        comm.Allreduce(mpi.IN_PLACE, lvals, op=mpi.MAX)
+
+        return lvals
+
+    def partition(self, mesh, progress=NullProgressSequence()):
+        comm, rank, root = get_comm_rank_root()
+
+        # Displacements of each element type in the global numbering
+        neles = {etype: len(einfo) for etype, einfo in mesh['eles'].items()}
+        edisps, disp = {}, 0
+        for etype in sorted(neles):
+            edisps[etype], disp = disp, disp + neles[etype]
+
+        # Obtain the global element number weighting function
+        elewts_fn = self._get_elewts_fn(edisps)
+
+        # Determine which elements we are responsible for
+        start, end, _ = get_start_end_csize(comm, disp)
+        ncons = np.size(elewts_fn(0))
+        ewts = elewts_fn(np.arange(start, end)).reshape(-1, ncons)
+        econs = ewts.argmax(axis=1)
+
+        # Assign each element to the constraint it contributes most to
+        def econs_fn(e):
+            return elewts_fn(e).reshape(-1, ncons).argmax(axis=1)
+
+        # Order our elements along a Hilbert curve
+        with progress.start('Compute Hilbert curve'):
+            cents = self._ele_centroids(mesh, edisps, start, end)
+            keys, kbits = self._curve_keys(cents)
+
+        # Group together periodically connected elements
+        with progress.start('Group periodic elements'):
+            pgroups = self._periodic_groups(mesh, edisps, econs_fn)
+            feles, fgidxs, leaders, lcons = pgroups
+
+            # Have our followers adopt the keys of their leaders
+            floc = (feles >= start) & (feles < end)
+            feles, fgidxs = feles[floc] - start, fgidxs[floc]
+
+            lkeys = self._share_groups(keys, leaders, start, end, 0)
+            keys[feles] = lkeys[fgidxs]
+
+        # Cut the curve separately for each weighting constraint
+        with progress.start('Partition curve'):
+            vparts = np.full(end - start, -1, dtype=np.int32)
+            lparts = np.full(len(leaders), -1, dtype=np.int32)
+
+            for i in range(ewts.shape[1]):
+                # Place followers whose leader has already been placed
+                fix = (econs[feles] == i) & (lcons[fgidxs] < i)
+                fix, fparts = feles[fix], lparts[fgidxs[fix]]
+                vparts[fix] = fparts
+
+                fwts = np.bincount(fparts, weights=ewts[fix, i],
+                                   minlength=self.nparts)
+                comm.Allreduce(mpi.IN_PLACE, fwts, op=mpi.SUM)
+
+                # Cut the curve for the remaining elements
+                cix = ((econs == i) & (vparts < 0)).nonzero()[0]
+                vparts[cix] = self._cut_curve(keys[cix], kbits, ewts[cix, i],
+                                              fwts)
+
+                # Note where the group leaders have been placed
+                lparts = self._share_groups(vparts, leaders, start, end, -1)
+
+        # Gather the partition numbers to the root rank
+        counts = comm.gather(len(vparts), root=root)
+        if rank != root:
+            comm.Gatherv(vparts, None, root=root)
+            return None
+
+        gvparts = np.empty(disp, dtype=np.int32)
+        comm.Gatherv(vparts, (gvparts, counts), root=root)
+
+        if (n := len(np.unique(gvparts))) != self.nparts:
+            raise RuntimeError(f'Partitioner error: mesh has {n} parts '
+                               f'versus goal of {self.nparts}')
+
+        # Construct the global connectivity array
+        with progress.start('Construct global connectivity array'):
+            con, ecurved, edisps, cdisps = self.construct_global_con(mesh)
+
+        # Construct the partitioning data
+        with progress.start('Construct partitioning'):
+            pinfo = self.construct_partitioning(mesh, ecurved, edisps, con,
+                                                gvparts, self.reorder)
+
+        return pinfo
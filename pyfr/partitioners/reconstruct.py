@@ -8,7 +8,8 @@ from pyfr.partitioners.base import BasePartitioner
 from pyfr.progress import NullProgressSequence
 
 
-def reconstruct_partitioning(mesh, soln, progress=NullProgressSequence):
+def reconstruct_partitioning(mesh, soln, progress=NullProgressSequence(),
+                             reorder=False):
     if mesh['mesh-uuid'][()] != soln['mesh-uuid'][()]:
         raise ValueError('Invalid solution for mesh')
 
@@ -46,6 +47,6 @@ def reconstruct_partitioning(mesh, soln, progress=NullProgressSequence):
     # Construct the partitioning data
     with progress.start('Construct partitioning'):
         pinfo = BasePartitioner.construct_partitioning(mesh, ecurved, edisps,
-                                                       con, vparts)
+                                                       con, vparts, reorder)
 
     return pinfo
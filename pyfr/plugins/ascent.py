@@ -545,8 +545,11 @@ class AscentPlugin(BaseSolnPlugin):
         self._renderer = _AscentRenderer(_IntegratorAdapter(intg, cfgsect),
                                          intg.isrestart)
 
+    def _is_due(self, intg):
+        return intg.nacptsteps % self.nsteps == 0
+
     def __call__(self, intg):
-        if intg.nacptsteps % self.nsteps == 0:
+        if self._is_due(intg):
             self._renderer.render(_IntegratorAdapter(intg, self.cfgsect))
 
 
@@ -135,6 +135,13 @@ class BasePlugin:
     def __call__(self, intg):
         pass
 
+    def _is_due(self, intg):
+        # Assume that we will access the solution when next called
+        return True
+
+    def needs_sync(self, intg):
+        return self._is_due(intg)
+
     def serialise(self, intg):
         return {}
 
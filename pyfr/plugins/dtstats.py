@@ -26,6 +26,10 @@ class DtStatsPlugin(BaseSolnPlugin):
         else:
             self.outf = None
 
+    def needs_sync(self, intg):
+        # All of our data is already on the host
+        return False
+
     def __call__(self, intg):
         # Process the sequence of rejected/accepted steps
         for i, (dt, act, err) in enumerate(intg.stepinfo, start=self.count):
@@ -165,9 +165,12 @@ class FluidForcePlugin(SurfaceMixin, BaseSolnPlugin):
     def _write_hdf5(self, t, forces):
         self._forces(np.concatenate(([t], forces.ravel())))
 
+    def _is_due(self, intg):
+        return intg.nacptsteps % self.nsteps == 0
+
     def __call__(self, intg):
         # Return if no output is due
-        if intg.nacptsteps % self.nsteps:
+        if not self._is_due(intg):
             return
 
         # MPI info
@@ -198,13 +198,14 @@ class FWHPlugin(SurfaceMixin, BaseSolnPlugin):
 
         return o_vals / (4*np.pi)
 
-    def __call__(self, intg):
-        if intg.tcurr < self.tstart:
-            return
+    def _is_due(self, intg):
+        return (intg.tcurr >= self.tstart and
+                intg.tcurr - self.dt >= self.t_last - self.tol)
 
+    def __call__(self, intg):
         comm, rank, root = get_comm_rank_root()
 
-        if intg.tcurr - self.dt >= self.t_last - self.tol:
+        if self._is_due(intg):
             self.t_last = intg.tcurr
 
             o_vals = self._fwh_solve(intg)
@@ -205,8 +205,11 @@ class IntegratePlugin(BaseSolnPlugin):
 
         return intvals
 
+    def _is_due(self, intg):
+        return intg.nacptsteps % self.nsteps == 0
+
     def __call__(self, intg):
-        if intg.nacptsteps % self.nsteps == 0:
+        if self._is_due(intg):
             # MPI info
             comm, rank, root = get_comm_rank_root()
 
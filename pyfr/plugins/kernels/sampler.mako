@@ -0,0 +1,34 @@
+<%inherit file='base'/>
+<%namespace module='pyfr.backends.base.makoutil' name='pyfr'/>
+
+<%pyfr:kernel name='sampler' ndim='1'
+              op='in fpdtype_t[${str(nupts)}]'
+              u='in view fpdtype_t[${str(nupts)}][${str(nvars)}]'
+              gradu='in view fpdtype_t[${str(ndims*nupts)}][${str(nvars)}]'
+              out='out fpdtype_t[${str(nsvars)}]'>
+    fpdtype_t acc[${nsvars}];
+% for i in range(nsvars):
+    acc[${i}] = 0;
+% endfor
+
+    // Interpolate the solution, and optionally its gradient, to the point
+    for (int j = 0; j < ${nupts}; j++)
+    {
+        fpdtype_t w = op[j];
+
+    % for i in range(nvars):
+        acc[${i}] += w*u[j][${i}];
+    % endfor
+    % if grads:
+    % for i in range(nvars):
+    % for d in range(ndims):
+        acc[${nvars + i*ndims + d}] += w*gradu[${d*nupts} + j][${i}];
+    % endfor
+    % endfor
+    % endif
+    }
+
+% for i in range(nsvars):
+    out[${i}] = acc[${i}];
+% endfor
+</%pyfr:kernel>
@@ -0,0 +1,68 @@
+<%inherit file='base'/>
+<%namespace module='pyfr.backends.base.makoutil' name='pyfr'/>
+
+<%pyfr:kernel name='tavg' ndim='2'
+              u='in fpdtype_t[${str(nvars)}]'
+              gradu='in fpdtype_t[${str(ndims)}][${str(nvars)}]'
+              prev='inout fpdtype_t[${str(nexprs)}]'
+              acc='inout fpdtype_t[${str(nexprs)}]'
+              vacc='inout fpdtype_t[${str(nexprs)}]'
+              wacc='scalar fpdtype_t'
+              wvar='scalar fpdtype_t'
+              wtot='scalar fpdtype_t'>
+    // Convert to primitive variables
+    fpdtype_t q[${nvars}];
+% if ac:
+% for i in range(nvars):
+    q[${i}] = u[${i}];
+% endfor
+% else:
+    fpdtype_t invrho = 1.0/u[0];
+
+    q[0] = u[0];
+% for i in range(ndims):
+    q[${i + 1}] = invrho*u[${i + 1}];
+% endfor
+    q[${nvars - 1}] = ${c['gamma'] - 1}*(u[${nvars - 1}] - 0.5*invrho*${pyfr.dot('u[{i}]', i=(1, ndims + 1))});
+% endif
+
+% if grads:
+    // Convert to primitive gradients
+    fpdtype_t gradq[${ndims}][${nvars}];
+% for j in range(ndims):
+% if ac:
+% for i in range(nvars):
+    gradq[${j}][${i}] = gradu[${j}][${i}];
+% endfor
+% else:
+    gradq[${j}][0] = gradu[${j}][0];
+% for i in range(ndims):
+    gradq[${j}][${i + 1}] = invrho*(gradu[${j}][${i + 1}] - q[${i + 1}]*gradu[${j}][0]);
+% endfor
+    gradq[${j}][${nvars - 1}] = ${c['gamma'] - 1}*(gradu[${j}][${nvars - 1}] - 0.5*(${pyfr.dot('q[{i}]', f'gradu[{j}][{{i}}]', i=(1, ndims + 1))} + ${pyfr.dot('u[{i}]', f'gradq[{j}][{{i}}]', i=(1, ndims + 1))}));
+% endif
+% endfor
+% endif
+
+    // Evaluate the expressions
+    fpdtype_t cex[] = { ${', '.join(exprs)} };
+
+% for i in range(nexprs):
+% if init:
+    prev[${i}] = cex[${i}];
+% else:
+    {
+        fpdtype_t p = prev[${i}], c = cex[${i}], ppc = p + c;
+
+        // Accumulate the average
+        acc[${i}] += wacc*ppc;
+
+        // Accumulate the variance
+        vacc[${i}] += wacc*(p*p + c*c - 0.5*ppc*ppc)
+                    + wvar*(acc[${i}] - wtot*ppc)*(acc[${i}] - wtot*ppc);
+
+        prev[${i}] = c;
+    }
+% endif
+% endfor
+</%pyfr:kernel>
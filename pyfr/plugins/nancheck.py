@@ -1,5 +1,4 @@
-import numpy as np
-
+from pyfr.cache import memoize
 from pyfr.plugins.base import BaseSolnPlugin
 
 
@@ -9,12 +8,32 @@ class NaNCheckPlugin(BaseSolnPlugin):
     formulations = ['dual', 'std']
     dimensions = [2, 3]
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    def __init__(self, intg, *args, **kwargs):
+        super().__init__(intg, *args, **kwargs)
 
         self.nsteps = self.cfg.getint(self.cfgsect, 'nsteps')
 
+        self.backend = intg.backend
+        self.system = intg.system
+
+    @memoize
+    def _get_nonfinite_kerns(self, uidx):
+        return [self.backend.kernel('reduction', em[uidx], method='nonfinite',
+                                    norm='uniform')
+                for em in self.system.ele_banks]
+
+    def _is_due(self, intg):
+        return intg.nacptsteps % self.nsteps == 0
+
+    def needs_sync(self, intg):
+        # Our kernels are queued after the step and waited upon directly
+        return False
+
     def __call__(self, intg):
-        if intg.nacptsteps % self.nsteps == 0:
-            if any(np.isnan(np.sum(s)) for s in intg.soln):
+        if self._is_due(intg):
+            # Flag any non-finite values on the device
+            kerns = self._get_nonfinite_kerns(intg.soln_bank)
+            self.backend.run_kernels(kerns, wait=True)
+
+            if any(k.retval.any() for k in kerns):
                 intg.plugin_abort(f'NaNs detected at t = {intg.tcurr}')
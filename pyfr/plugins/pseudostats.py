@@ -29,6 +29,10 @@ class PseudoStatsPlugin(BaseSolnPlugin):
         else:
             self.outf = None
 
+    def needs_sync(self, intg):
+        # All of our data is already on the host
+        return False
+
     def __call__(self, intg):
         # Process the sequence of pseudo-residuals
         for (npiter, iternr, resid) in intg.pseudostepinfo:
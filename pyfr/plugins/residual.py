@@ -39,9 +39,12 @@ class ResidualPlugin(BaseSolnPlugin):
             # Open
             self.outf = init_csv(self.cfg, cfgsect, ','.join(header))
 
+    def _is_due(self, intg):
+        return intg.nacptsteps % self.nsteps == 0 and intg.nacptsteps
+
     def __call__(self, intg):
         # If an output is due this step
-        if intg.nacptsteps % self.nsteps == 0 and intg.nacptsteps:
+        if self._is_due(intg):
             # MPI info
             comm, rank, root = get_comm_rank_root()
 
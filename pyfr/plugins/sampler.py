@@ -1,10 +1,12 @@
 from argparse import FileType
+from collections import defaultdict
 from pathlib import Path
 import re
 
 import h5py
 import numpy as np
 
+from pyfr.cache import memoize
 from pyfr.mpiutil import get_comm_rank_root, init_mpi
 from pyfr.plugins.base import (BaseCLIPlugin, BaseSolnPlugin, DatasetAppender,
                                cli_external, init_csv, open_hdf5_a)
@@ -97,6 +99,9 @@ class SamplerPlugin(BaseSolnPlugin):
         self.psampler = PointSampler(intg.system.mesh, spts)
         self.psampler.configure_with_intg_nvars(intg, self.nsvars)
 
+        # Sampling kernels
+        self._init_kernels(intg)
+
         # Have the root rank open the output file
         if rank == root:
             match self.cfg.get(cfgsect, 'file-format', 'csv'):
@@ -107,6 +112,67 @@ class SamplerPlugin(BaseSolnPlugin):
                 case _:
                     raise ValueError('Invalid file format')
 
+    def _init_kernels(self, intg):
+        self.backend = backend = intg.backend
+        self.system = system = intg.system
+
+        # Register our pointwise kernel
+        backend.pointwise.register('pyfr.plugins.kernels.sampler')
+
+        # Group our points by element type
+        eptinfo = defaultdict(list)
+        for et, ei, idxs, ops in self.psampler.pinfo:
+            for i, op in zip(np.atleast_1d(idxs), ops):
+                eptinfo[et].append((i, ei, op))
+
+        # Allocate the interpolation operators and outputs on the device
+        self._sinfo = []
+        for et, info in sorted(eptinfo.items()):
+            idxs, eidxs, ops = zip(*info)
+
+            opmat = backend.const_matrix(np.array(ops).T)
+            outmat = backend.matrix((self.nsvars, len(idxs)), tags={'align'})
+
+            self._sinfo.append((et, np.array(idxs), np.array(eidxs), opmat,
+                                outmat))
+
+        backend.commit()
+
+    def _ele_view(self, mat, eidxs, vshape):
+        n = len(eidxs)
+        zeros, ones = np.zeros(n, dtype=int), np.ones(n, dtype=int)
+
+        return self.backend.view(mat.mid*ones, zeros, eidxs, ones, vshape)
+
+    @memoize
+    def _get_samp_kerns(self, uidx):
+        system, kerns = self.system, []
+        tplargs = {'ndims': self.ndims, 'nvars': self.nvars,
+                   'nsvars': self.nsvars, 'grads': self._sample_grads}
+
+        for et, idxs, eidxs, opmat, outmat in self._sinfo:
+            nupts, nvars, neles = system.ele_shapes[system.ele_types[et]]
+
+            # View the solution in the elements containing our points
+            umat = system.ele_banks[et][uidx]
+            kargs = {'u': self._ele_view(umat, eidxs, (nupts, nvars)),
+                     'op': opmat, 'out': outmat}
+
+            # Along with its gradient
+            if self._sample_grads:
+                gmat = system.eles_vect_upts[et]
+                kargs['gradu'] = self._ele_view(gmat, eidxs,
+                                                (self.ndims*nupts, nvars))
+
+            kerns.append(self.backend.kernel(
+                'sampler', tplargs=tplargs | {'nupts': nupts},
+                dims=[len(idxs)], **kargs
+            ))
+
+        self.backend.commit()
+
+        return kerns
+
     def _init_csv(self, intg):
         self.outf = init_csv(self.cfg, self.cfgsect, self._header(intg))
         self._write = self._write_csv
@@ -167,23 +233,30 @@ class SamplerPlugin(BaseSolnPlugin):
 
         return ','.join(colnames)
 
+    def _is_due(self, intg):
+        return intg.nacptsteps % self.nsteps == 0
+
     def __call__(self, intg):
         # Return if no output is due
-        if intg.nacptsteps % self.nsteps:
+        if not self._is_due(intg):
             return
 
-        # Fetch the solution
-        soln = list(intg.soln)
+        uidx = intg.soln_bank
 
-        # If requested also fetch solution gradients
+        # If requested compute the solution gradients
         if self._sample_grads:
-            for i, g in enumerate(intg.grad_soln):
-                g = g.transpose(1, 2, 0, 3)
-                g = g.reshape(len(g), self.ndims*self.nvars, -1)
-                soln[i] = np.hstack([soln[i], g])
+            self.system.compute_grads(intg.tcurr, uidx)
+
+        # Perform the sampling on the device
+        self.backend.run_kernels(self._get_samp_kerns(uidx), wait=True)
+
+        # Copy back the samples
+        samples = np.empty((self.psampler.pcount, self.nsvars))
+        for et, idxs, eidxs, opmat, outmat in self._sinfo:
+            samples[idxs] = outmat.get().T
 
-        # Perform the sampling
-        samps = self.psampler.sample(soln, process=self._process)
+        # Post-process and gather them to the root rank
+        samps = self.psampler.gather(samples, process=self._process)
 
         # If we're the root rank then output
         if samps is not None:
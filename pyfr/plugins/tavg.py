@@ -1,8 +1,10 @@
+import math
 import re
 
 import h5py
 import numpy as np
 
+from pyfr.cache import memoize
 from pyfr.inifile import Inifile
 from pyfr.mpiutil import get_comm_rank_root, mpi
 from pyfr.nputil import npeval
@@ -82,7 +84,8 @@ class TavgPlugin(PostactionMixin, RegionMixin, TavgMixin, BaseSolnPlugin):
         ershapes = {etype: (nfields, emap[etype].nupts) for etype in erdata}
 
         # Construct the file writer
-        self._writer = NativeWriter(intg, basedir, basename, 'tavg')
+        self._writer = NativeWriter(intg, basedir, basename, 'tavg',
+                                    cfgsect=cfgsect)
         self._writer.set_shapes_eidxs(ershapes, erdata)
 
         # Asynchronous output options
@@ -91,6 +94,9 @@ class TavgPlugin(PostactionMixin, RegionMixin, TavgMixin, BaseSolnPlugin):
         # Gradient pre-processing
         self._init_gradients()
 
+        # Accumulation kernels
+        self._init_kernels(intg)
+
         # Time averaging parameters
         self.tstart = self.cfg.getfloat(cfgsect, 'tstart', 0.0)
         self.dtout = self.cfg.getfloat(cfgsect, 'dt-out')
@@ -150,46 +156,93 @@ class TavgPlugin(PostactionMixin, RegionMixin, TavgMixin, BaseSolnPlugin):
         self._gradpinfo = [(pname, self.privars.index(pname))
                            for pname in gradpnames]
 
-    def _init_accumex(self, intg):
-        self.tstart_acc = self.prevt = self.tout_last = intg.tcurr
-        self.prevex = self._eval_acc_exprs(intg)
-        self.accex = [np.zeros_like(p, dtype=np.float64) for p in self.prevex]
-        self.vaccex = [np.zeros_like(a) for a in self.accex]
+    def _init_kernels(self, intg):
+        self.backend = backend = intg.backend
+        self.system = intg.system
+        cfg, cfgsect = self.cfg, self.cfgsect
 
-    def _eval_acc_exprs(self, intg):
-        exprs = []
+        # Register our pointwise kernel
+        backend.pointwise.register('pyfr.plugins.kernels.tavg')
+
+        # Substitutions for the expressions
+        subs = cfg.items('constants')
+        subs |= dict(abs='fabs', max='fmax', min='fmin', pi=math.pi)
+        subs |= {v: f'q[{i}]' for i, v in enumerate(self.privars)}
+        subs |= {f'grad_{v}_{d}': f'gradq[{j}][{i}]'
+                 for i, v in enumerate(self.privars)
+                 for j, d in enumerate('xyz'[:self.ndims])}
+
+        self._tplargs = {
+            'ndims': self.ndims, 'nvars': len(self.privars),
+            'nexprs': len(self.anames), 'grads': bool(self._gradpinfo),
+            'ac': intg.system.name.startswith('ac'),
+            'c': cfg.items_as('constants', float),
+            'exprs': [cfg.getexpr(cfgsect, f'avg-{an}', subs=subs)
+                      for an in self.anames]
+        }
+
+        # Allocate the device-side accumulators for each element type
+        self._accmats = []
+        for idx, etype, rgn in self._ele_regions:
+            nupts, nvars, neles = intg.system.ele_shapes[etype]
+            shape = (nupts, len(self.anames), neles)
 
-        # Compute the gradients
-        if self._gradpinfo:
-            grad_soln = intg.grad_soln
+            self._accmats.append([backend.matrix(shape, tags={'align'})
+                                  for i in range(3)])
 
-        # Iterate over each element type in the simulation
-        for idx, etype, rgn in self._ele_regions:
-            soln = intg.soln[idx][..., rgn].swapaxes(0, 1)
+        backend.commit()
+
+    @memoize
+    def _get_acc_kerns(self, uidx, init):
+        system, kerns = self.system, []
+        tplargs = self._tplargs | {'init': init}
 
-            # Convert from conservative to primitive variables
-            psolns = self.elementscls.con_to_pri(soln, self.cfg)
+        for (idx, etype, rgn), (prev, acc, vacc) in zip(self._ele_regions,
+                                                       self._accmats):
+            nupts, nvars, neles = system.ele_shapes[etype]
+            kargs = {'u': system.ele_banks[idx][uidx], 'prev': prev}
 
-            # Prepare the substitutions dictionary
-            subs = dict(zip(self.privars, psolns))
+            if not init:
+                kargs |= {'acc': acc, 'vacc': vacc}
 
-            # Prepare any required gradients
             if self._gradpinfo:
-                grads = np.rollaxis(grad_soln[idx], 2)[..., rgn]
+                kargs['gradu'] = system.eles_vect_upts[idx]
+
+            kerns.append(self.backend.kernel(
+                'tavg', tplargs=tplargs, dims=[nupts, neles],
+                **kargs
+            ))
+
+        return kerns
+
+    def _run_acc_kerns(self, intg, init, **weights):
+        uidx = intg.soln_bank
+
+        # Compute the gradients
+        if self._gradpinfo:
+            self.system.compute_grads(intg.tcurr, uidx)
+
+        kerns = self._get_acc_kerns(uidx, init)
+        if weights:
+            for k in kerns:
+                k.bind(**weights)
 
-                # Transform from conservative to primitive gradients
-                pgrads = self.elementscls.grad_con_to_pri(soln, grads,
-                                                          self.cfg)
+        self.backend.run_kernels(kerns)
 
-                # Add them to the substitutions dictionary
-                for pname, idx in self._gradpinfo:
-                    for dim, grad in zip('xyz', pgrads[idx]):
-                        subs[f'grad_{pname}_{dim}'] = grad
+    def _init_accumex(self, intg):
+        self.tstart_acc = self.prevt = self.tout_last = intg.tcurr
+        self._run_acc_kerns(intg, True)
 
-            # Evaluate the expressions
-            exprs.append(np.array([npeval(v, subs) for v in self.aexprs]))
+    def _get_accumex(self):
+        accex, vaccex = [], []
 
-        return exprs
+        # Copy the accumulators back from the device
+        for (idx, etype, rgn), (prev, acc, vacc) in zip(self._ele_regions,
+                                                       self._accmats):
+            for m, ex in [(acc, accex), (vacc, vaccex)]:
+                ex.append(m.get()[..., rgn].swapaxes(0, 1).astype(np.float64))
+
+        return accex, vaccex
 
     def _eval_fun_exprs(self, avars):
         subs = dict(zip(self.anames, avars))
@@ -214,25 +267,14 @@ class TavgPlugin(PostactionMixin, RegionMixin, TavgMixin, BaseSolnPlugin):
 
         return exprs, fv
 
-    def _acc_avg_var(self, intg, currex):
-        prevex, vaccex, accex = self.prevex, self.vaccex, self.accex
-
+    def _acc_avg_var(self, intg):
         # Weights for online variance and average
         Wmp1mpn = intg.tcurr - self.prevt
         W1mpn = intg.tcurr - self.tstart_acc
         Wp = 2*(W1mpn - Wmp1mpn)*W1mpn
+        Wv = Wmp1mpn / Wp if self.tstart_acc != self.prevt else 0
 
-        # Iterate over each element type
-        for v, a, p, c in zip(vaccex, accex, prevex, currex):
-            ppc = p + c
-
-            # Accumulate average
-            a += Wmp1mpn*ppc
-
-            # Accumulate variance
-            v += Wmp1mpn*(p**2 + c**2 - 0.5*ppc**2)
-            if self.tstart_acc != self.prevt:
-                v += (Wmp1mpn / Wp)*(a - W1mpn*ppc)**2
+        self._run_acc_kerns(intg, False, wacc=Wmp1mpn, wvar=Wv, wtot=W1mpn)
 
     def _prepare_meta(self, intg, std_max, std_sum):
         comm, rank, root = get_comm_rank_root()
@@ -272,7 +314,7 @@ class TavgPlugin(PostactionMixin, RegionMixin, TavgMixin, BaseSolnPlugin):
                     'mesh-uuid': intg.mesh_uuid}
 
     def _prepare_data(self, intg):
-        accex, vaccex = self.accex, self.vaccex
+        accex, vaccex = self._get_accumex()
         nacc, nfun = len(self.anames), len(self.fnames)
         tavg = []
 
@@ -332,6 +374,20 @@ class TavgPlugin(PostactionMixin, RegionMixin, TavgMixin, BaseSolnPlugin):
         # Write to disk and return the writer callback
         return data, metadata
 
+    def _write_due(self, intg):
+        return intg.tcurr - self.tout_last >= self.dtout - self.tol
+
+    def _accum_due(self, intg):
+        return intg.nacptsteps % self.nsteps == 0
+
+    def _is_due(self, intg):
+        # The solution is needed on start-up, and to write or accumulate
+        if intg.tcurr < self.tstart:
+            return False
+        else:
+            return (not self._started or self._write_due(intg) or
+                    self._accum_due(intg))
+
     def __call__(self, intg):
         # If we are not supposed to be averaging yet then return
         if intg.tcurr < self.tstart:
@@ -345,19 +401,14 @@ class TavgPlugin(PostactionMixin, RegionMixin, TavgMixin, BaseSolnPlugin):
             self._started = True
 
         # See if we are due to write and/or accumulate this step
-        dowrite = intg.tcurr - self.tout_last >= self.dtout - self.tol
-        doaccum = intg.nacptsteps % self.nsteps == 0
+        dowrite, doaccum = self._write_due(intg), self._accum_due(intg)
 
         if dowrite or doaccum:
-            # Evaluate the time averaging expressions
-            currex = self._eval_acc_exprs(intg)
-
-            # Accumulate them; always do this even when just writing
-            self._acc_avg_var(intg, currex)
+            # Accumulate the expressions; always do this even when writing
+            self._acc_avg_var(intg)
 
-            # Save the time and solution
+            # Save the time
             self.prevt = intg.tcurr
-            self.prevex = currex
 
             if dowrite:
                 # Prepare the data and metadata
@@ -374,9 +425,9 @@ class TavgPlugin(PostactionMixin, RegionMixin, TavgMixin, BaseSolnPlugin):
 
                 # Reset the accumulators
                 if self.mode == 'windowed':
-                    for a, v in zip(self.accex, self.vaccex):
-                        a.fill(0)
-                        v.fill(0)
+                    for prev, acc, vacc in self._accmats:
+                        acc.set(np.zeros(acc.ioshape))
+                        vacc.set(np.zeros(vacc.ioshape))
 
                     self.tstart_acc = intg.tcurr
 
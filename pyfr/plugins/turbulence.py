@@ -104,8 +104,11 @@ class TurbulencePlugin(BaseSolverPlugin):
         if not bool(self.vortstructs):
             self.tnext = float('inf')
 
+    def _is_due(self, intg):
+        return intg.tcurr + intg._dt >= self.tnext
+
     def __call__(self, intg):
-        if intg.tcurr + intg._dt < self.tnext:
+        if not self._is_due(intg):
             return
 
         for etype, vs in self.vortstructs.items():
@@ -119,6 +122,9 @@ class TurbulencePlugin(BaseSolverPlugin):
 
         self.tnext = min(self.trcl.values())
 
+        # Our eddies are an input to the right hand side
+        intg.plugin_changed_rhs()
+
     def update_buf(self, strms, strmsid, buf, tnext):
         trcltmp = float('inf')
         for ele, strm in strms.items():
@@ -31,7 +31,8 @@ class WriterPlugin(PostactionMixin, RegionMixin, BaseSolnPlugin):
         ershapes = {etype: (nvars, emap[etype].nupts) for etype in erdata}
 
         # Construct the solution writer
-        self._writer = NativeWriter(intg, basedir, basename, 'soln')
+        self._writer = NativeWriter(intg, basedir, basename, 'soln',
+                                    cfgsect=cfgsect)
         self._writer.set_shapes_eidxs(ershapes, erdata)
 
         # Asynchronous output options
@@ -107,10 +108,13 @@ class WriterPlugin(PostactionMixin, RegionMixin, BaseSolnPlugin):
 
         return data
 
+    def _is_due(self, intg):
+        return intg.tcurr - self.tout_last >= self.dt_out - self.tol
+
     def __call__(self, intg):
         self._writer.probe()
 
-        if intg.tcurr - self.tout_last < self.dt_out - self.tol:
+        if not self._is_due(intg):
             return
 
         # Prepare the data and metadata
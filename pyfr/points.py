@@ -1,22 +1,25 @@
 from collections import defaultdict
+import itertools as it
 
 import numpy as np
-from rtree.index import Index, Property
 
 from pyfr.cache import memoize
-from pyfr.mpiutil import get_comm_rank_root, get_start_end_csize, mpi
+from pyfr.mpiutil import get_comm_rank_root, mpi
 from pyfr.polys import get_polybasis
 from pyfr.shapes import BaseShape
 from pyfr.util import subclass_where
 
 
 class PointLocator:
-    def __init__(self, mesh, fine_order=6):
+    def __init__(self, mesh, fine_order=6, bbox_pad=0.05, chunk_size=4096):
         self.mesh = mesh
         self.fine_order = fine_order
+        self.bbox_pad = bbox_pad
+        self.chunk_size = chunk_size
 
     def locate(self, pts):
         comm, rank, root = get_comm_rank_root()
+        pts = np.asarray(pts, dtype=float)
 
         # Allocate the location buffer
         dtype = [('dist', float), ('cidx', np.int16), ('eidx', np.int64),
@@ -24,30 +27,26 @@ class PointLocator:
         locs = np.zeros(len(pts), dtype=dtype)
         locs['dist'] = np.inf
 
-        # Find the nearest node to each query point
-        nearest = self._find_closest_node(pts)
-
         # Reduce over each of our element types
         for etype, eidxs in self.mesh.eidxs.items():
             cidx = self.mesh.codec.index(f'eles/{etype}')
 
-            eclosest = self._find_closest_element(etype, pts, nearest)
-            for i, (dist, eidx, tloc) in eclosest.items():
-                l = locs[i]
+            pidx, dists, eidx, tlocs = self._find_closest_element(etype, pts)
+
+            mask = dists < locs['dist'][pidx]
+            pidx = pidx[mask]
 
-                if dist < l['dist']:
-                    l['dist'], l['tloc'] = dist, tloc
-                    l['cidx'], l['eidx'] = cidx, eidxs[eidx]
+            locs['dist'][pidx], locs['tloc'][pidx] = dists[mask], tlocs[mask]
+            locs['cidx'][pidx], locs['eidx'][pidx] = cidx, eidxs[eidx[mask]]
 
         # Reduce
         self._minloc(comm.Allreduce, mpi.IN_PLACE, locs, ndim=3)
 
         # Validate
-        if rank == root:
-            for i, l in enumerate(locs):
-                if l['dist'] == np.inf:
-                    ploc = ', '.join(str(p) for p in pts[i])
-                    raise ValueError(f'Unable to locate point ({ploc})')
+        if rank == root and np.isinf(locs['dist']).any():
+            i = np.isinf(locs['dist']).argmax()
+            ploc = ', '.join(str(p) for p in pts[i])
+            raise ValueError(f'Unable to locate point ({ploc})')
 
         return locs
 
@@ -86,76 +85,118 @@ class PointLocator:
         finally:
             op.Free()
 
-    def _find_closest_node(self, pts):
-        comm, rank, root = get_comm_rank_root()
-
-        # Read our portion of the nodes table
-        start, end, _ = get_start_end_csize(comm, len(self.mesh.raw['nodes']))
-        nodes = self.mesh.raw['nodes'][start:end]['location']
-
-        # Insert these points into a spatial index
-        props = Property(dimension=self.mesh.ndims, interleaved=True)
-        ins = ((i, [*p, *p], None) for i, p in enumerate(nodes))
-        idx = Index(ins, properties=props)
-
-        # Query the index to find our closest node
-        nearest = np.array([next(idx.nearest([*p, *p], 1)) for p in pts])
-
-        buf = np.empty(len(pts), dtype=[('dist', float), ('idx', int)])
-        buf['dist'] = np.linalg.norm(pts - nodes[nearest], axis=1)
-        buf['idx'] = nearest + start
-
-        self._minloc(comm.Allreduce, mpi.IN_PLACE, buf)
-
-        return buf
-
-    def _find_closest_element(self, etype, pts, nearest):
+    def _find_candidates(self, etype, pts):
         spts = self.mesh.spts[etype]
-        nodes = self.mesh.spts_nodes[etype]
 
-        # See which of our elements contain the nearest node
-        eidx, nidx = np.isin(nodes, nearest['idx']).nonzero()
-
-        # Create a map from node number to element indices
-        neles = defaultdict(set)
-        for ei, ni in zip(eidx, nodes[eidx, nidx]):
-            neles[ni].add(ei)
+        if not spts.shape[1]:
+            return np.empty((2, 0), dtype=int)
+
+        # Bounding boxes of our elements, padded to allow for curvature
+        bmin, bmax = spts.min(axis=0), spts.max(axis=0)
+        bext = (bmax - bmin).max(axis=1)
+        bmin -= self.bbox_pad*bext[:, None]
+        bmax += self.bbox_pad*bext[:, None]
+        bext *= 1 + 2*self.bbox_pad
+
+        # Bin elements into a hierarchy of uniform grids according to their
+        # size such that each element overlaps at most 2^ndims cells
+        bsz = bext.min()
+        lvls = np.ceil(np.log2(bext / bsz)).astype(int)
+        gmin = bmin.min(axis=0)
+
+        pidx, eidx = [], []
+        for l in np.unique(lvls):
+            csz = bsz*2**l
+            lidx = (lvls == l).nonzero()[0]
+
+            # Cells spanned by each element
+            cmin = ((bmin[lidx] - gmin) // csz).astype(np.int64)
+            cmax = ((bmax[lidx] - gmin) // csz).astype(np.int64)
+            ncells = cmax.max(axis=0) + 1
+
+            # Enumerate the cells overlapped by each element
+            cells, celes = [], []
+            for off in it.product([0, 1], repeat=spts.shape[-1]):
+                c = cmin + off
+                mask = (c <= cmax).all(axis=1)
+
+                cells.append(np.ravel_multi_index(c[mask].T, ncells))
+                celes.append(lidx[mask])
+
+            # Sort the elements by cell
+            cells, celes = np.concatenate(cells), np.concatenate(celes)
+            order = np.argsort(cells, kind='stable')
+            cells, celes = cells[order], celes[order]
+            ucells, ustart, ucount = np.unique(cells, return_index=True,
+                                               return_counts=True)
+
+            # Determine which cell each point is in
+            pcell = ((pts - gmin) // csz).astype(np.int64)
+            pmask = ((pcell >= 0) & (pcell < ncells)).all(axis=1)
+            pinc = pmask.nonzero()[0]
+            pcell = np.ravel_multi_index(pcell[pmask].T, ncells)
+
+            # Look up the cell in our table
+            ci = np.searchsorted(ucells, pcell).clip(max=len(ucells) - 1)
+            cmask = ucells[ci] == pcell
+            pinc, ci = pinc[cmask], ci[cmask]
+
+            # Form the candidate point-element pairs
+            counts = ucount[ci]
+            offs = np.repeat(counts.cumsum() - counts, counts)
+            offs = np.arange(counts.sum()) - offs
+
+            pidx.append(np.repeat(pinc, counts))
+            eidx.append(celes[np.repeat(ustart[ci], counts) + offs])
+
+        pidx, eidx = np.concatenate(pidx), np.concatenate(eidx)
+
+        # Discard pairs where the point is outside of the bounding box
+        p = pts[pidx]
+        mask = ((bmin[eidx] <= p) & (p <= bmax[eidx])).all(axis=1)
+
+        return pidx[mask], eidx[mask]
+
+    def _find_closest_element(self, etype, pts):
+        spts = self.mesh.spts[etype]
 
-        # Use this to form the set of candidate elements for each point
-        pidx, sidx = [], []
-        for i, (di, ni) in enumerate(nearest):
-            for ei in neles.get(ni, []):
-                pidx.append(i)
-                sidx.append(ei)
+        # Obtain the candidate elements for each point
+        pidx, eidx = self._find_candidates(etype, pts)
 
         # Obtain the closest location inside each of these elements
-        dists, tlocs = self._compute_tlocs(etype, spts[:, sidx], pts[pidx])
+        dists = np.empty(len(pidx))
+        tlocs = np.empty((len(pidx), spts.shape[-1]))
+        for i in range(0, len(pidx), self.chunk_size):
+            j = i + self.chunk_size
+            dists[i:j], tlocs[i:j] = self._compute_tlocs(
+                etype, spts[:, eidx[i:j]], pts[pidx[i:j]]
+            )
 
         # For each query point identify the most promising element
-        closest = {}
-        for i, (pi, dist, tloc) in enumerate(zip(pidx, dists, tlocs)):
-            if pi not in closest or dist < closest[pi][0]:
-                closest[pi] = (dist, i)
+        order = np.lexsort((dists, pidx))
+        order = order[np.unique(pidx[order], return_index=True)[1]]
 
-        pidx = list(closest)
-        tidx = [i for d, i in closest.values()]
-        sidx = [sidx[i] for i in tidx]
+        return pidx[order], dists[order], eidx[order], tlocs[order]
 
-        return dict(zip(pidx, zip(dists[tidx], sidx, tlocs[tidx])))
+    @memoize
+    def _get_fine_pts_op(self, etype, nspts):
+        shape, basis = self._get_shape_basis(etype, nspts)
+        fstdpts = np.array(shape.std_ele(self.fine_order))
+
+        return fstdpts, basis.nodal_basis_at(fstdpts)
 
     def _initial_tlocs(self, etype, spts, plocs):
-        shape, basis = self._get_shape_basis(etype, len(spts))
+        fstdpts, fop = self._get_fine_pts_op(etype, len(spts))
 
         # Obtain a fine sampling of points inside each element
-        fop = basis.nodal_basis_at(shape.std_ele(self.fine_order))
         fpts = fop @ spts.reshape(len(spts), -1)
         fpts = fpts.reshape(len(fop), *spts.shape[1:])
 
         # Find the closest fine sample point to each query point
-        dists = np.linalg.norm(fpts - plocs, axis=2)
-        amins = np.unravel_index(dists.argmin(axis=0), fpts.shape[:2])
+        fpts -= plocs
+        dists = np.einsum('ijk,ijk->ij', fpts, fpts)
 
-        return fpts[amins]
+        return fstdpts[dists.argmin(axis=0)]
 
     def _compute_tlocs(self, etype, spts, plocs):
         shape, basis = self._get_shape_basis(etype, len(spts))
@@ -171,7 +212,7 @@ class PointLocator:
 
             A = np.einsum('ijk,jkl->kli', jac_ops, spts)
             b = kplocs - plocs
-            ktlocs -= np.linalg.solve(A, b[..., None]).squeeze()
+            ktlocs -= np.linalg.solve(A, b[..., None])[..., 0]
 
             ops = basis.nodal_basis_at(ktlocs, clean=False)
             np.einsum('ij,jik->ik', ops, spts, out=kplocs)
@@ -180,9 +221,7 @@ class PointLocator:
         dists = np.linalg.norm(kplocs - plocs, axis=1)
 
         # Prune invalid points
-        for i, t in enumerate(ktlocs):
-            if not shape.valid_spt(t):
-                dists[i] = np.inf
+        dists[~shape.valid_spt(ktlocs.T)] = np.inf
 
         return dists, ktlocs
 
@@ -280,13 +319,16 @@ class PointSampler:
             self._ptsinv = np.argsort([i for pr in ptsrank for i in pr])
 
     def sample(self, solns, process=None):
-        comm, rank, root = get_comm_rank_root()
-
         # Perform the sampling
         samples = np.empty((self.pcount, self.nvars))
         for et, ei, idxs, ops in self.pinfo:
             samples[idxs] = ops @ solns[et][:, :, ei]
 
+        return self.gather(samples, process)
+
+    def gather(self, samples, process=None):
+        comm, rank, root = get_comm_rank_root()
+
         # Post-process the samples
         if process:
             samples = np.ascontiguousarray(process(samples))
@@ -6,7 +6,6 @@ import numpy as np
 
 from pyfr.inifile import Inifile
 from pyfr.mpiutil import Scatterer, SparseScatterer, get_comm_rank_root
-from pyfr.nputil import iter_struct
 
 
 @dataclass
@@ -264,93 +263,140 @@ class NativeReader:
 
     def _construct_con(self):
         codec = self.mesh.codec
-        eidxs = {k: v.tolist() for k, v in self.mesh.eidxs.items()}
         etypes = self.mesh.etypes
 
-        # Create a map from global to local element numbers
-        glmap = [{}]*len(etypes)
-        for i, etype in enumerate(etypes):
-            if etype in eidxs:
-                glmap[i] = {k: j for j, k in enumerate(eidxs[etype])}
-
-        # Create cidx indexed maps
-        cdone, cefidx = [None]*len(codec), [None]*len(codec)
+        # Map codec indices to element type numbers and face numbers
+        cetidx = np.full(len(codec), -1)
+        cfidx = np.full(len(codec), -1)
         for cidx, c in enumerate(codec):
             if (m := re.match(r'eles/(\w+)/(\d+)$', c)):
-                etype, fidx = m[1], m[2]
-                cdone[cidx] = set()
-                cefidx[cidx] = (etype, etypes.index(etype), int(fidx))
+                cetidx[cidx], cfidx[cidx] = etypes.index(m[1]), int(m[2])
 
-        conl, conr = [], []
-        bcon = {i: [] for i, c in enumerate(codec) if c.startswith('bc/')}
-        resid = {}
+        # Number of local elements of each type
+        neles = np.array([len(self.mesh.eidxs.get(e, [])) for e in etypes])
 
+        # Flatten our faces such that they are in (type, face, ele) order
+        finfo = [np.empty((6, 0), dtype=np.int64)]
+        fbase, nfaces = np.zeros(len(etypes), dtype=np.int64), 0
         for etype, einfo in self.eles.items():
-            i = etypes.index(etype)
-            for fidx, eface in enumerate(einfo['faces'].T):
-                efcidx = codec.index(f'eles/{etype}/{fidx}')
-
-                for j, (cidx, off) in enumerate(iter_struct(eface)):
-                    # Boundary
-                    if off == -1:
-                        bcon[cidx].append((etype, j, fidx))
-                    # Unpaired face
-                    elif j not in cdone[efcidx]:
-                        # Lookup the element type and face number
-                        ketype, ketidx, kfidx = cefidx[cidx]
-
-                        # If our rank has the element then pair it
-                        if (k := glmap[ketidx].get(off)) is not None:
-                            conl.append((etype, j, fidx))
-                            conr.append((ketype, k, kfidx))
-                            cdone[cidx].add(k)
-                        # Otherwise add it to the residual dict
-                        else:
-                            resid[efcidx, eidxs[etype][j]] = (cidx, off)
+            i, faces = etypes.index(etype), einfo['faces'].T
+            nfpe, n = faces.shape
+
+            # Note the offset of the first face of this type
+            fbase[i], nfaces = nfaces, nfaces + faces.size
+
+            fecidx = [codec.index(f'eles/{etype}/{f}') for f in range(nfpe)]
+            finfo.append([
+                np.full(faces.size, i), np.repeat(np.arange(nfpe), n),
+                np.tile(np.arange(n), nfpe), np.repeat(fecidx, n),
+                faces['cidx'].ravel(), faces['off'].ravel()
+            ])
+
+        # Type number, face number, element number, our codec index, and
+        # the codec index and element offset of the face we are paired with
+        finfo = np.hstack(finfo).astype(np.int64)
+        fetidx, ffidx, fjidx, fecidx, fcidx, foff = finfo
+
+        # Element type names as an array to permit fancy indexing
+        onames = np.array(etypes, dtype=object)
+
+        def face_tuples(tidx, jidx, fidx):
+            return list(zip(onames[tidx].tolist(), jidx.tolist(),
+                            fidx.tolist()))
+
+        def our_face_tuples(ix):
+            return face_tuples(fetidx[ix], fjidx[ix], ffidx[ix])
+
+        # Boundary faces, grouped by codec index in the order encountered
+        bix = (foff == -1).nonzero()[0]
+        bix = bix[np.argsort(fcidx[bix], kind='stable')]
+        bcidx, bstart = np.unique(fcidx[bix], return_index=True)
+        for cidx, ix in zip(bcidx, np.split(bix, bstart[1:])):
+            self.mesh.bcon[codec[cidx][3:]] = our_face_tuples(ix)
+
+        # Internal faces along with the type and face number of their pair
+        iix = (foff != -1).nonzero()[0]
+        ketidx, kfidx = cetidx[fcidx[iix]], cfidx[fcidx[iix]]
+
+        # Determine the local element number of each pair, if we have it
+        kjidx = np.full(len(iix), -1)
+        for i, etype in enumerate(etypes):
+            if etype in self.mesh.eidxs:
+                eidx = self.mesh.eidxs[etype]
+                srtd = np.argsort(eidx)
+
+                kix = (ketidx == i).nonzero()[0]
+                koff = foff[iix[kix]]
+
+                pos = np.searchsorted(eidx, koff, sorter=srtd)
+                pos = srtd[pos.clip(max=len(eidx) - 1)]
+                found = eidx[pos] == koff
+
+                kjidx[kix[found]] = pos[found]
+
+        # Pair up faces where our rank has both sides, taking the face
+        # which is encountered first to be on the left
+        pix = (kjidx != -1).nonzero()[0]
+        pket = ketidx[pix]
+        pflat = fbase[pket] + kfidx[pix]*neles[pket] + kjidx[pix]
+        lix = pix[iix[pix] < pflat]
+
+        conl = our_face_tuples(iix[lix])
+        conr = face_tuples(ketidx[lix], kjidx[lix], kfidx[lix])
 
         # Add the internal connectivity to the mesh
         self.mesh.con = (conl, conr)
 
-        for k, v in bcon.items():
-            if v:
-                self.mesh.bcon[codec[k][3:]] = v
-
         # Handle inter-partition connectivity
-        if resid:
-            self._construct_mpi_con(glmap, cefidx, resid)
+        if len(rix := iix[kjidx == -1]):
+            fdtype = [('cidx', np.int64), ('off', np.int64)]
+            ours, theirs = np.empty((2, len(rix)), dtype=fdtype)
+
+            # Identify our unpaired faces and the faces they are paired with
+            ours['cidx'] = fecidx[rix]
+            theirs['cidx'], theirs['off'] = fcidx[rix], foff[rix]
+            for i, etype in enumerate(etypes):
+                if (eix := fetidx[rix] == i).any():
+                    ours['off'][eix] = self.mesh.eidxs[etype][fjidx[rix[eix]]]
 
-    def _construct_mpi_con(self, glmap, cefidx, resid):
+            self._construct_mpi_con(our_face_tuples(rix), ours, theirs)
+
+    def _construct_mpi_con(self, rcon, ours, theirs):
         comm, rank, root = get_comm_rank_root()
 
         # Create a neighbourhood collective communicator
         ncomm = comm.Create_dist_graph_adjacent(self.neighbours,
                                                 self.neighbours)
 
-        # Create a list of our unpaired faces
-        unpaired = list(resid.values())
+        # Sort our unpaired faces to permit them to be searched
+        osrtd = np.argsort(ours)
+
+        def locate(faces):
+            pos = np.searchsorted(ours, faces, sorter=osrtd)
+            pos = osrtd[pos.clip(max=len(ours) - 1)]
 
-        # Distribute this to each of our neighbours
-        nunpaired = ncomm.neighbor_allgather(unpaired)
+            return pos, ours[pos] == faces
+
+        # Distribute the faces we need to each of our neighbours
+        nunpaired = ncomm.neighbor_allgather(theirs)
 
         # See which of our neighbours unpaired faces we have
-        matches = [[resid[j] for j in nunp if j in resid]
-                   for nunp in nunpaired]
+        matches = []
+        for nunp in nunpaired:
+            pos, found = locate(nunp)
+            matches.append(theirs[pos[found]])
 
         # Distribute this information back to our neighbours
         nmatches = ncomm.neighbor_alltoall(matches)
 
         for nrank, nmatch in zip(self.neighbours, nmatches):
+            pos, _ = locate(nmatch)
+
+            # Order the faces by those of the higher ranked partition
             if rank < nrank:
-                ncon = sorted([(resid[m], m) for m in nmatch])
-                ncon = [r for l, r in ncon]
+                pos = pos[np.argsort(theirs[pos])]
             else:
-                ncon = sorted([(m, resid[m]) for m in nmatch])
-                ncon = [l for l, r in ncon]
-
-            nncon = []
-            for cidx, off in ncon:
-                etype, etidx, fidx = cefidx[cidx]
-                nncon.append((etype, glmap[etidx][off], fidx))
+                pos = pos[np.argsort(ours[pos])]
 
             # Add the connectivity to the mesh
-            self.mesh.con_p[nrank] = nncon
+            self.mesh.con_p[nrank] = [rcon[i] for i in pos]
@@ -1,9 +1,7 @@
 from ast import literal_eval
-from collections import defaultdict
 import re
 
 import numpy as np
-from rtree.index import Index, Property
 
 from pyfr.mpiutil import get_comm_rank_root, mpi
 from pyfr.shapes import BaseShape
@@ -20,6 +18,69 @@ def parse_region_expr(expr, rdata=None):
         return BoundaryRegion(m[1], nlayers=int(m[2] or 1))
 
 
+class _ElementGraph:
+    def __init__(self, mesh):
+        self.etypes = etypes = list(mesh.eidxs)
+
+        # Number the local elements contiguously across all types
+        neles = [len(mesh.eidxs[etype]) for etype in etypes]
+        self.neles = sum(neles)
+        self.eoff = dict(zip(etypes, np.cumsum([0, *neles[:-1]]).tolist()))
+        self.etidx = np.repeat(np.arange(len(etypes)), neles)
+
+        # Number of faces per element type
+        self.nfaces = np.array([
+            len(subclass_where(BaseShape, name=etype).faces)
+            for etype in etypes
+        ], dtype=int)
+        self.nfmax = max(self.nfaces, default=0)
+
+        # Internal and partition boundary connectivity as face numbers
+        self.conl, self.conr = [self.face_idxs(c) for c in mesh.con]
+        self.con_p = {p: self.face_idxs(c) for p, c in mesh.con_p.items()}
+
+        # Compressed sparse row element adjacency
+        l, r = self.conl // self.nfmax, self.conr // self.nfmax
+        src, dst = np.concatenate([l, r]), np.concatenate([r, l])
+
+        self.adjncy = dst[np.argsort(src, kind='stable')]
+        self.xadj = np.zeros(self.neles + 1, dtype=int)
+        self.xadj[1:] = np.bincount(src, minlength=self.neles).cumsum()
+
+    def face_idxs(self, faces):
+        if not faces:
+            return np.empty(0, dtype=int)
+
+        faces = np.array(faces, dtype=[('etype', object), ('eidx', int),
+                                       ('fidx', int)])
+
+        # Offset the element numbers according to their type
+        eidxs = faces['eidx']
+        for etype, off in self.eoff.items():
+            eidxs[faces['etype'] == etype] += off
+
+        return eidxs*self.nfmax + faces['fidx']
+
+    def ele_idxs(self, eset):
+        return np.concatenate([
+            self.eoff[etype] + np.asarray(eidxs, dtype=int)
+            for etype, eidxs in eset.items()
+        ] or [np.empty(0, dtype=int)])
+
+    def neighbours(self, eles):
+        start, count = self.xadj[eles], self.xadj[eles + 1] - self.xadj[eles]
+        off = np.arange(count.sum()) - np.repeat(count.cumsum() - count, count)
+
+        return self.adjncy[np.repeat(start, count) + off]
+
+    def split_eles(self, eles):
+        eles = np.unique(eles)
+        etidx = self.etidx[eles]
+
+        return {etype: (eles[etidx == i] - self.eoff[etype]).tolist()
+                for i, etype in enumerate(self.etypes) if (etidx == i).any()}
+
+
 class BaseRegion:
     def interior_eles(self, mesh):
         pass
@@ -27,28 +88,30 @@ class BaseRegion:
     def surface_faces(self, mesh, exclbcs=[]):
         comm, rank, root = get_comm_rank_root()
 
-        sfaces = set()
+        graph = _ElementGraph(mesh)
+        nfmax = graph.nfmax
 
         # Begin by assuming all faces of all elements are on the surface
-        for etype, eidxs in self.interior_eles(mesh).items():
-            nfaces = len(subclass_where(BaseShape, name=etype).faces)
-            sfaces.update((etype, i, j) for i in eidxs for j in range(nfaces))
+        eles = graph.ele_idxs(self.interior_eles(mesh))
+        sfaces = np.zeros((graph.neles, nfmax), dtype=bool)
+        sfaces[eles] = np.arange(nfmax) < graph.nfaces[graph.etidx[eles], None]
+        sfaces = sfaces.reshape(-1)
 
         # Eliminate any faces with internal connectivity
-        for l, r in zip(*mesh.con):
-            if l in sfaces and r in sfaces:
-                sfaces.difference_update([l, r])
+        l, r = graph.conl, graph.conr
+        internal = sfaces[l] & sfaces[r]
+        sfaces[l[internal]] = sfaces[r[internal]] = False
 
         # Eliminate faces on specified boundaries
         for b in exclbcs:
-            sfaces.difference_update(mesh.bcon.get(b, set()))
+            sfaces[graph.face_idxs(mesh.bcon.get(b, []))] = False
 
         reqs, bufs = [], []
 
         # Next, consider faces on partition boundaries
-        for p, con in mesh.con_p.items():
+        for p, con in graph.con_p.items():
             # See which of these faces are on the surface boundary
-            sb = np.array([c in sfaces for c in con])
+            sb = sfaces[con]
             rb = np.empty_like(sb)
 
             # Exchange this information with our neighbour
@@ -62,15 +125,20 @@ class BaseRegion:
 
         # Use this data to eliminate any shared faces
         for con, sb, rb in bufs:
-            sfaces.difference_update(f for b, f in zip(sb & rb, con) if b)
+            sfaces[con[sb & rb]] = False
 
-        # Group the remaining faces by element type
-        nsfaces = defaultdict(list)
-        for etype, eidx, fidx in sfaces:
-            nsfaces[etype, fidx].append(eidx)
+        # Group the remaining faces by element type and face number
+        eles, fidxs = np.divmod(sfaces.nonzero()[0], nfmax)
+        etidx = graph.etidx[eles]
 
-        # Sort and return
-        return {k: sorted(v) for k, v in nsfaces.items()}
+        nsfaces = {}
+        for i, etype in enumerate(graph.etypes):
+            for f in range(graph.nfaces[i]):
+                if (mask := (etidx == i) & (fidxs == f)).any():
+                    eidxs = eles[mask] - graph.eoff[etype]
+                    nsfaces[etype, f] = eidxs.tolist()
+
+        return nsfaces
 
 
 class BoundaryRegion(BaseRegion):
@@ -81,64 +149,54 @@ class BoundaryRegion(BaseRegion):
     def interior_eles(self, mesh):
         comm, rank, root = get_comm_rank_root()
 
-        eset = defaultdict(list)
-
         # Ensure the boundary exists
         bcranks = comm.gather(self.bcname in mesh.bcon, root=root)
         if rank == root and not any(bcranks):
             raise ValueError(f'Boundary {self.bcname} does not exist')
 
+        graph = _ElementGraph(mesh)
+
         # Determine which of our elements are directly on the boundary
-        if self.bcname in mesh.bcon:
-            for etype, eidx, fidx in mesh.bcon[self.bcname]:
-                eset[etype].append(eidx)
-
-        # Handle the case where multiple layers have been requested
-        if self.nlayers > 1:
-            # Load our internal connectivity array
-            con = [(l[:2], r[:2]) for l, r in zip(*mesh.con)]
-
-            # Load our partition boundary connectivity arrays
-            pcon = {}
-            for p, pc in mesh.con_p.items():
-                pc = [(etype, eidx) for etype, eidx, fidx in pc]
-                pcon[p] = (pc, *np.empty((2, len(pc)), dtype=bool))
-
-            # Tag all elements in the set as belonging to the first layer
-            neset = {(k, j): 0 for k, v in eset.items() for j in v}
-
-            # Iteratively grow out the element set
-            for i in range(self.nlayers - 1):
-                reqs = []
-
-                # Exchange information about recent updates to our set
-                for p, (pc, sb, rb) in pcon.items():
-                    sb[:] = [neset.get(c, -1) == i for c in pc]
-
-                    # Start the send/recv requests
-                    reqs.append(comm.Isend(sb, p))
-                    reqs.append(comm.Irecv(rb, p))
-
-                # Grow our element set by considering internal connectivity
-                for l, r in con:
-                    if neset.get(l, -1) == i and r not in neset:
-                        neset[r] = i + 1
-                        eset[r[0]].append(r[1])
-                    elif neset.get(r, -1) == i and l not in neset:
-                        neset[l] = i + 1
-                        eset[l[0]].append(l[1])
-
-                # Wait for the exchanges to finish
-                mpi.Request.Waitall(reqs)
-
-                # Grow our element set by considering adjacent partitions
-                for pc, sb, rb in pcon.values():
-                    for l, b in zip(pc, rb):
-                        if b and l not in neset:
-                            neset[l] = i + 1
-                            eset[l[0]].append(l[1])
-
-        return {k: sorted(v) for k, v in eset.items()}
+        bfaces = graph.face_idxs(mesh.bcon.get(self.bcname, []))
+        front = np.unique(bfaces // graph.nfmax)
+
+        # Tag these elements as belonging to the first layer
+        layer = np.full(graph.neles, -1)
+        layer[front] = 0
+
+        # Iteratively grow out the element set
+        for i in range(self.nlayers - 1):
+            reqs, bufs = [], []
+
+            # Exchange information about recent updates to our set
+            for p, con in graph.con_p.items():
+                pe = con // graph.nfmax
+                sb = layer[pe] == i
+                rb = np.empty_like(sb)
+
+                # Start the send/recv requests
+                reqs.append(comm.Isend(sb, p))
+                reqs.append(comm.Irecv(rb, p))
+
+                bufs.append((pe, rb))
+
+            # Grow our element set by considering internal connectivity
+            nbrs = graph.neighbours(front)
+            new = [nbrs[layer[nbrs] == -1]]
+            layer[new[0]] = i + 1
+
+            # Wait for the exchanges to finish
+            mpi.Request.Waitall(reqs)
+
+            # Grow our element set by considering adjacent partitions
+            for pe, rb in bufs:
+                pnew = pe[rb & (layer[pe] == -1)]
+                layer[pnew] = i + 1
+                new.append(pnew)
+
+            front = np.unique(np.concatenate(new))
+
+        return graph.split_eles((layer != -1).nonzero()[0])
 
 
 class BaseGeometricRegion(BaseRegion):
@@ -309,16 +367,44 @@ class STLRegion(BaseGeometricRegion):
         self.fa = fa.copy()
         self.mat = np.moveaxis(mat, 2, 0).copy()
 
-        # Compute the per-face bounding box
-        tbox = np.hstack([faces.min(axis=1) - 1e-6,
-                            faces.max(axis=1) + 1e-6])
-
-        # Use this to construct an R-tree index
-        ins = ((i, p.tolist(), None) for i, p in enumerate(tbox))
-        props = Property(dimension=3, interleaved=True)
-        self.tri_idx = Index(ins, properties=props)
-
-    def _pts_in_region(self, pts):
+        # Compute the per-face bounding box in the xy-plane
+        tmin = faces[..., :2].min(axis=1) - 1e-6
+        tmax = faces[..., :2].max(axis=1) + 1e-6
+
+        # Size a uniform grid in the xy-plane according to the face count
+        self.g0 = self.x0[:2] - 1e-6
+        ext = self.x1[:2] + 1e-6 - self.g0
+        self.gn = np.maximum(np.ceil(ext*(len(fa) / ext.prod())**0.5), 1)
+        self.gn = self.gn.astype(int)
+        self.gsz = ext / self.gn
+
+        # Determine the range of cells spanned by each face
+        cmin = self._cell_idxs(tmin)
+        cmax = self._cell_idxs(tmax)
+        cext = cmax - cmin + 1
+
+        # Enumerate these cells
+        nc = cext.prod(axis=1)
+        fidx = np.repeat(np.arange(len(fa)), nc)
+        off = np.arange(nc.sum()) - np.repeat(nc.cumsum() - nc, nc)
+        cx = cmin[fidx, 0] + off % cext[fidx, 0]
+        cy = cmin[fidx, 1] + off // cext[fidx, 0]
+        cells = cx*self.gn[1] + cy
+
+        # Construct a map from cells to the faces inside of them
+        order = np.argsort(cells, kind='stable')
+        self.cfaces = fidx[order]
+        self.coffs = np.searchsorted(cells[order],
+                                     np.arange(self.gn.prod() + 1))
+
+        # Save the bounding boxes for pruning
+        self.tmin, self.tmax = tmin, tmax
+
+    def _cell_idxs(self, xy):
+        cidx = ((xy - self.g0) // self.gsz).astype(int)
+        return np.clip(cidx, 0, self.gn - 1)
+
+    def _pts_in_region(self, pts, chunksz=65536):
         inside = np.ones(pts.shape[:-1], dtype=bool)
         finside = inside.reshape(-1)
 
@@ -326,22 +412,38 @@ class STLRegion(BaseGeometricRegion):
         for i, (l, u) in enumerate(zip(self.x0, self.x1)):
             inside &= (l <= pts[..., i]) & (pts[..., i] <= u)
 
-        # Iterate through the remaining points
+        # Process the remaining points in chunks
         cidx = np.nonzero(finside)[0]
-        for i, ro in zip(cidx, pts.reshape(-1, 3)[cidx]):
-            crossings = 0
-
-            # Count how many times a ray cast in +z from this point
-            # itersects a face on our surface
-            tbox = [*ro, *ro[:2], self.x1[2]]
-            for j in self.tri_idx.intersection(tbox, objects=False):
-                u, v, t = np.dot(self.mat[j], (ro - self.fa[j]).T).tolist()
-                crossings += t >= 0 and u >= 0 and v >= 0 and (u + v) <= 1
-
-            finside[i] = (crossings % 2) == 1
+        for i in range(0, len(cidx), chunksz):
+            ci = cidx[i:i + chunksz]
+            finside[ci] = self._count_crossings(pts.reshape(-1, 3)[ci]) % 2
 
         return inside
 
+    def _count_crossings(self, ro):
+        # Identify the grid cell containing each point
+        c = self._cell_idxs(ro[:, :2])
+        c = c[:, 0]*self.gn[1] + c[:, 1]
+
+        # Form point-face pairs from the faces in these cells
+        cstart, ccount = self.coffs[c], self.coffs[c + 1] - self.coffs[c]
+        pidx = np.repeat(np.arange(len(ro)), ccount)
+        off = np.arange(ccount.sum()) - np.repeat(ccount.cumsum() - ccount,
+                                                  ccount)
+        fidx = self.cfaces[np.repeat(cstart, ccount) + off]
+
+        # Prune pairs where the point is outside of the face bounding box
+        p = ro[pidx, :2]
+        mask = np.all((self.tmin[fidx] <= p) & (p <= self.tmax[fidx]), axis=1)
+        pidx, fidx = pidx[mask], fidx[mask]
+
+        # See if a ray cast in +z from each point intersects the face
+        d = ro[pidx] - self.fa[fidx]
+        u, v, t = (self.mat[fidx] @ d[..., None])[..., 0].T
+        hit = (t >= 0) & (u >= 0) & (v >= 0) & (u + v <= 1)
+
+        return np.bincount(pidx[hit], minlength=len(ro))
+
 
 class ConstructiveRegion(BaseGeometricRegion):
     def __init__(self, expr, rdata=None):
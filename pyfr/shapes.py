@@ -333,7 +333,7 @@ class TensorProdShape:
 
     @classmethod
     def valid_spt(cls, pt, tol=1e-9):
-        return all(abs(p) < 1 + tol for p in pt)
+        return np.all(np.abs(pt) < 1 + tol, axis=0)
 
 
 class QuadShape(TensorProdShape, BaseShape):
@@ -448,8 +448,8 @@ class TriShape(BaseShape):
     def valid_spt(cls, spt, tol=1e-9):
         x, y = spt
 
-        return (x + tol > -1 and x - tol < -y and
-                y + tol > -1 and y - tol < 1)
+        return ((x + tol > -1) & (x - tol < -y) &
+                (y + tol > -1) & (y - tol < 1))
 
 
 class TetShape(BaseShape):
@@ -484,12 +484,12 @@ class TetShape(BaseShape):
                 for p in pts1d[:(sptord + 1 - i - j)]]
 
     @classmethod
-    def valid_spt(spt, tol=1e-9):
+    def valid_spt(cls, spt, tol=1e-9):
         x, y, z = spt
 
-        return (x + tol > -1 and x - tol < -1 - y - z and
-                y + tol > -1 and y - tol < -z and
-                z + tol > -1 and z - tol < 1)
+        return ((x + tol > -1) & (x - tol < -1 - y - z) &
+                (y + tol > -1) & (y - tol < -z) &
+                (z + tol > -1) & (z - tol < 1))
 
 
 class PriShape(BaseShape):
@@ -533,7 +533,8 @@ class PriShape(BaseShape):
 
     @classmethod
     def valid_spt(cls, spt, tol=1e-9):
-        return abs(spt[2]) < 1 + tol and TriShape.valid_spt(spt[:2], tol=tol)
+        return ((np.abs(spt[2]) < 1 + tol) &
+                TriShape.valid_spt(spt[:2], tol=tol))
 
 
 class PyrShape(BaseShape):
@@ -587,6 +588,6 @@ class PyrShape(BaseShape):
         x, y, z = spt
         u = (1 - z) / 2
 
-        return (x + tol > -u and x - tol < u and
-                y + tol > -u and y - tol < u and
-                z + tol > -1 and z - tol < 1)
+        return ((x + tol > -u) & (x - tol < u) &
+                (y + tol > -u) & (y - tol < u) &
+                (z + tol > -1) & (z - tol < 1))
@@ -1,11 +1,15 @@
 from functools import cached_property, wraps
+from io import BytesIO
+import time
 
 import numpy as np
 
-from pyfr.nputil import fuzzysort, npeval
-from pyfr.cache import memoize
+from pyfr._version import __version__
+from pyfr.nputil import batched_fuzzysort, npeval
+from pyfr.cache import ObjectCache, memoize
 from pyfr.quadrules import get_quadrule
 from pyfr.shapes import proj_l2
+from pyfr.util import digest
 
 
 def inters_map(meth):
@@ -22,7 +26,109 @@ def inters_map(meth):
     return newmeth
 
 
+def geocached(meth):
+    @wraps(meth)
+    def newmeth(self, *args):
+        if self._geocache is None:
+            return meth(self, *args)
+        else:
+            return self._geocache(self, meth.__name__, args,
+                                  lambda: meth(self, *args))
+
+    return newmeth
+
+
+class GeometryCache:
+    def __init__(self, cfg, mesh):
+        maxsize = cfg.getint('backend', 'geometry-cache-size', 4*1024**3)
+
+        self.cache = ObjectCache('geo', maxsize=maxsize)
+        self.mesh = mesh
+
+        # Statistics
+        self.nhits = self.nmisses = 0
+        self.tsaved = 0.0
+
+    @memoize
+    def _ele_key(self, eles):
+        etype, cfg = eles.basis.name, eles.cfg
+
+        # Configuration sections which can influence the geometry
+        sects = ['solver', f'solver-elements-{etype}']
+        sects += [s for s in cfg.sections()
+                  if s.startswith('solver-interfaces')]
+        sects = [(s, cfg.items(s)) for s in sects if s in cfg.sections()]
+
+        return (__version__, self.mesh.uuid, self.mesh.eidxs[etype], etype,
+                sects)
+
+    def __call__(self, eles, name, args, fn):
+        # Resolve any named point sets
+        args = [(a, getattr(eles.basis, a)) if isinstance(a, str) else a
+                for a in args]
+
+        key = digest(self._ele_key(eles), name, args)
+
+        # See if we have the result in the cache
+        tstart = time.perf_counter()
+        if (res := self._load(key)) is not None:
+            kind, tcomp, arrs = res
+
+            self.nhits += 1
+            self.tsaved += tcomp - (time.perf_counter() - tstart)
+
+            return arrs[0] if kind == 'array' else kind(arrs)
+
+        # Otherwise compute it
+        tstart = time.perf_counter()
+        res = fn()
+        tcomp = time.perf_counter() - tstart
+
+        self.nmisses += 1
+
+        if isinstance(res, np.ndarray):
+            self._store(key, 'array', tcomp, [res])
+        else:
+            self._store(key, type(res).__name__, tcomp, res)
+
+        return res
+
+    def _load(self, key):
+        if (meta := self.cache.get_bytes(key)) is None:
+            return None
+
+        kind, n, tcomp = meta.decode().split()
+        kind = {'array': 'array', 'list': list, 'tuple': tuple}[kind]
+
+        try:
+            arrs = [np.load(self.cache.get_path(f'{key}-{i}.npy'),
+                            mmap_mode='r') for i in range(int(n))]
+        except (OSError, ValueError):
+            return None
+
+        return kind, float(tcomp), arrs
+
+    def _store(self, key, kind, tcomp, arrs):
+        for i, arr in enumerate(arrs):
+            buf = BytesIO()
+            np.save(buf, arr)
+
+            if not self.cache.set_with_bytes(f'{key}-{i}.npy',
+                                             buf.getbuffer()):
+                return
+
+        # Write the metadata last so partial entries are never loaded
+        meta = f'{kind} {len(arrs)} {tcomp!r}'
+        self.cache.set_with_bytes(key, meta.encode())
+
+
 class BaseElements:
+    # On-disk cache of geometric quantities, if any
+    _geocache = None
+
+    # Elements, if any, whose scratch space we can alias
+    _scratch_donor = None
+
     def __init__(self, basiscls, eles, cfg):
         self._be = None
 
@@ -138,10 +244,11 @@ class BaseElements:
                                tags={'align'})
 
     @cached_property
+    @geocached
     def _srtd_face_fpts(self):
         plocfpts = self.plocfpts.transpose(1, 2, 0)
 
-        return [[np.array(fuzzysort(pts.tolist(), ffpts)) for pts in plocfpts]
+        return [batched_fuzzysort(plocfpts, ffpts)
                 for ffpts in self.basis.facefpts]
 
     def _scratch_bufs(self):
@@ -204,10 +311,29 @@ class BaseElements:
         nfpts, nupts, nqpts = self.nfpts, self.nupts, self.nqpts
         sbufs, abufs = self._scratch_bufs, []
 
+        # Scratch space from other elements which we can alias
+        dbufs = getattr(self._scratch_donor, '_scratch', {})
+        self._scratch = {}
+
         # Convenience functions for scalar/vector allocation
-        alloc = lambda ex, n: abufs.append(
-            backend.matrix(n, extent=nonce + ex, tags={'align'})
-        ) or abufs[-1]
+        def alloc(ex, n):
+            m = None
+
+            # Alias the donor's buffer; this fails if ours would not fit
+            if (d := dbufs.get(ex)) is not None:
+                try:
+                    m = backend.matrix(n, aliases=d, tags={'align'})
+                except ValueError:
+                    pass
+
+            if m is None:
+                m = backend.matrix(n, extent=nonce + ex, tags={'align'})
+
+            abufs.append(m)
+            self._scratch[ex] = m
+
+            return m
+
         salloc = lambda ex, n: alloc(ex, (n, nvars, neles))
         valloc = lambda ex, n: alloc(ex, (ndims, n, nvars, neles))
 
@@ -285,6 +411,7 @@ class BaseElements:
         return self._be.const_matrix(smat, tags={'align'})
 
     @memoize
+    @geocached
     def rcpdjac_at_np(self, name):
         _, djacs_mpts = self._smats_djacs_mpts
 
@@ -306,6 +433,7 @@ class BaseElements:
         return self._be.const_matrix(self.rcpdjac_at_np(name), tags={'align'})
 
     @memoize
+    @geocached
     def ploc_at_np(self, name):
         pt = getattr(self.basis, name) if isinstance(name, str) else name
         op = self.basis.sbasis.nodal_basis_at(pt)
@@ -333,6 +461,7 @@ class BaseElements:
         return self.pnorm_at('fpts', self.basis.norm_fpts)
 
     @memoize
+    @geocached
     def pnorm_at(self, name, norm):
         smats = self.smat_at_np(name).transpose(1, 3, 0, 2)
 
@@ -351,6 +480,7 @@ class BaseElements:
         return pnorm
 
     @cached_property
+    @geocached
     def _smats_djacs_mpts(self):
         # Metric basis with grid point (q<=p) or pseudo grid points (q>p)
         mpts = self.basis.mpts
@@ -8,6 +8,7 @@ import numpy as np
 from pyfr.backends.base import NullKernel
 from pyfr.cache import memoize
 from pyfr.shapes import BaseShape
+from pyfr.solvers.base.elements import GeometryCache
 from pyfr.util import subclasses
 
 
@@ -20,7 +21,11 @@ class BaseSystem:
     # Nonce sequence
     _nonce_seq = it.count()
 
-    def __init__(self, backend, mesh, initsoln, nregs, cfg):
+    # Geometry cache, if any
+    geocache = None
+
+    def __init__(self, backend, mesh, initsoln, nregs, cfg,
+                 scratch_donor=None):
         self.backend = backend
         self.mesh = mesh
         self.cfg = cfg
@@ -43,7 +48,8 @@ class BaseSystem:
         nonce = str(next(self._nonce_seq))
 
         # Load the elements
-        eles, elemap = self._load_eles(mesh, initsoln, nregs, nonce)
+        eles, elemap = self._load_eles(mesh, initsoln, nregs, nonce,
+                                       scratch_donor)
         backend.commit()
 
         # Retain the element map; this may be deleted by clients
@@ -91,7 +97,7 @@ class BaseSystem:
         # Observed input/output bank numbers
         self._rhs_uin_fout = set()
 
-    def _load_eles(self, mesh, initsoln, nregs, nonce):
+    def _load_eles(self, mesh, initsoln, nregs, nonce, scratch_donor):
         basismap = {b.name: b for b in subclasses(BaseShape, just_leaf=True)}
 
         # Load the elements
@@ -100,6 +106,18 @@ class BaseSystem:
 
         eles = list(elemap.values())
 
+        # See if geometric quantities should be cached on disk
+        if self.cfg.getbool('backend', 'geometry-cache', False):
+            self.geocache = GeometryCache(self.cfg, mesh)
+
+            for ele in eles:
+                ele._geocache = self.geocache
+
+        # See if we can share scratch space with another system
+        if scratch_donor:
+            for etype, ele in elemap.items():
+                ele._scratch_donor = scratch_donor.ele_map.get(etype)
+
         # Set the initial conditions
         if initsoln:
             # Load the config and stats files from the solution
@@ -172,7 +190,10 @@ class BaseSystem:
         # associated with a kernel; used for dependency analysis
         self._ktags = {}
 
-        def tag_kern(pname, prov, kern):
+        def tag_kern(pname, kname, prov, kern):
+            # Name the kernel; used when profiling
+            kern.name = f'{pname}/{kname}'
+
             if pname == 'eles':
                 self._ktags[kern] = f'e-{prov.basis.name}'
             elif pname == 'mpiint':
@@ -201,7 +222,7 @@ class BaseSystem:
                             else:
                                 kernels[f'{pn}/{kn}', None, i].append(kern)
 
-                            tag_kern(pn, p, kern)
+                            tag_kern(pn, kn, p, kern)
                     else:
                         kern = kgetter()
                         if isinstance(kern, NullKernel):
@@ -209,7 +230,7 @@ class BaseSystem:
 
                         kernels[f'{pn}/{kn}', None, None].append(kern)
 
-                        tag_kern(pn, p, kern)
+                        tag_kern(pn, kn, p, kern)
 
     def _gen_mpireqs(self, mpiint):
         self._mpireqs = mpireqs = defaultdict(list)
@@ -0,0 +1,19 @@
+from pyfr.backends import get_backend
+from pyfr.inifile import Inifile
+
+
+def test_memory_usage():
+    backend = get_backend('openmp', Inifile())
+
+    # A matrix along with a slice of it and a matrix which aliases it
+    m = backend.matrix((4, 2, 100), extent='m', tags={'align', 'x'})
+    s = m.slice(0, 2)
+    a = backend.matrix((2, 2, 100), aliases=m, tags={'align'})
+    backend.commit()
+
+    # Only the memory of the first matrix should be counted
+    usage = backend.memory_usage()
+    assert usage['total'] == usage['tag-align'] == usage['tag-x'] == m.nbytes
+    assert 'tag-slice' not in usage
+
+    assert backend.owned_nbytes([m.mid, s.mid, a.mid]) == m.nbytes
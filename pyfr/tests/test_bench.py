@@ -0,0 +1,19 @@
+import pytest
+
+from pyfr.bench import box_mesh
+from pyfr.readers.native import NativeReader
+
+
+@pytest.mark.parametrize('etype,nper,nfaces', [('hex', 1, 6), ('pri', 2, 5),
+                                               ('tet', 6, 4)])
+def test_box_mesh(etype, nper, nfaces):
+    n = 3
+    mesh = NativeReader(box_mesh(etype, n)).mesh
+
+    # Check the element counts
+    assert mesh.etypes == [etype]
+    assert len(mesh.eidxs[etype]) == nper*n**3
+
+    # The mesh is fully periodic and so every face should be paired
+    assert not mesh.bcon
+    assert len(mesh.con[0]) == nfaces*nper*n**3 // 2
@@ -0,0 +1,22 @@
+from pyfr.cache import TuningDB
+
+
+def test_tuning_db(monkeypatch, tmp_path):
+    monkeypatch.setenv('PYFR_TUNING_CACHE_DIR', str(tmp_path))
+
+    desc = {'dtype': 'float64', 'm': 8, 'k': 4, 'n': 64}
+    db, odb = TuningDB('dev'), TuningDB('other-dev')
+
+    # Results should persist between instances on the same device
+    assert db.get('mul', desc) is None
+    db.set('mul', desc, 'prov')
+    assert TuningDB('dev').get('mul', desc) == 'prov'
+    assert odb.get('mul', desc) is None
+
+    [rec] = TuningDB().records()
+    assert rec == {'device': 'dev', 'kind': 'mul', 'desc': desc,
+                   'result': 'prov'}
+
+    # Clearing should remove all of the results
+    assert TuningDB().clear() == 1
+    assert db.get('mul', desc) is None
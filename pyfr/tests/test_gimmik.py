@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from pyfr.backends import get_backend
+import pyfr.backends.openmp.gimmik as gimmik
+from pyfr.inifile import Inifile
+
+
+@pytest.mark.parametrize('nkerns', [1, 2])
+def test_gimmik_mul(monkeypatch, tmp_path, nkerns):
+    for c in ['omp', 'tuning']:
+        monkeypatch.setenv(f'PYFR_{c.upper()}_CACHE_DIR', str(tmp_path / c))
+
+    # Count the number of sparse kernels which are generated
+    cmatmul, nsparse = gimmik.CMatMul, []
+    monkeypatch.setattr(gimmik, 'CMatMul',
+                        lambda *a, **kw: nsparse.append(1) or
+                        cmatmul(*a, **kw))
+
+    rng = np.random.default_rng(4)
+    a_np = rng.uniform(size=(20, 27))*(rng.uniform(size=(20, 27)) < 0.3)
+    b_np = rng.uniform(size=(27, 100))
+
+    # The first pass benchmarks the kernels and the second reuses the result
+    for i in range(2):
+        cfg = Inifile(f'[backend-openmp]\ngimmik-nkerns = {nkerns}')
+        backend = get_backend('openmp', cfg)
+        prov = next(p for p in backend._providers
+                    if isinstance(p, gimmik.OpenMPGiMMiKKernels))
+
+        a = backend.const_matrix(a_np)
+        b = backend.matrix(b_np.shape, b_np, tags={'align'})
+        out = backend.matrix((20, 100), tags={'align'})
+        backend.commit()
+
+        tdesc = backend.mul_tuning_desc(a, b, out)
+        prov.mul(a, b, out, tdesc=tdesc).run()
+
+        assert np.allclose(out.get(), a_np @ b_np)
+        assert np.array_equal(b.get(), b_np)
+
+    # Only the permitted number of sparse kernels should be generated
+    assert len(nsparse) == 2*(nkerns - 1)
+
+
+def test_mul_tuning_desc(monkeypatch, tmp_path):
+    monkeypatch.setenv('PYFR_TUNING_CACHE_DIR', str(tmp_path))
+
+    backend = get_backend('openmp', Inifile())
+
+    a = backend.const_matrix(np.ones((20, 27)))
+    b = backend.matrix((27, 100), tags={'align'})
+    out = backend.matrix((20, 100), tags={'align'})
+    backend.commit()
+
+    # Count the number of times the descriptor is computed
+    tdesc, ndesc = backend.mul_tuning_desc, []
+    monkeypatch.setattr(backend, 'mul_tuning_desc',
+                        lambda *a, **kw: ndesc.append(1) or tdesc(*a, **kw))
+
+    # This should be done once and then shared between the providers
+    backend.kernel('mul', a, b, out)
+    assert len(ndesc) == 1
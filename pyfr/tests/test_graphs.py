@@ -0,0 +1,64 @@
+import gc
+import weakref
+
+import numpy as np
+
+from pyfr.backends import get_backend
+from pyfr.inifile import Inifile
+
+
+def test_group_dependents():
+    backend = get_backend('openmp', Inifile('[backend]\nprecision = double'))
+
+    shape = (3, 2, 100)
+    x = np.random.default_rng(1).uniform(size=shape)
+    a, b, c, d = [backend.matrix(shape, x if i == 0 else None,
+                                 tags={'align'}) for i in range(4)]
+    backend.commit()
+
+    # Kernels for b = 2*a, c = b, and d = a
+    kb, kc, kd = (backend.kernel('axnpby', *m) for m in [(b, a), (c, b),
+                                                           (d, a)])
+    kb.bind(0.0, 2.0)
+    kc.bind(0.0, 1.0)
+    kd.bind(0.0, 1.0)
+
+    # Group together the kernels for b and d
+    g = backend.graph()
+    g.add(kb)
+    g.add(kc, deps=[kb])
+    g.add(kd)
+    g.group([kb, kd])
+    g.commit()
+
+    # As c depends on a member of the group it must be computed after it
+    backend.run_graph(g, wait=True)
+
+    assert np.allclose(b.get(), 2*x)
+    assert np.allclose(c.get(), 2*x)
+    assert np.allclose(d.get(), x)
+
+
+def test_profiled_graph_lifetime():
+    cfg = Inifile('[backend]\nprecision = double\nprofile-kernels = true')
+    backend = get_backend('openmp', cfg)
+
+    a, b = [backend.matrix((3, 2, 100), tags={'align'}) for i in range(2)]
+    backend.commit()
+
+    k = backend.kernel('axnpby', a, b)
+    k.bind(1.0, 1.0)
+
+    g = backend.graph()
+    g.add(k)
+    g.commit()
+    backend.run_graph(g, wait=True)
+
+    ktimes, gref = backend.kernel_times(), weakref.ref(g)
+
+    # The backend should not keep the graph alive, but retain its times
+    del g
+    gc.collect()
+
+    assert gref() is None
+    assert ktimes and backend.kernel_times() == ktimes
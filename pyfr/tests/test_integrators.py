@@ -0,0 +1,203 @@
+import numpy as np
+import pytest
+
+from pyfr.backends import get_backend
+from pyfr.bench import box_mesh
+from pyfr.inifile import Inifile
+from pyfr.readers.native import NativeReader
+from pyfr.solvers import get_solver
+
+
+_cfg = '''
+[backend]
+precision = double
+
+[constants]
+gamma = 1.4
+
+[solver]
+system = euler
+order = 1
+
+[solver-time-integrator]
+formulation = std
+scheme = rk4
+controller = none
+tstart = 0.0
+tend = 1.0
+dt = 0.0001
+
+[solver-interfaces]
+riemann-solver = rusanov
+
+[solver-interfaces-quad]
+flux-pts = gauss-legendre
+
+[solver-elements-hex]
+soln-pts = gauss-legendre
+
+[soln-ics]
+rho = 1
+u = 1
+v = 0
+w = 0
+p = 1
+'''
+
+
+@pytest.mark.parametrize('changes_rhs,nrhs', [(False, 4), (True, 5)])
+def test_rhs_reuse(changes_rhs, nrhs):
+    cfg = Inifile(_cfg)
+    mesh = NativeReader(box_mesh('hex', 2)).mesh
+    solver = get_solver(get_backend('openmp', cfg), mesh, None, cfg)
+
+    # Count the number of right hand side evaluations
+    rhs, ncalls = solver.system.rhs, []
+    solver.system.rhs = lambda *args: ncalls.append(rhs(*args))
+
+    # Plugin which samples dt_soln and then modifies an input to the RHS
+    def plugin(intg):
+        intg.dt_soln
+
+        if changes_rhs:
+            intg.plugin_changed_rhs()
+
+    solver.plugins.append(plugin)
+    solver.advance_to(0.0001)
+
+    # Subsequent steps should only reuse the RHS if it is still valid
+    ncalls.clear()
+    solver.advance_to(0.0002)
+
+    assert len(ncalls) == nrhs
+
+
+def _run(tiopts, nsteps, reuse=True):
+    cfg = Inifile(_cfg)
+    cfg.set('solver', 'order', 2)
+    cfg.set('soln-ics', 'rho', '1 + 0.1*sin(2*pi*x)*sin(2*pi*y)')
+    cfg.set('soln-ics', 'v', '0.1*sin(2*pi*z)')
+    cfg.set('soln-filter', 'nsteps', 5)
+    cfg.set('soln-filter', 'alpha', 36.0)
+    cfg.set('soln-filter', 'order', 16)
+    cfg.set('soln-filter', 'cutoff', 1)
+
+    for k, v in tiopts.items():
+        cfg.set('solver-time-integrator', k, v)
+
+    mesh = NativeReader(box_mesh('hex', 2)).mesh
+    solver = get_solver(get_backend('openmp', cfg), mesh, None, cfg)
+
+    # Optionally prevent any right hand side from being reused
+    if not reuse:
+        step = solver.step
+
+        def nostep(*args):
+            solver._rhs_curr = None
+            idxs = step(*args)
+            solver._rhs_curr = None
+
+            return idxs
+
+        solver.step = nostep
+
+    # Plugin which perturbs the solution and so changes the RHS
+    def perturb(intg):
+        if intg.nacptsteps % 3 == 0:
+            for e in intg.system.ele_banks:
+                e[intg.soln_bank].set(1.001*e[intg.soln_bank].get())
+
+            intg.plugin_changed_rhs()
+
+    # Plugin which compares dt_soln against a freshly computed RHS
+    diffs, stepinfo = [], []
+
+    def check(intg):
+        stepinfo.extend(getattr(intg, 'stepinfo', []))
+
+        if intg.nacptsteps % 2 == 0:
+            dt_soln = intg.dt_soln
+
+            intg.plugin_changed_rhs()
+            diffs.extend(np.max(np.abs(a - b))
+                         for a, b in zip(dt_soln, intg.dt_soln))
+
+    solver.plugins.extend([perturb, check])
+
+    while solver.nacptsteps < nsteps:
+        solver.advance_to(solver.tcurr + solver._dt)
+
+    return solver, diffs, stepinfo
+
+
+_tiopts = [
+    {'scheme': 'rk4'},
+    {'scheme': 'rk45', 'controller': 'pi', 'dt': 0.1, 'atol': 1e-5,
+     'rtol': 1e-5, 'errest-overlap': 'true'},
+    {'formulation': 'dual', 'scheme': 'sdirk33', 'dt': 0.005,
+     'pseudo-scheme': 'tvd-rk3', 'pseudo-controller': 'none',
+     'pseudo-dt': 0.001, 'pseudo-niters-min': 3, 'pseudo-niters-max': 3,
+     'pseudo-resid-tol': 1e-12}
+]
+
+
+@pytest.mark.parametrize('tiopts', _tiopts)
+def test_rhs_reuse_soln(tiopts):
+    solver, diffs, stepinfo = _run(tiopts, 10)
+
+    # The reused dt_soln should be identical to a fresh evaluation
+    assert len(diffs) > 0 and max(diffs) == 0
+
+    # As should the solution when no RHS can be reused
+    rsolver, rdiffs, rstepinfo = _run(tiopts, 10, reuse=False)
+
+    assert stepinfo == rstepinfo
+    assert solver.tcurr == rsolver.tcurr
+    for a, b in zip(solver.soln, rsolver.soln):
+        assert np.array_equal(a, b)
+
+
+@pytest.mark.parametrize('changes_rhs,nrhs', [(False, 5), (True, 6)])
+def test_errest_overlap(changes_rhs, nrhs):
+    cfg = Inifile(_cfg)
+    cfg.set('solver-time-integrator', 'scheme', 'rk45')
+    cfg.set('solver-time-integrator', 'controller', 'pi')
+    cfg.set('solver-time-integrator', 'errest-overlap', 'true')
+    cfg.set('solver-time-integrator', 'atol', '1e-3')
+    cfg.set('solver-time-integrator', 'rtol', '1e-3')
+
+    mesh = NativeReader(box_mesh('hex', 2)).mesh
+    solver = get_solver(get_backend('openmp', cfg), mesh, None, cfg)
+
+    # Count the number of right hand side evaluations
+    rhs, ncalls = solver.system.rhs, []
+    solver.system.rhs = lambda *args: ncalls.append(rhs(*args))
+
+    # Plugin which may modify an input to the RHS
+    def plugin(intg):
+        if changes_rhs:
+            intg.plugin_changed_rhs()
+
+    solver.plugins.append(plugin)
+    solver.advance_to(1e-6)
+
+    # The speculative first stage should only be used if still valid
+    ncalls.clear()
+    solver.advance_to(2e-6)
+
+    assert solver.nacptsteps == 2 and not solver.nrjctsteps
+    assert len(ncalls) == nrhs
+
+
+def test_errest_overlap_soln():
+    tiopts = dict(_tiopts[1], **{'errest-overlap': 'false'})
+    rsolver, rdiffs, rstepinfo = _run(tiopts, 10)
+
+    # Speculative right hand sides must not change any steps
+    solver, diffs, stepinfo = _run(_tiopts[1], 10)
+
+    # The initial time step is too large and so must have been rejected
+    assert solver.nrjctsteps > 0
+    assert stepinfo == rstepinfo
+    for a, b in zip(solver.soln, rsolver.soln):
+        assert np.array_equal(a, b)
@@ -0,0 +1,77 @@
+from io import BytesIO
+
+import h5py
+import numpy as np
+
+from pyfr.readers.native import NativeReader
+
+
+def structured_hex_mesh(n):
+    # Codec; faces are z-, y-, x+, y+, x- and z+ respectively
+    bcs = ['zmin', 'ymin', 'xmax', 'ymax', 'xmin', 'zmax']
+    codec = ['eles/hex', *[f'eles/hex/{i}' for i in range(6)]]
+    codec += [f'bc/{b}' for b in bcs]
+
+    # Nodes
+    x = np.linspace(0, 1, n + 1)
+    nodes = np.zeros((n + 1)**3, dtype=[('location', float, 3),
+                                        ('valency', np.uint16)])
+    nodes['location'] = np.stack(np.meshgrid(x, x, x, indexing='ij'),
+                                 axis=-1)[..., ::-1].reshape(-1, 3)
+
+    # Element and node numbers
+    k, j, i = np.meshgrid(*[np.arange(n)]*3, indexing='ij')
+    k, j, i = k.ravel(), j.ravel(), i.ravel()
+    nix = lambda di, dj, dk: (i + di) + (n + 1)*((j + dj) + (n + 1)*(k + dk))
+
+    fdtype = [('cidx', np.int16), ('off', np.int64)]
+    eles = np.zeros(n**3, dtype=[('nodes', np.int64, 8), ('curved', bool),
+                                 ('faces', fdtype, 6)])
+    eles['nodes'] = np.column_stack([nix(di, dj, dk) for dk in (0, 1)
+                                     for dj in (0, 1) for di in (0, 1)])
+
+    # Face number, neighbour displacement, and boundary mask of each face
+    finfo = [(5, -n*n, k == 0), (3, -n, j == 0), (4, 1, i == n - 1),
+             (1, n, j == n - 1), (2, -1, i == 0), (0, n*n, k == n - 1)]
+    for f, (rf, disp, bmask) in enumerate(finfo):
+        eles['faces'][:, f]['cidx'] = np.where(bmask, 7 + f, 1 + rf)
+        eles['faces'][:, f]['off'] = np.where(bmask, -1,
+                                              np.arange(n**3) + disp)
+
+    buf = BytesIO()
+    with h5py.File(buf, 'w') as f:
+        f['codec'] = np.array(codec, dtype='S')
+        f['creator'] = np.array('pyfr-test', dtype='S')
+        f['mesh-uuid'] = np.array(f'structured-hex-{n}', dtype='S')
+        f['version'] = 1
+        f['nodes'] = nodes
+        f['eles/hex'] = eles
+        f['partitionings/1/eles'] = np.arange(n**3)
+        f['partitionings/1/eles'].attrs['regions'] = [[0, n**3]]
+
+    return buf
+
+
+def test_construct_con_structured_hex():
+    n = 4
+    reader = NativeReader(structured_hex_mesh(n))
+    con, bcon = reader.mesh.con, reader.mesh.bcon
+
+    # Each interior face is encountered first from its z-, y- or x+ side
+    k, j, i = np.unravel_index(np.arange(n**3), (n,)*3)
+    conl, conr = [], []
+    for f, rf, disp, mask in [(0, 5, -n*n, k > 0), (1, 3, -n, j > 0),
+                              (2, 4, 1, i < n - 1)]:
+        for e in mask.nonzero()[0].tolist():
+            conl.append(('hex', e, f))
+            conr.append(('hex', e + disp, rf))
+
+    assert con == (conl, conr)
+    assert not reader.mesh.con_p
+
+    # Check the boundaries
+    for f, (b, mask) in enumerate(zip(
+        ['zmin', 'ymin', 'xmax', 'ymax', 'xmin', 'zmax'],
+        [k == 0, j == 0, i == n - 1, j == n - 1, i == 0, k == n - 1]
+    )):
+        assert bcon[b] == [('hex', e, f) for e in mask.nonzero()[0].tolist()]
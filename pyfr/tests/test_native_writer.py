@@ -0,0 +1,42 @@
+from io import BytesIO
+
+import h5py
+import numpy as np
+import pytest
+
+from pyfr.writers.native import _compress_chunk
+
+
+@pytest.mark.parametrize('dtype', [np.float32, np.float64, np.int32])
+def test_compress_chunk_direct_write(dtype):
+    rng = np.random.default_rng(42)
+    arr = (1e3*rng.standard_normal((23, 5, 8))).astype(dtype)
+
+    # Write the array as chunks of ten rows, the last of which is partial
+    buf = BytesIO()
+    with h5py.File(buf, 'w') as f:
+        d = f.create_dataset('a', arr.shape, dtype, chunks=(10, 5, 8),
+                             shuffle=True, compression='gzip')
+        for i in range(0, len(arr), 10):
+            d.id.write_direct_chunk((i, 0, 0),
+                                    _compress_chunk(arr[i:i + 10], 10, 4))
+
+    with h5py.File(buf, 'r') as f:
+        assert np.array_equal(f['a'][()], arr)
+
+
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+def test_compress_chunk_rtol(dtype):
+    rng = np.random.default_rng(42)
+    arr = np.exp(10*rng.standard_normal(1000)).astype(dtype)
+    arr[::7] *= -1
+
+    buf = BytesIO()
+    with h5py.File(buf, 'w') as f:
+        d = f.create_dataset('a', arr.shape, dtype, chunks=arr.shape,
+                             shuffle=True, compression='gzip')
+        d.id.write_direct_chunk((0,), _compress_chunk(arr, len(arr), 4, 9))
+
+    # Keeping nine mantissa bits bounds the relative error by 2**-10
+    with h5py.File(buf, 'r') as f:
+        assert np.all(np.abs(f['a'][()] / arr - 1) <= 2**-10)
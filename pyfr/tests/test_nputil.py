@@ -0,0 +1,27 @@
+import numpy as np
+
+from pyfr.nputil import batched_fuzzysort, fuzzysort, hilbert_keys
+
+
+def test_batched_fuzzysort():
+    rng = np.random.default_rng(42)
+
+    # Points on a coarse lattice with jitter either side of the tolerance
+    pts = rng.integers(0, 3, size=(400, 3, 12))*1e-6
+    jitter = rng.choice([0, 1e-8, 4e-7], size=(400, 1, 1))
+    pts = pts + jitter*rng.random(pts.shape)
+    pts[:, 2] += 1e-5*np.arange(12)
+
+    idx = [1, 2, 3, 5, 7, 8, 10, 11]
+    ref = [fuzzysort(p.tolist(), idx) for p in pts]
+
+    assert np.array_equal(batched_fuzzysort(pts, idx), ref)
+
+
+def test_hilbert_keys():
+    # Each step along a Hilbert curve moves to an adjacent cell
+    for ndims, nbits in [(2, 4), (3, 3)]:
+        pts = np.indices((1 << nbits,)*ndims).reshape(ndims, -1).T
+        pts = pts[np.argsort(hilbert_keys(pts, nbits))]
+
+        assert np.all(np.abs(np.diff(pts, axis=0)).sum(axis=1) == 1)
@@ -0,0 +1,59 @@
+import h5py
+import numpy as np
+
+from pyfr.bench import box_mesh
+from pyfr.partitioners import (BasePartitioner, get_partitioner,
+                               write_partitioning)
+
+
+def test_merge_eles():
+    # A long chain, given in reverse, along with a separate pair
+    n = 5000
+    l = np.concatenate([np.arange(n - 1, 0, -1), [n + 7]])
+    r = np.concatenate([np.arange(n - 2, -1, -1), [n + 3]])
+
+    mfrom, mto = BasePartitioner._merge_eles(l, r)
+
+    assert np.array_equal(mfrom, [*range(1, n), n + 7])
+    assert np.array_equal(mto, [0]*(n - 1) + [n + 3])
+
+
+def test_hilbert_partitioner():
+    with h5py.File(box_mesh('pri', 4), 'r+') as mesh:
+        part = get_partitioner('hilbert', [1, 2, 1])
+        write_partitioning(mesh, 'h', part.partition(mesh))
+
+        eles = mesh['partitionings/h/eles'][()]
+        regions = mesh['partitionings/h/eles'].attrs['regions']
+        pcons = [p[()].reshape(-1, 2) for p in mesh['periodic'].values()]
+
+    # Every element should be assigned to a single partition
+    assert np.array_equal(np.sort(eles), np.arange(128))
+
+    # Partition sizes should follow the partition weights
+    vparts = np.empty(128, dtype=int)
+    for i, (s, e) in enumerate(regions):
+        vparts[eles[s:e]] = i
+
+        assert abs(e - s - 32*part.partwts[i]) <= 2
+
+    # Periodically connected elements must share a partition
+    for pcon in pcons:
+        assert np.all(vparts[pcon['off'][:, 0]] == vparts[pcon['off'][:, 1]])
+
+
+def test_reorder():
+    with h5py.File(box_mesh('hex', 4), 'r+') as mesh:
+        pinfo = [get_partitioner('hilbert', [1, 1], reorder=r).partition(mesh)
+                 for r in [False, True]]
+
+    (eles, regions), neighbours = pinfo[0]
+    (reles, rregions), rneighbours = pinfo[1]
+
+    # Reordering should only permute the elements within each partition
+    assert np.array_equal(regions, rregions)
+    assert np.array_equal(neighbours[0], rneighbours[0])
+    assert not np.array_equal(eles, reles)
+
+    for s, e in regions:
+        assert np.array_equal(np.sort(eles[s:e]), np.sort(reles[s:e]))
@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from pyfr.bench import box_mesh
+from pyfr.points import PointLocator
+from pyfr.readers.native import NativeReader
+
+
+@pytest.mark.parametrize('etype', ['hex', 'pri', 'tet'])
+def test_point_locator(etype):
+    mesh = NativeReader(box_mesh(etype, 3), construct_con=False).mesh
+    pts = np.random.default_rng(1).uniform(size=(500, 3))
+    pts[:3] = [[0, 0, 0], [1, 1, 1], [0.5, 0.5, 0.5]]
+
+    locator = PointLocator(mesh)
+    locs = locator.locate(pts)
+
+    assert np.all(locs['dist'] < 1e-10)
+
+    # Map the reference locations back to physical space
+    spts = mesh.spts[etype]
+    shape, basis = locator._get_shape_basis(etype, len(spts))
+    eidxs = np.searchsorted(mesh.eidxs[etype], locs['eidx'])
+
+    for p, t, ei in zip(pts, locs['tloc'], eidxs):
+        assert shape.valid_spt(t)
+        assert np.allclose(basis.nodal_basis_at(t[None]) @ spts[:, ei], p)
+
+    # Points outside of the domain can not be located
+    with pytest.raises(ValueError):
+        locator.locate([[1.5, 0.5, 0.5]])
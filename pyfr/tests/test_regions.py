@@ -0,0 +1,50 @@
+import itertools as it
+
+import h5py
+import numpy as np
+
+from pyfr.readers.native import NativeReader
+from pyfr.regions import STLRegion, parse_region_expr
+from pyfr.tests.test_native_reader import structured_hex_mesh
+
+
+def test_stl_region():
+    # Triangulate the surface of the cube [0.2, 0.7]^3
+    v = np.array(list(it.product([0.2, 0.7], repeat=3)))
+    quads = [[0, 1, 3, 2], [4, 6, 7, 5], [0, 4, 5, 1], [2, 3, 7, 6],
+             [0, 2, 6, 4], [1, 5, 7, 3]]
+    tris = [v[[a, b, c]] for a, b, c, d in quads]
+    tris += [v[[a, c, d]] for a, b, c, d in quads]
+
+    stl = np.zeros((len(tris), 4, 3), dtype=np.float32)
+    stl[:, 1:] = tris
+
+    with h5py.File('stl.h5', 'w', driver='core', backing_store=False) as f:
+        f['stl/cube'] = stl
+        f['stl/cube'].attrs['closed'] = True
+
+        rgn = STLRegion('cube', f)
+
+    pts = np.random.default_rng(1).uniform(size=(4, 500, 3))
+    inside = np.all((0.2 < pts) & (pts < 0.7), axis=-1)
+
+    assert np.array_equal(rgn.pts_in_region(pts), inside)
+
+
+def test_boundary_region():
+    n = 4
+    mesh = NativeReader(structured_hex_mesh(n)).mesh
+    rgn = parse_region_expr('zmin +3')
+
+    # Elements are numbered with x varying fastest
+    eles = rgn.interior_eles(mesh)
+    assert eles == {'hex': list(range(3*n**2))}
+
+    # Faces are z-, y-, x+, y+, x- and z+ respectively
+    sfaces = rgn.surface_faces(mesh)
+    assert sorted(sfaces) == [('hex', f) for f in range(6)]
+    assert len(sfaces['hex', 0]) == len(sfaces['hex', 5]) == n**2
+    assert all(len(sfaces['hex', f]) == 3*n for f in range(1, 5))
+
+    # Exclude the bottom boundary
+    assert ('hex', 0) not in rgn.surface_faces(mesh, exclbcs=['zmin'])
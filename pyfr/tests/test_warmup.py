@@ -0,0 +1,92 @@
+import tempfile
+
+import pytest
+from pytools.prefork import ExecError
+
+from pyfr.backends import get_backend
+from pyfr.backends.openmp.compiler import OpenMPCompiler
+from pyfr.bench import box_mesh
+from pyfr.ctypesutil import platform_libname
+from pyfr.inifile import Inifile
+from pyfr.readers.native import NativeReader
+from pyfr.solvers import get_solver
+
+
+_cfg = '''
+[backend]
+precision = double
+
+[constants]
+gamma = 1.4
+
+[solver]
+system = euler
+order = 1
+
+[solver-time-integrator]
+formulation = std
+scheme = rk45
+controller = pi
+atol = 1e-6
+rtol = 1e-6
+tstart = 0.0
+tend = 1.0
+dt = 0.0001
+
+[solver-interfaces]
+riemann-solver = rusanov
+
+[solver-interfaces-quad]
+flux-pts = gauss-legendre
+
+[solver-elements-hex]
+soln-pts = gauss-legendre
+
+[soln-ics]
+rho = 1
+u = 1
+v = 0
+w = 0
+p = 1
+'''
+
+
+def test_warmup_pi(monkeypatch, tmp_path):
+    for c in ['omp', 'tuning']:
+        monkeypatch.setenv(f'PYFR_{c.upper()}_CACHE_DIR', str(tmp_path / c))
+
+    cfg = Inifile(_cfg)
+    mesh = NativeReader(box_mesh('hex', 2)).mesh
+
+    # Warm up the cache; placeholder kernels must not upset the controller
+    backend = get_backend('openmp', cfg)
+    with backend.deferred_compilation():
+        get_solver(backend, mesh, None, cfg).warmup()
+
+    cached = set((tmp_path / 'omp').iterdir())
+    assert cached
+
+    # Running the simulation should not require any further compilation
+    solver = get_solver(get_backend('openmp', cfg), mesh, None, cfg)
+    solver.advance_to(0.001)
+
+    assert solver.nacptsteps
+    assert set((tmp_path / 'omp').iterdir()) == cached
+
+
+def test_deferred_compile_error(monkeypatch, tmp_path):
+    monkeypatch.setenv('PYFR_OMP_CACHE_DIR', str(tmp_path / 'omp'))
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path / 'scratch'))
+    (tmp_path / 'scratch').mkdir()
+
+    compiler = OpenMPCompiler(Inifile())
+
+    # Defer a kernel which compiles alongside one which does not
+    with pytest.raises(ExecError, match='pyfr_bad'):
+        with compiler.deferred(njobs=2):
+            compiler.build('void pyfr_good(void) {}')
+            compiler.build('void pyfr_bad(void) { pyfr_bad = 1; }')
+
+    # The good kernel should be cached and no scratch space left behind
+    assert len(list((tmp_path / 'omp').glob(platform_libname('*')))) == 2
+    assert not list((tmp_path / 'scratch').iterdir())
@@ -1,22 +1,40 @@
 import os
 import time
 import uuid
+import zlib
 
 import h5py
 import numpy as np
 
 from pyfr._version import __version__
 from pyfr.shapes import BaseShape
-from pyfr.mpiutil import Gatherer, get_comm_rank_root, mpi, scal_coll
+from pyfr.mpiutil import (Gatherer, get_comm_rank_root, get_start_end_csize,
+                          mpi, scal_coll)
 from pyfr.quadrules import get_quadrule
 from pyfr.util import file_path_gen, mv, subclass_where
 
 
 class NativeWriter:
-    def __init__(self, intg, basedir, basename, prefix, *, extn='.pyfrs'):
+    def __init__(self, intg, basedir, basename, prefix, *, extn='.pyfrs',
+                 cfgsect=None):
         comm, rank, root = get_comm_rank_root()
 
-        self.cfg = intg.cfg
+        self.cfg = cfg = intg.cfg
+
+        # Compression options
+        if cfgsect and cfg.get(cfgsect, 'compression', 'none') != 'none':
+            if cfg.get(cfgsect, 'compression') != 'deflate':
+                raise ValueError('Invalid compression method')
+
+            self.clevel = cfg.getint(cfgsect, 'compression-level', 4)
+
+            # Number of mantissa bits required to satisfy the error bound
+            if (rtol := cfg.getfloat(cfgsect, 'compression-rtol', 0)) > 0:
+                self.cmbits = max(int(np.ceil(-np.log2(rtol))) - 1, 0)
+            else:
+                self.cmbits = None
+        else:
+            self.clevel = None
 
         # Tally up how many elements of each type our partition has
         self._ecounts = {etype: len(intg.system.mesh.eidxs.get(etype, []))
@@ -50,7 +68,7 @@ class NativeWriter:
         comm, rank, root = get_comm_rank_root()
 
         # Prepare the element information
-        self._einfo = {}
+        self._einfo, self._cinfo = {}, {}
         for etype, ecount in self._ecounts.items():
             # See if any ranks want to write elements of this type
             eshape = comm.allgather(shapes.get(etype))
@@ -80,6 +98,24 @@ class NativeWriter:
                 ek = f'p{order}-{etype}'
                 self._einfo[ek] = (gatherer, subset, shape, etype, noff, upts)
 
+                if self.clevel is not None:
+                    self._prepare_chunks(ek)
+
+    def _prepare_chunks(self, ek):
+        comm, rank, root = get_comm_rank_root()
+        gatherer, subset, shape, *_ = self._einfo[ek]
+
+        # Each rank is responsible for compressing one chunk of rows
+        csize = get_start_end_csize(comm, shape[0])[2]
+
+        # Redistribute gathered data such that it is aligned to chunks
+        cgatherer = Gatherer(comm, np.arange(gatherer.off,
+                                             gatherer.off + gatherer.cnt))
+        parts = cgatherer(gatherer.rsrc)
+        idxs = cgatherer(gatherer.ridx) if subset else None
+
+        self._cinfo[ek] = (cgatherer, csize, parts, idxs)
+
     def probe(self):
         if self._awriter is not None and self._awriter.test():
             self._awriter = None
@@ -119,15 +155,23 @@ class NativeWriter:
 
             gdata[ek] = gatherer(dset)
 
+            # Align the data with the chunks of the output dataset
+            if ek in self._cinfo:
+                gdata[ek] = self._cinfo[ek][0](gdata[ek])
+
         # Delegate to _write to do the actual outputting
-        f, reqs = self._write(self.tname, gdata, metadata, async_=async_)
+        if self.clevel is not None:
+            f, reqs = self._write_compressed(self.tname, gdata, metadata)
+        else:
+            f, reqs = self._write(self.tname, gdata, metadata, async_=async_)
 
         # Determine the final output path
         path = self.fgen.send(tcurr)
 
         def oncomplete():
             # Close the file
-            f.Close()
+            if f is not None:
+                f.Close()
 
             # Have the root rank move it into place
             if rank == root:
@@ -207,6 +251,90 @@ class NativeWriter:
 
         return f, reqs
 
+    def _write_compressed(self, path, data, metadata):
+        comm, rank, root = get_comm_rank_root()
+
+        # Compress our chunk of each dataset in parallel
+        dinfo, chunks = {}, []
+        for ek, (gatherer, subset, shape, *_) in self._einfo.items():
+            cgatherer, csize, parts, idxs = self._cinfo[ek]
+
+            dsets = [(ek, data[ek], shape), (f'{ek}-parts', parts, shape[:1])]
+            if subset:
+                dsets.append((f'{ek}-idxs', idxs, shape[:1]))
+
+            for k, v, vshape in dsets:
+                dinfo[k] = (vshape, v.dtype, (csize, *vshape[1:]))
+
+                if cgatherer.cnt:
+                    buf = _compress_chunk(v, csize, self.clevel, self.cmbits)
+                    chunks.append((k, cgatherer.off, buf))
+
+        # Have the root rank write out the compressed chunks
+        if rank == root:
+            with h5py.File(path, 'w') as f:
+                # Write the metadata
+                for k, v in metadata.items():
+                    f[k] = v
+
+                # Create the datasets
+                g = f.create_group(self.prefix)
+                for k, (shape, dtype, cshape) in dinfo.items():
+                    g.create_dataset(k, shape, dtype, chunks=cshape,
+                                     shuffle=True, compression='gzip',
+                                     compression_opts=self.clevel)
+
+                # Add each elements nodal points as an attribute
+                for ek, (*_, upts) in self._einfo.items():
+                    g[ek].attrs['pts'] = upts
+
+                # Receive and write the chunks from each rank in turn
+                for i in range(comm.size):
+                    if i != root:
+                        chunks = comm.recv(source=i)
+
+                    for k, off, buf in chunks:
+                        coff = (off,) + (0,)*(g[k].ndim - 1)
+                        g[k].id.write_direct_chunk(coff, buf)
+        else:
+            comm.send(chunks, dest=root)
+
+        return None, []
+
+
+def _round_mantissa(arr, nbits):
+    nmant = np.finfo(arr.dtype).nmant
+    if nbits >= nmant:
+        return arr
+
+    # Round to nearest, keeping only the leading nbits of the mantissa
+    uint = np.dtype(f'u{arr.itemsize}').type
+    drop = nmant - nbits
+    bits = arr.view(uint) + uint(1 << (drop - 1))
+    bits &= ~uint((1 << drop) - 1)
+
+    # Leave any non-finite values untouched
+    return np.where(np.isfinite(arr), bits.view(arr.dtype), arr)
+
+
+def _compress_chunk(arr, csize, level, mbits=None):
+    # Pad the data out to a full chunk
+    buf = np.zeros((csize, *arr.shape[1:]), dtype=arr.dtype)
+    buf[:len(arr)] = arr
+
+    # HDF5 limits the size of uncompressed chunks to 4 GiB
+    if buf.nbytes >= 2**32:
+        raise ValueError('Compressed output chunks exceed 4 GiB; use more '
+                         'ranks or disable compression')
+
+    # If requested, discard low-order mantissa bits
+    if mbits is not None and buf.dtype.kind == 'f':
+        buf = _round_mantissa(buf, mbits)
+
+    # Apply the HDF5 shuffle and deflate filters
+    buf = buf.reshape(-1).view(np.uint8).reshape(-1, buf.itemsize).T
+    return zlib.compress(buf.tobytes(), level)
+
 
 class _AsyncCompleter:
     def __init__(self, reqs, timeout, callback):